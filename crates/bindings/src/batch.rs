@@ -0,0 +1,131 @@
+//! Batch execution binding.
+//!
+//! Runs many independent bare-metal simulations entirely in Rust with the GIL
+//! released, spreading them across a pool of OS threads. Sweep drivers avoid
+//! per-run Python overhead and can use every core from a single process.
+
+use crate::conversion::py_dict_to_config;
+use crate::cpu::{build_simulator, run_to_cycle};
+use crate::stats::PyStats;
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use rvsim_core::config::Config;
+use rvsim_core::stats::SimStats;
+use std::collections::HashMap;
+use std::sync::Arc;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::time::Instant;
+
+/// One fully-parsed simulation request, owned so it can cross threads.
+///
+/// Config and ELF are shared: a sweep passes the same payload and binary
+/// objects to many jobs, and each distinct one is parsed/copied only once.
+#[derive(Debug)]
+struct Job {
+    config: Arc<Config>,
+    elf: Arc<[u8]>,
+    disk: Option<String>,
+}
+
+/// Exit code, final stats and wall time of a finished job, or an error message.
+type Outcome = Result<(Option<u64>, SimStats, f64), String>;
+
+/// Run one job to exit (or `limit` cycles) without touching Python.
+fn run_job(job: &Job, limit: Option<u64>) -> Outcome {
+    let t0 = Instant::now();
+    let mut sim = build_simulator(&job.config, Some(&job.elf), None, None, job.disk.clone())?;
+    let exit = run_to_cycle(&mut sim, limit.unwrap_or(u64::MAX))?;
+    Ok((exit, sim.cpu.stats.clone(), t0.elapsed().as_secs_f64()))
+}
+
+/// Run all jobs on `workers` threads, preserving input order in the output.
+fn run_parallel(jobs: &[Job], limit: Option<u64>, workers: usize) -> Vec<Outcome> {
+    let next = AtomicUsize::new(0);
+    let finished: Vec<(usize, Outcome)> = std::thread::scope(|s| {
+        let handles: Vec<_> = (0..workers)
+            .map(|_| {
+                s.spawn(|| {
+                    let mut done = Vec::new();
+                    loop {
+                        let i = next.fetch_add(1, Ordering::Relaxed);
+                        let Some(job) = jobs.get(i) else { break };
+                        done.push((i, run_job(job, limit)));
+                    }
+                    done
+                })
+            })
+            .collect();
+        handles.into_iter().flat_map(|h| h.join().unwrap_or_default()).collect()
+    });
+
+    let mut out: Vec<Outcome> =
+        (0..jobs.len()).map(|_| Err("simulation thread panicked".to_string())).collect();
+    for (i, outcome) in finished {
+        out[i] = outcome;
+    }
+    out
+}
+
+/// Run a batch of bare-metal simulations in parallel with the GIL released.
+///
+/// Each job is a ``(config, elf_data, disk_path)`` tuple, where ``config`` is
+/// anything ``Cpu()`` accepts (dict or pre-encoded JSON bytes). Jobs that share
+/// the same ``config`` or ``elf_data`` object parse/copy it once. Jobs are
+/// independent; UART/HTIF output from concurrent jobs may interleave.
+/// Python signal handlers (e.g. Ctrl-C) are not serviced until the batch ends.
+///
+/// Args:
+///     jobs: List of ``(config, elf_data, disk_path)`` tuples.
+///     limit: Maximum cycles per job. ``None`` runs each job until it exits.
+///     threads: Worker threads. ``None`` uses the available parallelism.
+///
+/// Returns:
+///     One ``(exit_code, stats, wall_time_sec, error)`` tuple per job, in input
+///     order. ``exit_code`` is ``None`` if the limit was hit; on failure
+///     ``stats`` is ``None`` and ``error`` holds the message.
+#[pyfunction]
+#[pyo3(signature = (jobs, *, limit=None, threads=None))]
+#[allow(clippy::type_complexity)]
+pub fn run_batch(
+    py: Python<'_>,
+    jobs: Vec<(Bound<'_, PyAny>, Bound<'_, PyBytes>, Option<String>)>,
+    limit: Option<u64>,
+    threads: Option<usize>,
+) -> PyResult<Vec<(Option<u64>, Option<PyObject>, f64, Option<String>)>> {
+    // Keyed by object identity; every key stays alive in `jobs` for the call.
+    let mut configs: HashMap<usize, Arc<Config>> = HashMap::new();
+    let mut elfs: HashMap<usize, Arc<[u8]>> = HashMap::new();
+    let jobs = jobs
+        .into_iter()
+        .map(|(config, elf, disk)| {
+            let config = match configs.get(&(config.as_ptr() as usize)) {
+                Some(parsed) => Arc::clone(parsed),
+                None => {
+                    let parsed = Arc::new(py_dict_to_config(py, &config)?);
+                    let _ = configs.insert(config.as_ptr() as usize, Arc::clone(&parsed));
+                    parsed
+                }
+            };
+            let elf = Arc::clone(
+                elfs.entry(elf.as_ptr() as usize).or_insert_with(|| Arc::from(elf.as_bytes())),
+            );
+            Ok(Job { config, elf, disk })
+        })
+        .collect::<PyResult<Vec<_>>>()?;
+
+    let workers = threads
+        .unwrap_or_else(|| std::thread::available_parallelism().map_or(1, std::num::NonZeroUsize::get))
+        .clamp(1, jobs.len().max(1));
+    let outcomes = py.allow_threads(|| run_parallel(&jobs, limit, workers));
+
+    outcomes
+        .into_iter()
+        .map(|outcome| match outcome {
+            Ok((exit, stats, wall)) => {
+                let d = PyStats::from(&stats).to_dict(py)?;
+                Ok((exit, Some(d.into_any()), wall, None))
+            }
+            Err(msg) => Ok((None, None, 0.0, Some(msg))),
+        })
+        .collect()
+}
@@ -1,34 +1,59 @@
 //! Python↔Rust configuration conversion.
 //!
-//! Converts Python dicts (e.g., from `SimConfig.to_dict()`) into the core `Config` type
+//! Converts Python configs (e.g., from `Config.to_dict()`) into the core `Config` type
 //! via JSON serialization, so the same schema is used from both Python and CLI.
 
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyString};
 use rvsim_core::config::Config;
 use serde_json;
+use std::cell::RefCell;
 
-/// Converts a Python dict to a simulator `Config`.
+thread_local! {
+    /// Last JSON payload parsed and its result. Sweeps construct many CPUs from the
+    /// same encoded config, so a byte compare lets repeat builds skip serde entirely.
+    static LAST_PARSED: RefCell<Option<(Vec<u8>, Config)>> = const { RefCell::new(None) };
+}
+
+/// Deserializes a JSON config payload, reusing the previous result when the bytes match.
+fn parse_json_config(buf: &[u8]) -> Result<Config, serde_json::Error> {
+    LAST_PARSED.with(|last| {
+        if let Some((_, config)) = last.borrow().as_ref().filter(|(prev, _)| prev.as_slice() == buf) {
+            return Ok(config.clone());
+        }
+        let config: Config = serde_json::from_slice(buf)?;
+        *last.borrow_mut() = Some((buf.to_vec(), config.clone()));
+        Ok(config)
+    })
+}
+
+/// Converts a Python config payload to a simulator `Config`.
 ///
-/// The dict is serialized to JSON and then deserialized into `Config`. Keys must match
-/// the Rust config structure (e.g., `general`, `system`, `memory`, `cache`, `pipeline`).
+/// Accepts either pre-encoded JSON (`bytes` or `str`, e.g. from
+/// `rvsim.config._config_to_json()`), which is handed straight to serde with
+/// no Python-side traversal, or a plain dict, which is first serialized with
+/// `json.dumps`. Keys must match the Rust config structure (e.g., `general`,
+/// `system`, `memory`, `cache`, `pipeline`).
 ///
 /// # Arguments
 ///
 /// * `py` - Python interpreter handle.
-/// * `dict` - A Python dict (e.g., from `rvsim.config.SimConfig.to_dict()`).
+/// * `dict` - JSON `bytes`/`str`, or a Python dict (e.g., from `rvsim.Config.to_dict()`).
 ///
 /// # Returns
 ///
-/// The deserialized `Config`, or a `PyErr` if the dict is invalid.
+/// The deserialized `Config`, or a `PyErr` if the payload is invalid.
 pub fn py_dict_to_config(py: Python<'_>, dict: &Bound<'_, PyAny>) -> PyResult<Config> {
-    let json = py.import("json")?;
-    let dumps = json.getattr("dumps")?;
-    let json_str_obj = dumps.call1((dict,))?;
-    let json_str: String = json_str_obj.extract()?;
-
-    let config: Config = serde_json::from_str(&json_str).map_err(|e| {
-        PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid config: {e}"))
-    })?;
+    let parsed = if let Ok(bytes) = dict.downcast::<PyBytes>() {
+        parse_json_config(bytes.as_bytes())
+    } else if let Ok(s) = dict.downcast::<PyString>() {
+        parse_json_config(s.to_str()?.as_bytes())
+    } else {
+        let json = py.import("json")?;
+        let json_str: String = json.getattr("dumps")?.call1((dict,))?.extract()?;
+        serde_json::from_str(&json_str)
+    };
 
-    Ok(config)
+    parsed.map_err(|e: serde_json::Error| PyValueError::new_err(format!("Invalid config: {e}")))
 }
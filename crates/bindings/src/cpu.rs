@@ -9,9 +9,11 @@ use crate::instruction::PyInstruction;
 use crate::snapshot::PyPipelineSnapshot;
 use crate::stats::PyStats;
 use crate::views::{Csrs, Memory, Registers, VirtualMemory};
-use pyo3::exceptions::PyRuntimeError;
+use pyo3::exceptions::{PyKeyError, PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyDict, PyList};
 use rvsim_core::Simulator;
+use rvsim_core::config::Config;
 use rvsim_core::core::arch::mode::PrivilegeMode;
 use rvsim_core::sim::loader;
 use std::io::Write;
@@ -19,18 +21,115 @@ use std::io::{BufReader, BufWriter, Read};
 
 // ── Formatting helper ────────────────────────────────────────────────────────
 
-fn fmt_commas(n: u64) -> String {
-    let s = n.to_string();
-    let bytes = s.as_bytes();
-    let len = bytes.len();
-    let mut result = String::with_capacity(len + len / 3);
-    for (i, &b) in bytes.iter().enumerate() {
-        if i > 0 && (len - i).is_multiple_of(3) {
-            result.push(',');
+/// Append `n` with thousands separators, right-aligned to `width` columns.
+///
+/// Formats on the stack so the progress line allocates nothing per tick.
+fn push_commas(out: &mut String, n: u64, width: usize) {
+    // u64::MAX has 20 digits, i.e. 26 characters with separators.
+    let mut buf = [b' '; 26];
+    let mut pos = buf.len();
+    let mut rest = n;
+    let mut digits = 0usize;
+    loop {
+        if digits > 0 && digits.is_multiple_of(3) {
+            pos -= 1;
+            buf[pos] = b',';
+        }
+        pos -= 1;
+        buf[pos] = b'0' + (rest % 10) as u8;
+        digits += 1;
+        rest /= 10;
+        if rest == 0 {
+            break;
+        }
+    }
+    let text = &buf[pos..];
+    for _ in text.len()..width {
+        out.push(' ');
+    }
+    out.extend(text.iter().map(|&b| char::from(b)));
+}
+
+// ── Run loop ─────────────────────────────────────────────────────────────────
+
+/// Cycles simulated between Python signal checks in `Cpu.run()`.
+const SIGNAL_CHECK_INTERVAL: u64 = 10_000;
+
+/// Tick until the cycle counter reaches `stop_at` or the program exits.
+///
+/// Pure Rust with no Python access, so callers can run it with the GIL
+/// released.
+///
+/// Returns:
+///     The exit code if the program exited, or `None` if `stop_at` was reached.
+pub(crate) fn run_to_cycle(sim: &mut Simulator, stop_at: u64) -> Result<Option<u64>, String> {
+    while sim.cpu.stats.cycles < stop_at {
+        sim.tick().map_err(|e| e.to_string())?;
+        if let Some(code) = sim.take_exit() {
+            return Ok(Some(code));
         }
-        result.push(b as char);
     }
-    result
+    Ok(None)
+}
+
+// ── Simulator construction ───────────────────────────────────────────────────
+
+/// Build a fully-configured simulator from a parsed config and optional binary/kernel.
+///
+/// Shared by `Cpu()` and `run_batch()`. Performs ELF loading, HTIF registration,
+/// and kernel setup without touching the Python interpreter, so it can run with
+/// the GIL released.
+pub(crate) fn build_simulator(
+    config: &Config,
+    elf_data: Option<&[u8]>,
+    kernel_path: Option<String>,
+    dtb_path: Option<String>,
+    disk_path: Option<String>,
+) -> Result<Simulator, String> {
+    let disk = disk_path.unwrap_or_default();
+    let mut system = rvsim_core::soc::System::new(config, &disk);
+
+    // ELF loading (bare-metal mode)
+    let mut elf_entry: Option<u64> = None;
+    let mut tohost_addr: Option<u64> = None;
+    if let Some(data) = elf_data {
+        if let Some(result) = loader::try_load_elf(data, &mut system.bus) {
+            elf_entry = Some(result.entry);
+            if let Some(tohost) = result.tohost_addr {
+                system.add_htif(tohost);
+                tohost_addr = Some(tohost);
+            }
+        } else {
+            return Err("Not a valid ELF file. Only ELF binaries are supported.".to_string());
+        }
+    }
+
+    let mut sim = Simulator::new(system, config);
+
+    // Apply ELF entry point
+    if let Some(entry) = elf_entry {
+        sim.cpu.pc = entry;
+    }
+
+    // HTIF setup (bare-metal with tohost symbol)
+    if let Some(tohost) = tohost_addr {
+        sim.cpu.direct_mode = false;
+        sim.cpu.privilege = PrivilegeMode::Machine;
+        sim.cpu.htif_range = Some((tohost, tohost + 16));
+    }
+
+    // Kernel loading
+    if let Some(kpath) = kernel_path {
+        loader::setup_kernel_load(&mut sim.cpu, config, "", dtb_path, Some(kpath))
+            .map_err(|e| e.to_string())?;
+        sim.cpu.direct_mode = false;
+    }
+
+    // Sync architectural registers (a0/a1/a2 from loader, sp from direct_mode)
+    // into the O3 PRF. Must happen after all register initialization.
+    sim.sync_arch_regs();
+
+    Ok(sim)
 }
 
 // ── Cpu ──────────────────────────────────────────────────────────────────────
@@ -52,6 +151,45 @@ impl PyCpu {
         }
     }
 
+    /// Read a CSR by address straight from its field, without going through
+    /// the name table.
+    pub(crate) const fn read_csr_by_addr(&self, addr: u64) -> Option<u64> {
+        let c = &self.inner.cpu.csrs;
+        match addr {
+            // Supervisor
+            0x100 => Some(c.sstatus),
+            0x104 => Some(c.sie),
+            0x105 => Some(c.stvec),
+            0x140 => Some(c.sscratch),
+            0x141 => Some(c.sepc),
+            0x142 => Some(c.scause),
+            0x143 => Some(c.stval),
+            0x144 => Some(c.sip),
+            0x180 => Some(c.satp),
+            // Machine
+            0x300 => Some(c.mstatus),
+            0x301 => Some(c.misa),
+            0x302 => Some(c.medeleg),
+            0x303 => Some(c.mideleg),
+            0x304 => Some(c.mie),
+            0x305 => Some(c.mtvec),
+            0x340 => Some(c.mscratch),
+            0x341 => Some(c.mepc),
+            0x342 => Some(c.mcause),
+            0x343 => Some(c.mtval),
+            0x344 => Some(c.mip),
+            // Counters
+            0xC00 => Some(c.cycle),
+            0xC01 => Some(c.time),
+            0xC02 => Some(c.instret),
+            0xB00 => Some(c.mcycle),
+            0xB02 => Some(c.minstret),
+            // Sstc
+            0x14D => Some(c.stimecmp),
+            _ => None,
+        }
+    }
+
     pub(crate) fn read_csr_by_name(&self, name: &str) -> Option<u64> {
         let c = &self.inner.cpu.csrs;
         match name {
@@ -85,29 +223,34 @@ impl PyCpu {
         }
     }
 
-    /// Core run loop. Runs for up to `limit` cycles (or forever if `None`),
-    /// checking Python signals every 10 000 cycles.
+    /// Core run loop. Runs for up to `limit` cycles (or forever if `None`).
+    ///
+    /// Simulation runs with the GIL released in slices of
+    /// `SIGNAL_CHECK_INTERVAL` cycles; between slices the GIL is reacquired to
+    /// service Python signals (e.g. Ctrl-C). The UART flushes stdout after every
+    /// byte it writes, so the loop itself only flushes once when it returns.
     fn run_inner(&mut self, py: Python<'_>, limit: Option<u64>) -> PyResult<Option<u64>> {
-        let start = self.inner.cpu.stats.cycles;
+        let result = self.run_slices(py, limit);
+        let _ = std::io::stdout().flush();
+        result
+    }
+
+    /// `run_inner` without the final stdout flush, for callers that run many
+    /// back-to-back chunks and flush once themselves.
+    fn run_slices(&mut self, py: Python<'_>, limit: Option<u64>) -> PyResult<Option<u64>> {
+        let end = limit.map(|max| self.inner.cpu.stats.cycles.saturating_add(max));
         loop {
-            if let Some(max) = limit
-                && self.inner.cpu.stats.cycles.saturating_sub(start) >= max
-            {
-                let _ = std::io::stdout().flush();
-                return Ok(None);
+            let now = self.inner.cpu.stats.cycles;
+            if end.is_some_and(|e| now >= e) {
+                break Ok(None);
             }
-            if self.inner.cpu.stats.cycles.is_multiple_of(10_000) {
-                py.check_signals()?;
-                let _ = std::io::stdout().flush();
-            }
-            match self.inner.tick() {
-                Ok(()) => {
-                    if let Some(code) = self.inner.take_exit() {
-                        let _ = std::io::stdout().flush();
-                        return Ok(Some(code));
-                    }
-                }
-                Err(e) => return Err(PyRuntimeError::new_err(e.to_string())),
+            let slice_end = now.saturating_add(SIGNAL_CHECK_INTERVAL);
+            let stop_at = end.map_or(slice_end, |e| e.min(slice_end));
+            let sim = &mut self.inner;
+            match py.allow_threads(|| run_to_cycle(sim, stop_at)) {
+                Ok(Some(code)) => break Ok(Some(code)),
+                Ok(None) => py.check_signals()?,
+                Err(e) => break Err(PyRuntimeError::new_err(e)),
             }
         }
     }
@@ -117,20 +260,31 @@ impl PyCpu {
         self.run_inner(py, Some(cycles))
     }
 
-    /// Run with stderr progress reporting every `progress` cycles.
+    /// Run with progress reporting every `progress` cycles.
+    ///
+    /// Reports go to stderr, or to `on_progress(cycles, instructions_retired)`
+    /// when a callback is given. The loop stays in Rust; Python is entered only once per interval.
     fn run_with_progress(
         &mut self,
         py: Python<'_>,
         limit: Option<u64>,
         progress: u64,
+        on_progress: Option<&Bound<'_, PyAny>>,
     ) -> PyResult<Option<u64>> {
+        // Stderr is unbuffered, so each progress write reaches the terminal
+        // immediately; no flush calls are needed.
+        let clear_line = || {
+            if on_progress.is_none() {
+                eprint!("\r\x1b[2K");
+            }
+        };
         let mut cycles_run = 0u64;
+        let mut line = String::with_capacity(64);
         loop {
             let chunk = if let Some(max) = limit {
                 let remaining = max.saturating_sub(cycles_run);
                 if remaining == 0 {
-                    eprint!("\r\x1b[2K");
-                    let _ = std::io::stderr().flush();
+                    clear_line();
                     return Ok(None);
                 }
                 progress.min(remaining)
@@ -138,22 +292,29 @@ impl PyCpu {
                 progress
             };
 
-            let exit = self.run_for_cycles(py, chunk)?;
+            let exit = self.run_slices(py, Some(chunk))?;
             cycles_run += chunk;
 
             if let Some(code) = exit {
-                eprint!("\r\x1b[2K");
-                let _ = std::io::stderr().flush();
+                clear_line();
                 return Ok(Some(code));
             }
 
             let s = &self.inner.cpu.stats;
-            eprint!(
-                "\r\x1b[36m[rvsim]\x1b[0m  {:>14} cycles  {:>14} insns",
-                fmt_commas(s.cycles),
-                fmt_commas(s.instructions_retired),
-            );
-            let _ = std::io::stderr().flush();
+            if let Some(cb) = on_progress {
+                let _ = cb.call1((s.cycles, s.instructions_retired))?;
+            } else {
+                // Build the whole line in a reused buffer and emit it with one
+                // write; stderr is unbuffered, so `eprint!` would issue a write
+                // per formatted piece.
+                line.clear();
+                line.push_str("\r\x1b[36m[rvsim]\x1b[0m  ");
+                push_commas(&mut line, s.cycles, 14);
+                line.push_str(" cycles  ");
+                push_commas(&mut line, s.instructions_retired, 14);
+                line.push_str(" insns");
+                let _ = std::io::stderr().lock().write_all(line.as_bytes());
+            }
         }
     }
 }
@@ -162,72 +323,48 @@ impl PyCpu {
 
 #[pymethods]
 impl PyCpu {
-    /// Build a fully-configured CPU from a config dict and optional binary/kernel.
+    /// Build a fully-configured CPU from a config and optional binary/kernel.
     ///
     /// This is the sole entry point for creating a Cpu. All system setup (ELF loading,
     /// HTIF registration, kernel loading) happens inside Rust — nothing leaks to Python.
     ///
     /// Args:
-    ///     `config_dict`: The nested config dict (from ``Config.to_dict()``).
+    ///     `config_dict`: The nested config dict (from ``Config.to_dict()``), or the
+    ///         same structure pre-encoded as JSON ``bytes``/``str``.
     ///     `elf_data`: Raw bytes of an ELF binary (bare-metal mode). Optional.
+    ///         ``bytes`` is read in place; ``bytearray``, ``memoryview`` and
+    ///         other buffers are copied.
+    ///     `elf_path`: Path to an ELF binary, read directly by Rust without an
+    ///         intermediate Python ``bytes``. Mutually exclusive with `elf_data`.
     ///     `kernel_path`: Path to a kernel image (kernel mode). Optional.
     ///     `dtb_path`: Path to a DTB file (kernel mode). Optional.
     ///     `disk_path`: Path to a disk image. Optional.
     #[new]
-    #[pyo3(signature = (config_dict, *, elf_data=None, kernel_path=None, dtb_path=None, disk_path=None))]
+    #[pyo3(signature = (config_dict, *, elf_data=None, elf_path=None, kernel_path=None, dtb_path=None, disk_path=None))]
     fn new(
         py: Python<'_>,
         config_dict: &Bound<'_, PyAny>,
-        elf_data: Option<Vec<u8>>,
+        elf_data: Option<&Bound<'_, PyAny>>,
+        elf_path: Option<String>,
         kernel_path: Option<String>,
         dtb_path: Option<String>,
         disk_path: Option<String>,
     ) -> PyResult<Self> {
         let config = py_dict_to_config(py, config_dict)?;
-        let disk = disk_path.unwrap_or_default();
-        let mut system = rvsim_core::soc::System::new(&config, &disk);
-
-        // ELF loading (bare-metal mode)
-        let mut elf_entry: Option<u64> = None;
-        let mut tohost_addr: Option<u64> = None;
-        if let Some(data) = elf_data {
-            if let Some(result) = loader::try_load_elf(&data, &mut system.bus) {
-                elf_entry = Some(result.entry);
-                if let Some(tohost) = result.tohost_addr {
-                    system.add_htif(tohost);
-                    tohost_addr = Some(tohost);
-                }
-            } else {
-                return Err(PyRuntimeError::new_err(
-                    "Not a valid ELF file. Only ELF binaries are supported.",
-                ));
+        let elf_bytes = elf_data.and_then(|d| d.downcast::<PyBytes>().ok());
+        let elf_owned = match (elf_data, elf_path) {
+            (Some(_), Some(_)) => {
+                return Err(PyValueError::new_err("pass elf_data or elf_path, not both"));
             }
-        }
-
-        let mut sim = Simulator::new(system, &config);
-
-        // Apply ELF entry point
-        if let Some(entry) = elf_entry {
-            sim.cpu.pc = entry;
-        }
-
-        // HTIF setup (bare-metal with tohost symbol)
-        if let Some(tohost) = tohost_addr {
-            sim.cpu.direct_mode = false;
-            sim.cpu.privilege = PrivilegeMode::Machine;
-            sim.cpu.htif_range = Some((tohost, tohost + 16));
-        }
-
-        // Kernel loading
-        if let Some(kpath) = kernel_path {
-            loader::setup_kernel_load(&mut sim.cpu, &config, "", dtb_path, Some(kpath))
-                .map_err(|e| PyRuntimeError::new_err(e.to_string()))?;
-            sim.cpu.direct_mode = false;
-        }
-
-        // Sync architectural registers (a0/a1/a2 from loader, sp from direct_mode)
-        // into the O3 PRF. Must happen after all register initialization.
-        sim.sync_arch_regs();
+            (_, Some(path)) => Some(std::fs::read(path)?),
+            // bytearray, memoryview and other buffers are copied out once.
+            (Some(d), None) if elf_bytes.is_none() => Some(d.extract::<Vec<u8>>()?),
+            _ => None,
+        };
+        // A bytes object's buffer is borrowed directly; no intermediate Vec copy.
+        let elf = elf_owned.as_deref().or_else(|| elf_bytes.map(|b| b.as_bytes()));
+        let sim = build_simulator(&config, elf, kernel_path, dtb_path, disk_path)
+            .map_err(PyRuntimeError::new_err)?;
 
         Ok(Self { inner: sim })
     }
@@ -262,13 +399,58 @@ impl PyCpu {
         self.inner.cpu.trace = value;
     }
 
+    /// Cycles simulated so far (read-only).
+    ///
+    /// Same value as ``stats["cycles"]`` without building the full stats dict.
+    #[getter]
+    const fn cycles(&self) -> u64 {
+        self.inner.cpu.stats.cycles
+    }
+
+    /// Instructions retired so far (read-only).
+    ///
+    /// Same value as ``stats["instructions_retired"]`` without building the
+    /// full stats dict; pairs with ``cycles`` for cheap progress polling.
+    #[getter]
+    const fn instructions_retired(&self) -> u64 {
+        self.inner.cpu.stats.instructions_retired
+    }
+
     /// Performance statistics as a dict (read-only).
     #[getter]
     fn stats(&self, py: Python<'_>) -> PyResult<PyObject> {
-        let s = PyStats::from(self.inner.cpu.stats.clone());
+        let s = PyStats::from(&self.inner.cpu.stats);
         Ok(s.to_dict(py)?.into_bound(py).into_any().unbind())
     }
 
+    /// A single statistic by name, same value as ``stats[name]``.
+    ///
+    /// Reads the one counter (or derived ratio) directly instead of building
+    /// the full stats dict, so polling a few stats stays cheap. Raises
+    /// ``KeyError`` if *name* is not a stats key.
+    fn stat(&self, py: Python<'_>, name: &str) -> PyResult<PyObject> {
+        PyStats::from(&self.inner.cpu.stats)
+            .get(py, name)?
+            .ok_or_else(|| PyKeyError::new_err(name.to_owned()))
+    }
+
+    /// Write the current statistics into an existing dict, such as a
+    /// :class:`Stats`, instead of returning a new one.
+    ///
+    /// ``s = Stats(); cpu.update_stats(s)`` gives the same result as
+    /// ``Stats(cpu.stats)`` without building and copying an intermediate dict.
+    /// Polling loops can also reuse one dict across calls.
+    fn update_stats(&self, target: &Bound<'_, PyDict>) -> PyResult<()> {
+        PyStats::from(&self.inner.cpu.stats).fill_dict(target)
+    }
+
+    /// Performance statistics as a JSON string that parses to the same dict as
+    /// ``cpu.stats``, laid out like ``json.dumps(..., indent=2)``, without
+    /// building the dict. Float spelling may differ from Python's.
+    fn stats_json(&self) -> String {
+        PyStats::from(&self.inner.cpu.stats).to_json()
+    }
+
     /// Register file — ``cpu.regs[10]``, ``cpu.regs[10] = v``.
     #[getter]
     fn regs(slf: Bound<'_, Self>) -> Registers {
@@ -284,13 +466,13 @@ impl PyCpu {
     /// Memory view for 32-bit reads — ``cpu.mem32[addr]``.
     #[getter]
     fn mem32(slf: Bound<'_, Self>) -> Memory {
-        Memory { cpu: slf.unbind(), width: 32 }
+        Memory::new(slf.unbind(), 32)
     }
 
     /// Memory view for 64-bit reads — ``cpu.mem64[addr]``.
     #[getter]
     fn mem64(slf: Bound<'_, Self>) -> Memory {
-        Memory { cpu: slf.unbind(), width: 64 }
+        Memory::new(slf.unbind(), 64)
     }
 
     /// Virtual memory view for 32-bit reads — ``cpu.vmem32[vaddr]``.
@@ -299,7 +481,7 @@ impl PyCpu {
     /// before reading. Raises ``ValueError`` if translation fails.
     #[getter]
     fn vmem32(slf: Bound<'_, Self>) -> VirtualMemory {
-        VirtualMemory { cpu: slf.unbind(), width: 32 }
+        VirtualMemory::new(slf.unbind(), 32)
     }
 
     /// Virtual memory view for 64-bit reads — ``cpu.vmem64[vaddr]``.
@@ -308,13 +490,15 @@ impl PyCpu {
     /// before reading. Raises ``ValueError`` if translation fails.
     #[getter]
     fn vmem64(slf: Bound<'_, Self>) -> VirtualMemory {
-        VirtualMemory { cpu: slf.unbind(), width: 64 }
+        VirtualMemory::new(slf.unbind(), 64)
     }
 
     /// Committed PC trace from the pipeline as a list of ``(pc, raw_inst)`` pairs.
+    ///
+    /// The list is built straight from the live trace, without copying it first.
     #[getter]
-    fn pc_trace(&self) -> Vec<(u64, u32)> {
-        self.inner.cpu.pc_trace.clone()
+    fn pc_trace<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
+        PyList::new(py, self.inner.cpu.pc_trace.iter().copied())
     }
 
     // ── Methods ──────────────────────────────────────────────────────────────
@@ -332,7 +516,7 @@ impl PyCpu {
     /// before an instruction could commit.
     #[pyo3(signature = (max_cycles=100_000))]
     fn step(&mut self, py: Python<'_>, max_cycles: u64) -> PyResult<Option<PyInstruction>> {
-        let before_last = self.inner.cpu.pc_trace.last().copied();
+        let before_last = self.inner.cpu.pc_trace.back().copied();
         let mut cycles_run: u64 = 0;
 
         loop {
@@ -352,15 +536,13 @@ impl PyCpu {
             }
             cycles_run += 1;
 
-            let new_last = self.inner.cpu.pc_trace.last().copied();
+            let new_last = self.inner.cpu.pc_trace.back().copied();
             if new_last != before_last
                 && let Some((pc, inst)) = new_last
             {
-                let asm = rvsim_core::isa::disasm::disassemble(inst);
                 return Ok(Some(PyInstruction {
                     pc,
                     raw: inst,
-                    asm,
                     cycles: self.inner.cpu.stats.cycles,
                 }));
             }
@@ -374,25 +556,36 @@ impl PyCpu {
     ///     progress: Print progress to stderr every N cycles. 0 = silent.
     ///     `stats_sections`: Print stats on completion. ``None`` = suppress,
     ///         ``[]`` = all sections, ``["summary", ...]`` = specific sections.
+    ///     `on_progress`: Called as ``on_progress(cycles, instructions_retired)``
+    ///         every *progress* cycles instead of printing to stderr. Requires ``progress > 0``.
+    ///         The Cpu is borrowed for the whole run, so the callback must not
+    ///         touch it.
     ///
     /// Returns:
     ///     Exit code or ``None`` if *limit* was reached without exiting.
-    #[pyo3(signature = (limit=None, progress=0, stats_sections=None))]
+    #[pyo3(signature = (limit=None, progress=0, stats_sections=None, on_progress=None))]
     fn run(
         &mut self,
         py: Python<'_>,
         limit: Option<u64>,
         progress: u64,
         stats_sections: Option<Vec<String>>,
+        on_progress: Option<&Bound<'_, PyAny>>,
     ) -> PyResult<Option<u64>> {
+        if on_progress.is_some() && progress == 0 {
+            return Err(PyValueError::new_err("on_progress requires progress > 0"));
+        }
         let exit = if progress > 0 {
-            self.run_with_progress(py, limit, progress)?
+            // Chunks run unflushed; flush stdout once for the whole run.
+            let exit = self.run_with_progress(py, limit, progress, on_progress);
+            let _ = std::io::stdout().flush();
+            exit?
         } else {
             self.run_inner(py, limit)?
         };
 
         if let Some(sections) = stats_sections {
-            let s = PyStats::from(self.inner.cpu.stats.clone());
+            let s = PyStats::from(&self.inner.cpu.stats);
             if sections.is_empty() {
                 s.print();
             } else {
@@ -436,7 +629,7 @@ impl PyCpu {
             let exit = self.run_for_cycles(py, chunk)?;
             cycles_run += chunk;
 
-            let s = PyStats::from(self.inner.cpu.stats.clone());
+            let s = PyStats::from(&self.inner.cpu.stats);
             snapshots.push(s.to_dict(py)?.into_bound(py).into_any().unbind());
 
             if exit.is_some() {
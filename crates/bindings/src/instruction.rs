@@ -2,9 +2,14 @@
 //!
 //! A single committed instruction returned by `Cpu.step()`.
 
+use crate::utils::disassemble_cached;
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 
 /// A single committed instruction from the pipeline.
+///
+/// The disassembly is produced on first access to `asm`, so stepping loops
+/// that only look at `pc` or `raw` never pay for formatting it.
 #[pyclass(name = "Instruction")]
 #[derive(Clone)]
 pub struct PyInstruction {
@@ -13,14 +18,19 @@ pub struct PyInstruction {
     #[pyo3(get)]
     pub raw: u32,
     #[pyo3(get)]
-    pub asm: String,
-    #[pyo3(get)]
     pub cycles: u64,
 }
 
 #[pymethods]
 impl PyInstruction {
+    /// Disassembly of `raw`, e.g. ``"addi sp, sp, -16"``.
+    #[getter]
+    fn asm(&self, py: Python<'_>) -> Py<PyString> {
+        disassemble_cached(py, self.raw)
+    }
+
     fn __repr__(&self) -> String {
-        format!("Instruction(pc={:#010x}, asm={:?}, cycles={})", self.pc, self.asm, self.cycles)
+        let asm = rvsim_core::isa::disasm::disassemble(self.raw);
+        format!("Instruction(pc={:#010x}, asm={asm:?}, cycles={})", self.pc, self.cycles)
     }
 }
@@ -3,7 +3,8 @@
 //! This crate exposes the simulator to Python via `PyO3`. It provides:
 //! 1. **CPU:** `Cpu` — the sole public entry point for simulation.
 //! 2. **Views:** `Instruction`, `Registers`, `Csrs`, `Memory` for CPU introspection.
-//! 3. **Utilities:** `version()` and `disassemble()`.
+//! 3. **Utilities:** `version()`, `disassemble()` and `disassemble_bytes()`.
+//! 4. **Batch:** `run_batch()` for running many simulations with the GIL released.
 
 // PyO3 bindings — relax documentation and pedantic lints for binding-layer code.
 #![allow(
@@ -22,6 +23,8 @@
 
 use pyo3::prelude::*;
 
+/// Batch execution (`run_batch`), GIL released across all runs.
+pub mod batch;
 /// Python dict to Rust `Config` conversion.
 pub mod conversion;
 /// CPU binding (`PyCpu` exposed as `Cpu`).
@@ -50,6 +53,8 @@ pub fn register_emulator_module(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     m.add_function(wrap_pyfunction!(utils::version, m)?)?;
     m.add_function(wrap_pyfunction!(utils::disassemble, m)?)?;
+    m.add_function(wrap_pyfunction!(utils::disassemble_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(batch::run_batch, m)?)?;
 
     Ok(())
 }
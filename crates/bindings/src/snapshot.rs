@@ -4,6 +4,7 @@
 //! `render()` / `visualize()` methods. All stage latches are lists of per-slot
 //! dicts. No private methods are exposed.
 
+use crate::utils::disassemble_cached;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use rvsim_core::common::RegIdx;
@@ -28,7 +29,7 @@ fn slot_dict(py: Python<'_>, pc: u64, raw: u32) -> PyResult<Bound<'_, PyDict>> {
     let d = PyDict::new(py);
     d.set_item("pc", pc)?;
     d.set_item("raw", raw)?;
-    d.set_item("asm", disassemble(raw))?;
+    d.set_item("asm", disassemble_cached(py, raw))?;
     Ok(d)
 }
 
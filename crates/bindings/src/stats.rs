@@ -2,18 +2,146 @@
 //!
 //! Exposes simulation statistics to Python: getters for cycles, cache hits/misses,
 //! branch accuracy, and instruction mix; `print` / `print_sections` for human-readable
-//! output; `to_dict` for JSON-serializable export (multisim, scripting).
+//! output; `to_dict` for JSON-serializable export (multisim, scripting) and
+//! `to_json` for writing stats files without a Python dict.
 
+use pyo3::intern;
 use pyo3::prelude::*;
 use rvsim_core::stats::SimStats;
 
+/// Ratios derived from the raw counters, exported alongside them.
+struct Ratios {
+    branch_accuracy_pct: f64,
+    speculative_branch_accuracy_pct: f64,
+    ipc: f64,
+}
+
+impl Ratios {
+    fn of(s: &SimStats) -> Self {
+        let total_bp = s.committed_branch_predictions + s.committed_branch_mispredictions;
+        let branch_accuracy_pct = if total_bp > 0 {
+            100.0 * (s.committed_branch_predictions as f64 / total_bp as f64)
+        } else {
+            0.0
+        };
+
+        let spec_total = s.speculative_branch_predictions + s.speculative_branch_mispredictions;
+        let speculative_branch_accuracy_pct = if spec_total > 0 {
+            100.0 * (s.speculative_branch_predictions as f64 / spec_total as f64)
+        } else {
+            0.0
+        };
+        let ipc = if s.cycles > 0 { s.instructions_retired as f64 / s.cycles as f64 } else { 0.0 };
+        Self { branch_accuracy_pct, speculative_branch_accuracy_pct, ipc }
+    }
+}
+
+/// Invoke `$emit!(key, value)` for every exported stat, in export order.
+///
+/// Single source of truth for the key list shared by `to_dict` and `to_json`.
+macro_rules! for_each_stat {
+    ($s:ident, $r:ident, $emit:ident) => {{
+        $emit!("cycles", $s.cycles);
+        $emit!("instructions_retired", $s.instructions_retired);
+        $emit!("icache_hits", $s.icache_hits);
+        $emit!("icache_misses", $s.icache_misses);
+        $emit!("dcache_hits", $s.dcache_hits);
+        $emit!("dcache_misses", $s.dcache_misses);
+        $emit!("l2_hits", $s.l2_hits);
+        $emit!("l2_misses", $s.l2_misses);
+        $emit!("l3_hits", $s.l3_hits);
+        $emit!("l3_misses", $s.l3_misses);
+        $emit!("stalls_mem", $s.stalls_mem);
+        $emit!("stalls_control", $s.stalls_control);
+        $emit!("stalls_data", $s.stalls_data);
+        $emit!("stalls_fu_structural", $s.stalls_fu_structural);
+        $emit!("stalls_backpressure", $s.stalls_backpressure);
+        $emit!("misprediction_penalty", $s.misprediction_penalty);
+        $emit!("pipeline_flushes", $s.pipeline_flushes);
+        $emit!("flushes_branch", $s.flushes_branch);
+        $emit!("flushes_system", $s.flushes_system);
+        $emit!("mem_ordering_violations", $s.mem_ordering_violations);
+        $emit!("stalls_dispatch", $s.stalls_dispatch);
+        $emit!("stalls_checkpoint", $s.stalls_checkpoint);
+        $emit!("stalls_squash", $s.stalls_squash);
+        $emit!("stalls_rename_rebuild", $s.stalls_rename_rebuild);
+        $emit!("stalls_mshr_full", $s.stalls_mshr_full);
+
+        $emit!("cycles_user", $s.cycles_user);
+        $emit!("cycles_kernel", $s.cycles_kernel);
+        $emit!("cycles_machine", $s.cycles_machine);
+        $emit!("traps_taken", $s.traps_taken);
+
+        $emit!("branch_predictions", $s.committed_branch_predictions);
+        $emit!("branch_mispredictions", $s.committed_branch_mispredictions);
+        $emit!("speculative_branch_predictions", $s.speculative_branch_predictions);
+        $emit!("speculative_branch_mispredictions", $s.speculative_branch_mispredictions);
+
+        $emit!("branch_accuracy_pct", $r.branch_accuracy_pct);
+
+        $emit!("speculative_branch_accuracy_pct", $r.speculative_branch_accuracy_pct);
+        $emit!("ipc", $r.ipc);
+
+        $emit!("inst_load", $s.inst_load);
+        $emit!("inst_store", $s.inst_store);
+        $emit!("inst_branch", $s.inst_branch);
+        $emit!("inst_alu", $s.inst_alu);
+        $emit!("inst_system", $s.inst_system);
+        $emit!("inst_fp_load", $s.inst_fp_load);
+        $emit!("inst_fp_store", $s.inst_fp_store);
+        $emit!("inst_fp_arith", $s.inst_fp_arith);
+        $emit!("inst_fp_fma", $s.inst_fp_fma);
+        $emit!("inst_fp_div_sqrt", $s.inst_fp_div_sqrt);
+
+        $emit!("pf_dedup_l1", $s.pf_dedup_l1);
+        $emit!("pf_dedup_l2", $s.pf_dedup_l2);
+        $emit!("pf_dedup_l3", $s.pf_dedup_l3);
+        $emit!("mshr_allocations", $s.mshr_allocations);
+        $emit!("mshr_coalesces", $s.mshr_coalesces);
+        $emit!("load_replays", $s.load_replays);
+
+        $emit!("mdp_predictions_bypass", $s.mdp_predictions_bypass);
+        $emit!("mdp_predictions_wait_all", $s.mdp_predictions_wait_all);
+        $emit!("mdp_predictions_wait_for", $s.mdp_predictions_wait_for);
+        $emit!("mdp_violations", $s.mdp_violations);
+    }};
+}
+
+/// A stat value that can be written as a JSON number.
+trait JsonNumber {
+    fn push_json(self, out: &mut String);
+}
+
+impl JsonNumber for u64 {
+    fn push_json(self, out: &mut String) {
+        use std::fmt::Write as _;
+        let _ = write!(out, "{self}");
+    }
+}
+
+impl JsonNumber for f64 {
+    fn push_json(self, out: &mut String) {
+        use std::fmt::Write as _;
+        // serde_json keeps the trailing ".0" Python writes for whole floats
+        // (0.0, 97.5), but its exponent form differs from Python's repr.
+        match serde_json::Number::from_f64(self) {
+            Some(n) => {
+                let _ = write!(out, "{n}");
+            }
+            None => out.push_str("NaN"),
+        }
+    }
+}
+
 /// Internal statistics wrapper — not exposed to Python.
-#[derive(Clone)]
-pub struct PyStats {
-    pub inner: SimStats,
+///
+/// Borrows the live `SimStats` so printing or exporting never clones the counters.
+#[derive(Clone, Copy)]
+pub struct PyStats<'a> {
+    pub inner: &'a SimStats,
 }
 
-impl PyStats {
+impl PyStats<'_> {
     /// Print all stats (full dump).
     pub fn print(&self) {
         self.inner.print();
@@ -25,92 +153,75 @@ impl PyStats {
     }
 
     /// Export all stats as a Python dict (JSON-serializable).
+    ///
+    /// Keys are interned once per process, so repeated exports (``cpu.stats``
+    /// polling, ``sample()``, batch results) only allocate the values.
     pub fn to_dict(&self, py: Python<'_>) -> pyo3::PyResult<pyo3::Py<pyo3::types::PyDict>> {
         let d = pyo3::types::PyDict::new(py);
-        let s = &self.inner;
-        d.set_item("cycles", s.cycles)?;
-        d.set_item("instructions_retired", s.instructions_retired)?;
-        d.set_item("icache_hits", s.icache_hits)?;
-        d.set_item("icache_misses", s.icache_misses)?;
-        d.set_item("dcache_hits", s.dcache_hits)?;
-        d.set_item("dcache_misses", s.dcache_misses)?;
-        d.set_item("l2_hits", s.l2_hits)?;
-        d.set_item("l2_misses", s.l2_misses)?;
-        d.set_item("l3_hits", s.l3_hits)?;
-        d.set_item("l3_misses", s.l3_misses)?;
-        d.set_item("stalls_mem", s.stalls_mem)?;
-        d.set_item("stalls_control", s.stalls_control)?;
-        d.set_item("stalls_data", s.stalls_data)?;
-        d.set_item("stalls_fu_structural", s.stalls_fu_structural)?;
-        d.set_item("stalls_backpressure", s.stalls_backpressure)?;
-        d.set_item("misprediction_penalty", s.misprediction_penalty)?;
-        d.set_item("pipeline_flushes", s.pipeline_flushes)?;
-        d.set_item("flushes_branch", s.flushes_branch)?;
-        d.set_item("flushes_system", s.flushes_system)?;
-        d.set_item("mem_ordering_violations", s.mem_ordering_violations)?;
-        d.set_item("stalls_dispatch", s.stalls_dispatch)?;
-        d.set_item("stalls_checkpoint", s.stalls_checkpoint)?;
-        d.set_item("stalls_squash", s.stalls_squash)?;
-        d.set_item("stalls_rename_rebuild", s.stalls_rename_rebuild)?;
-        d.set_item("stalls_mshr_full", s.stalls_mshr_full)?;
-
-        d.set_item("cycles_user", s.cycles_user)?;
-        d.set_item("cycles_kernel", s.cycles_kernel)?;
-        d.set_item("cycles_machine", s.cycles_machine)?;
-        d.set_item("traps_taken", s.traps_taken)?;
-
-        d.set_item("branch_predictions", s.committed_branch_predictions)?;
-        d.set_item("branch_mispredictions", s.committed_branch_mispredictions)?;
-        d.set_item("speculative_branch_predictions", s.speculative_branch_predictions)?;
-        d.set_item("speculative_branch_mispredictions", s.speculative_branch_mispredictions)?;
+        self.fill_dict(&d)?;
+        Ok(d.into())
+    }
 
-        let total_bp = s.committed_branch_predictions + s.committed_branch_mispredictions;
-        let bp_acc = if total_bp > 0 {
-            100.0 * (s.committed_branch_predictions as f64 / total_bp as f64)
-        } else {
-            0.0
-        };
-        d.set_item("branch_accuracy_pct", bp_acc)?;
+    /// Write all stats into an existing dict (or dict subclass), overwriting
+    /// matching keys. Same keys and values as `to_dict`.
+    pub fn fill_dict(&self, d: &Bound<'_, pyo3::types::PyDict>) -> pyo3::PyResult<()> {
+        let py = d.py();
+        let s = self.inner;
+        let r = Ratios::of(s);
+        macro_rules! set {
+            ($key:literal, $value:expr) => {
+                d.set_item(intern!(py, $key), $value)?;
+            };
+        }
+        for_each_stat!(s, r, set);
+        Ok(())
+    }
 
-        let spec_total = s.speculative_branch_predictions + s.speculative_branch_mispredictions;
-        let spec_acc = if spec_total > 0 {
-            100.0 * (s.speculative_branch_predictions as f64 / spec_total as f64)
-        } else {
-            0.0
-        };
-        d.set_item("speculative_branch_accuracy_pct", spec_acc)?;
-        let ipc = if s.cycles > 0 { s.instructions_retired as f64 / s.cycles as f64 } else { 0.0 };
-        d.set_item("ipc", ipc)?;
-
-        d.set_item("inst_load", s.inst_load)?;
-        d.set_item("inst_store", s.inst_store)?;
-        d.set_item("inst_branch", s.inst_branch)?;
-        d.set_item("inst_alu", s.inst_alu)?;
-        d.set_item("inst_system", s.inst_system)?;
-        d.set_item("inst_fp_load", s.inst_fp_load)?;
-        d.set_item("inst_fp_store", s.inst_fp_store)?;
-        d.set_item("inst_fp_arith", s.inst_fp_arith)?;
-        d.set_item("inst_fp_fma", s.inst_fp_fma)?;
-        d.set_item("inst_fp_div_sqrt", s.inst_fp_div_sqrt)?;
-
-        d.set_item("pf_dedup_l1", s.pf_dedup_l1)?;
-        d.set_item("pf_dedup_l2", s.pf_dedup_l2)?;
-        d.set_item("pf_dedup_l3", s.pf_dedup_l3)?;
-        d.set_item("mshr_allocations", s.mshr_allocations)?;
-        d.set_item("mshr_coalesces", s.mshr_coalesces)?;
-        d.set_item("load_replays", s.load_replays)?;
-
-        d.set_item("mdp_predictions_bypass", s.mdp_predictions_bypass)?;
-        d.set_item("mdp_predictions_wait_all", s.mdp_predictions_wait_all)?;
-        d.set_item("mdp_predictions_wait_for", s.mdp_predictions_wait_for)?;
-        d.set_item("mdp_violations", s.mdp_violations)?;
+    /// Look up a single stat by its `to_dict` key without building the dict.
+    ///
+    /// Returns `None` for an unknown key.
+    pub fn get(&self, py: Python<'_>, name: &str) -> pyo3::PyResult<Option<PyObject>> {
+        let s = self.inner;
+        let r = Ratios::of(s);
+        macro_rules! hit {
+            ($key:literal, $value:expr) => {
+                if name == $key {
+                    return Ok(Some($value.into_pyobject(py)?.into_any().unbind()));
+                }
+            };
+        }
+        for_each_stat!(s, r, hit);
+        Ok(None)
+    }
 
-        Ok(d.into())
+    /// Export all stats as a JSON object string, same keys and order as `to_dict`.
+    ///
+    /// Laid out like ``json.dump(stats, f, indent=2)`` and parses back to the
+    /// same dict, but floats use Rust's shortest round-trip spelling, so very
+    /// large or small ratios may be written differently (``1e-7`` rather than
+    /// Python's ``1e-07``). Compare parsed values, not file bytes.
+    pub fn to_json(&self) -> String {
+        let s = self.inner;
+        let r = Ratios::of(s);
+        let mut out = String::with_capacity(2048);
+        out.push('{');
+        macro_rules! put {
+            ($key:literal, $value:expr) => {
+                if out.len() > 1 {
+                    out.push(',');
+                }
+                out.push_str(concat!("\n  \"", $key, "\": "));
+                $value.push_json(&mut out);
+            };
+        }
+        for_each_stat!(s, r, put);
+        out.push_str("\n}");
+        out
     }
 }
 
-impl From<SimStats> for PyStats {
-    fn from(inner: SimStats) -> Self {
+impl<'a> From<&'a SimStats> for PyStats<'a> {
+    fn from(inner: &'a SimStats) -> Self {
         Self { inner }
     }
 }
@@ -3,6 +3,39 @@
 //! Provides version and other helpers for the `rvsim` module.
 
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::PyString;
+use std::collections::HashMap;
+use std::sync::Mutex;
+
+/// Maximum distinct encodings kept by [`disassemble_cached`]; the cache is
+/// cleared when it fills, which bounds memory on pathological inputs.
+const DISASM_CACHE_CAP: usize = 4096;
+
+/// Disassembled Python strings keyed by raw encoding. Only touched with the
+/// GIL held; the mutex just makes the static `Sync`.
+static DISASM_CACHE: GILOnceCell<Mutex<HashMap<u32, Py<PyString>>>> = GILOnceCell::new();
+
+/// Disassemble `inst`, reusing the Python string from an earlier call.
+///
+/// Traces and stepping loops revisit the same few thousand encodings, so most
+/// lookups return a shared string instead of formatting and allocating anew.
+pub(crate) fn disassemble_cached(py: Python<'_>, inst: u32) -> Py<PyString> {
+    let cache = DISASM_CACHE.get_or_init(py, || Mutex::new(HashMap::new()));
+    let Ok(mut map) = cache.lock() else {
+        return PyString::new(py, &rvsim_core::isa::disasm::disassemble(inst)).unbind();
+    };
+    if let Some(s) = map.get(&inst) {
+        return s.clone_ref(py);
+    }
+    if map.len() >= DISASM_CACHE_CAP {
+        map.clear();
+    }
+    let s = PyString::new(py, &rvsim_core::isa::disasm::disassemble(inst)).unbind();
+    let _ = map.insert(inst, s.clone_ref(py));
+    drop(map);
+    s
+}
 
 /// Returns the emulator version string (e.g., for scripting or diagnostics).
 ///
@@ -31,6 +64,73 @@ pub fn version() -> String {
 /// or `"unknown (0x????????)"` for unrecognised encodings.
 #[pyfunction]
 #[must_use]
-pub fn disassemble(inst: u32) -> String {
-    rvsim_core::isa::disasm::disassemble(inst)
+pub fn disassemble(py: Python<'_>, inst: u32) -> Py<PyString> {
+    disassemble_cached(py, inst)
+}
+
+/// Disassemble a buffer of RISC-V code in a single call.
+///
+/// Walks `data` as little-endian halfwords from `offset`, decoding a 16-bit
+/// compressed instruction when the low two bits are not `0b11` and a 32-bit
+/// instruction otherwise. Stops at the end of the buffer (a trailing partial
+/// instruction is dropped) or after `limit` instructions. The GIL is released
+/// while decoding.
+///
+/// # Arguments
+///
+/// * `data` - Raw instruction bytes.
+/// * `base` - Address of `data[0]`, used for the returned PCs.
+/// * `limit` - Maximum number of instructions to decode; `None` decodes all.
+/// * `offset` - Byte offset in `data` to start decoding at, so callers can
+///   disassemble a window without slicing (copying) the buffer first.
+///
+/// # Returns
+///
+/// A list of `(pc, raw, asm)` tuples in address order.
+#[pyfunction]
+#[pyo3(signature = (data, base, limit=None, offset=0))]
+pub fn disassemble_bytes(
+    py: Python<'_>,
+    data: &[u8],
+    base: u64,
+    limit: Option<usize>,
+    offset: usize,
+) -> Vec<(u64, u32, String)> {
+    py.allow_threads(|| {
+        // Bit 16*k is set when halfword k has both low bits set, i.e. starts a
+        // 32-bit instruction.
+        const LOW_BIT: u64 = 0x0001_0001_0001_0001;
+
+        let limit = limit.unwrap_or(usize::MAX);
+        let mut out = Vec::new();
+        let mut off = offset.min(data.len());
+        while out.len() < limit {
+            // Classify four halfwords with one load: the trailing-zero count of
+            // the 32-bit lane mask is the run of compressed instructions ahead.
+            if let Some(&[h0, h1, h2, h3, h4, h5, h6, h7]) = data.get(off..off + 8) {
+                let w = u64::from_le_bytes([h0, h1, h2, h3, h4, h5, h6, h7]);
+                let run = ((w & (w >> 1) & LOW_BIT).trailing_zeros() / 16) as usize;
+                if run > 0 {
+                    for k in 0..run.min(limit - out.len()) {
+                        let raw = u32::from((w >> (16 * k)) as u16);
+                        let pc = base + (off + 2 * k) as u64;
+                        out.push((pc, raw, rvsim_core::isa::disasm::disassemble(raw)));
+                    }
+                    off += 2 * run;
+                    continue;
+                }
+            }
+            let Some(&[b0, b1]) = data.get(off..off + 2) else { break };
+            let (raw, len) = if b0 & 0x3 != 0x3 {
+                (u32::from(u16::from_le_bytes([b0, b1])), 2)
+            } else if let Some(&[b2, b3]) = data.get(off + 2..off + 4) {
+                (u32::from_le_bytes([b0, b1, b2, b3]), 4)
+            } else {
+                break;
+            };
+            out.push((base + off as u64, raw, rvsim_core::isa::disasm::disassemble(raw)));
+            off += len;
+        }
+        out
+    })
 }
@@ -3,48 +3,13 @@
 //! Each view holds a `Py<PyCpu>` back-reference so reads and writes go through
 //! the live CPU rather than a snapshot.
 
-use pyo3::exceptions::{PyIndexError, PyKeyError, PyTypeError};
+use pyo3::exceptions::{PyIndexError, PyKeyError, PyTypeError, PyValueError};
 use pyo3::prelude::*;
-use rvsim_core::common::RegIdx;
+use pyo3::types::PyString;
+use rvsim_core::common::{PhysAddr, RegIdx};
 
 use crate::cpu::PyCpu;
 
-const fn csr_addr_to_name(addr: u64) -> Option<&'static str> {
-    match addr {
-        // Supervisor
-        0x100 => Some("sstatus"),
-        0x104 => Some("sie"),
-        0x105 => Some("stvec"),
-        0x140 => Some("sscratch"),
-        0x141 => Some("sepc"),
-        0x142 => Some("scause"),
-        0x143 => Some("stval"),
-        0x144 => Some("sip"),
-        0x180 => Some("satp"),
-        // Machine
-        0x300 => Some("mstatus"),
-        0x301 => Some("misa"),
-        0x302 => Some("medeleg"),
-        0x303 => Some("mideleg"),
-        0x304 => Some("mie"),
-        0x305 => Some("mtvec"),
-        0x340 => Some("mscratch"),
-        0x341 => Some("mepc"),
-        0x342 => Some("mcause"),
-        0x343 => Some("mtval"),
-        0x344 => Some("mip"),
-        // Counters
-        0xC00 => Some("cycle"),
-        0xC01 => Some("time"),
-        0xC02 => Some("instret"),
-        0xB00 => Some("mcycle"),
-        0xB02 => Some("minstret"),
-        // Sstc
-        0x14D => Some("stimecmp"),
-        _ => None,
-    }
-}
-
 /// Subscript register access returned by `cpu.regs`.
 ///
 /// ``cpu.regs[10]`` reads x10. ``cpu.regs[10] = v`` writes x10.
@@ -70,15 +35,29 @@ impl Registers {
         Ok(())
     }
 
+    /// All 32 integer registers as a list, ``x0`` first, in one call.
+    fn snapshot(&self, py: Python<'_>) -> Vec<u64> {
+        let cpu = self.cpu.borrow(py);
+        (0u8..32).map(|i| cpu.inner.cpu.regs.read(RegIdx::new(i))).collect()
+    }
+
     fn __repr__(&self, py: Python<'_>) -> String {
+        use std::fmt::Write as _;
+
+        // Each register is read once and formatted straight into the output,
+        // with no per-register String or joined Vec.
         let cpu = self.cpu.borrow(py);
-        let vals: Vec<String> = (0u8..32)
-            .filter_map(|i| {
-                let v = cpu.inner.cpu.regs.read(RegIdx::new(i));
-                if v != 0 { Some(format!("x{i}={v:#x}")) } else { None }
-            })
-            .collect();
-        format!("Registers({})", vals.join(", "))
+        let mut out = String::from("Registers(");
+        let mut sep = "";
+        for i in 0u8..32 {
+            let v = cpu.inner.cpu.regs.read(RegIdx::new(i));
+            if v != 0 {
+                let _ = write!(out, "{sep}x{i}={v:#x}");
+                sep = ", ";
+            }
+        }
+        out.push(')');
+        out
     }
 }
 
@@ -93,16 +72,20 @@ pub struct Csrs {
 #[pymethods]
 impl Csrs {
     fn __getitem__(&self, py: Python<'_>, key: &Bound<'_, PyAny>) -> PyResult<Option<u64>> {
-        let name: String = if let Ok(addr) = key.extract::<u64>() {
-            csr_addr_to_name(addr)
-                .ok_or_else(|| PyKeyError::new_err(format!("unknown CSR address {addr:#x}")))?
-                .to_string()
-        } else if let Ok(s) = key.extract::<String>() {
-            s.to_lowercase()
-        } else {
+        let cpu = self.cpu.borrow(py);
+        if let Ok(addr) = key.extract::<u64>() {
+            return cpu
+                .read_csr_by_addr(addr)
+                .map(Some)
+                .ok_or_else(|| PyKeyError::new_err(format!("unknown CSR address {addr:#x}")));
+        }
+        let Ok(s) = key.downcast::<PyString>() else {
             return Err(PyTypeError::new_err("CSR key must be a str or int"));
         };
-        Ok(self.cpu.borrow(py).read_csr_by_name(&name))
+        // Borrow the str and try it as-is; only mixed/upper case pays for a
+        // lowercased copy.
+        let name = s.to_str()?;
+        Ok(cpu.read_csr_by_name(name).or_else(|| cpu.read_csr_by_name(&name.to_lowercase())))
     }
 
     const fn __repr__(&self) -> &'static str {
@@ -110,26 +93,70 @@ impl Csrs {
     }
 }
 
+/// Width-specialized physical read, chosen once when a view is created so that
+/// `__getitem__` calls straight through instead of matching on the width.
+type ReadFn = fn(&mut PyCpu, PhysAddr) -> u64;
+
+fn read_u32(cpu: &mut PyCpu, addr: PhysAddr) -> u64 {
+    u64::from(cpu.inner.cpu.bus.bus.read_u32(addr))
+}
+
+fn read_u64(cpu: &mut PyCpu, addr: PhysAddr) -> u64 {
+    cpu.inner.cpu.bus.bus.read_u64(addr)
+}
+
+/// Read function for a view of `width` bits (32 or 64).
+fn reader(width: u8) -> ReadFn {
+    if width == 32 { read_u32 } else { read_u64 }
+}
+
 /// Subscript memory access returned by `cpu.mem32` or `cpu.mem64`.
 ///
 /// ``cpu.mem32[addr]`` reads a u32. ``cpu.mem64[addr]`` reads a u64.
 /// These use **physical** addresses — no MMU translation.
 #[pyclass(name = "Memory")]
 pub struct Memory {
-    pub cpu: Py<PyCpu>,
-    pub width: u8,
+    cpu: Py<PyCpu>,
+    width: u8,
+    read: ReadFn,
+}
+
+impl Memory {
+    /// View over `cpu` reading `width`-bit (32 or 64) words.
+    pub fn new(cpu: Py<PyCpu>, width: u8) -> Self {
+        Self { cpu, width, read: reader(width) }
+    }
 }
 
 #[pymethods]
 impl Memory {
     fn __getitem__(&self, py: Python<'_>, addr: u64) -> u64 {
+        (self.read)(&mut self.cpu.borrow_mut(py), PhysAddr::new(addr))
+    }
+
+    /// Read `count` consecutive words starting at `addr` in one call.
+    ///
+    /// Equivalent to ``[view[addr + i * size] for i in range(count)]`` but
+    /// crosses into Rust once instead of once per word. Raises ``ValueError``
+    /// if `count` words would not fit in RAM or the range runs past the end of
+    /// the address space.
+    fn read_range(&self, py: Python<'_>, addr: u64, count: u64) -> PyResult<Vec<u64>> {
         let mut cpu = self.cpu.borrow_mut(py);
-        let paddr = rvsim_core::common::PhysAddr::new(addr);
-        match self.width {
-            32 => u64::from(cpu.inner.cpu.bus.bus.read_u32(paddr)),
-            64 => cpu.inner.cpu.bus.bus.read_u64(paddr),
-            _ => unreachable!(),
+        let step = u64::from(self.width / 8);
+        let ram_words = cpu.inner.cpu.ram_end.saturating_sub(cpu.inner.cpu.ram_start) / step;
+        if count > ram_words {
+            return Err(PyValueError::new_err(format!(
+                "count {count} exceeds RAM size ({ram_words} {}-bit words)",
+                self.width
+            )));
+        }
+        // count <= ram_words, so count * step cannot overflow; only addr can.
+        if addr.checked_add(count * step).is_none() {
+            return Err(PyValueError::new_err(format!(
+                "range of {count} words at {addr:#x} overflows the address space"
+            )));
         }
+        Ok((0..count).map(|i| (self.read)(&mut cpu, PhysAddr::new(addr + i * step))).collect())
     }
 
     fn __repr__(&self) -> String {
@@ -144,8 +171,16 @@ impl Memory {
 /// Returns 0 if translation fails (page fault).
 #[pyclass(name = "VirtualMemory")]
 pub struct VirtualMemory {
-    pub cpu: Py<PyCpu>,
-    pub width: u8,
+    cpu: Py<PyCpu>,
+    width: u8,
+    read: ReadFn,
+}
+
+impl VirtualMemory {
+    /// View over `cpu` reading `width`-bit (32 or 64) words.
+    pub fn new(cpu: Py<PyCpu>, width: u8) -> Self {
+        Self { cpu, width, read: reader(width) }
+    }
 }
 
 #[pymethods]
@@ -160,12 +195,7 @@ impl VirtualMemory {
                 "translation failed for VA {addr:#x}: {trap:?}"
             )));
         }
-        let paddr = result.paddr;
-        Ok(match self.width {
-            32 => u64::from(cpu.inner.cpu.bus.bus.read_u32(paddr)),
-            64 => cpu.inner.cpu.bus.bus.read_u64(paddr),
-            _ => unreachable!(),
-        })
+        Ok((self.read)(&mut cpu, result.paddr))
     }
 
     fn __repr__(&self) -> String {
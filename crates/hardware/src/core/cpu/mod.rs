@@ -31,6 +31,7 @@ use crate::core::units::mmu::pmp::Pmp;
 use crate::core::units::prefetch::PrefetchFilter;
 use crate::soc::System;
 use crate::stats::SimStats;
+use std::collections::VecDeque;
 
 /// CPU architectural state: registers, caches, MMU, bus, and statistics.
 ///
@@ -133,7 +134,7 @@ pub struct Cpu {
     pub htif_range: Option<(u64, u64)>,
 
     /// Ring buffer of (pc, inst) for last N retired instructions (for invalid-PC debug trace).
-    pub pc_trace: Vec<(u64, u32)>,
+    pub pc_trace: VecDeque<(u64, u32)>,
     /// Last invalid PC we printed debug for (avoid duplicate dumps).
     pub last_invalid_pc_debug: Option<u64>,
 
@@ -333,7 +334,7 @@ impl Cpu {
             ram_start,
             ram_end,
             htif_range: None,
-            pc_trace: Vec::with_capacity(PC_TRACE_MAX),
+            pc_trace: VecDeque::with_capacity(PC_TRACE_MAX),
             last_invalid_pc_debug: None,
             redirect_pending: false,
             software_ad_bits: config.memory.software_ad_bits,
@@ -239,10 +239,10 @@ pub fn commit_stage(
         };
 
         // Update PC trace
-        cpu.pc_trace.push((entry.pc, entry.inst));
-        if cpu.pc_trace.len() > PC_TRACE_MAX {
-            let _ = cpu.pc_trace.remove(0);
+        if cpu.pc_trace.len() == PC_TRACE_MAX {
+            let _ = cpu.pc_trace.pop_front();
         }
+        cpu.pc_trace.push_back((entry.pc, entry.inst));
 
         // Statistics
         if entry.inst != 0 && entry.inst != 0x13 {
@@ -51,6 +51,9 @@ pub struct CacheSim {
     num_sets: usize,
     ways: usize,
     line_bytes: usize,
+    /// `(line_shift, set_mask, tag_shift)` when both the line size and the set
+    /// count are powers of two, so `locate` can shift and mask instead of divide.
+    pow2: Option<(u32, usize, u32)>,
     policy: Box<dyn ReplacementPolicy + Send + Sync>,
 }
 
@@ -111,11 +114,17 @@ impl CacheSim {
             PrefetcherType::None => None,
         };
 
+        let pow2 = (safe_line.is_power_of_two() && num_sets.is_power_of_two()).then(|| {
+            let line_shift = safe_line.trailing_zeros();
+            (line_shift, num_sets - 1, line_shift + num_sets.trailing_zeros())
+        });
+
         Self {
             lines: vec![CacheLine::default(); num_sets * safe_ways],
             num_sets,
             ways: safe_ways,
             line_bytes: safe_line,
+            pow2,
             latency: config.latency,
             enabled: config.enabled,
             policy,
@@ -123,6 +132,22 @@ impl CacheSim {
         }
     }
 
+    /// Splits an address into its set index and tag.
+    ///
+    /// Power-of-two geometries (the common case) use shifts and a mask; other
+    /// geometries fall back to division.
+    #[inline]
+    const fn locate(&self, addr: u64) -> (usize, u64) {
+        if let Some((line_shift, set_mask, tag_shift)) = self.pow2 {
+            (((addr >> line_shift) as usize) & set_mask, addr >> tag_shift)
+        } else {
+            (
+                ((addr as usize) / self.line_bytes) % self.num_sets,
+                addr / (self.line_bytes * self.num_sets) as u64,
+            )
+        }
+    }
+
     /// Reconstructs the physical address from a set index and tag.
     #[inline]
     const fn reconstruct_addr(&self, set_index: usize, tag: u64) -> u64 {
@@ -142,7 +167,7 @@ impl CacheSim {
     /// # Panics
     ///
     /// This function will not panic. Array indexing is guaranteed safe because:
-    /// - `set_index` is always `< num_sets` (modulo operation)
+    /// - `set_index` is always `< num_sets` (modulo or mask)
     /// - `base_idx = set_index * ways` is always `< lines.len()`
     /// - `idx = base_idx + i` where `i < ways` ensures `idx < lines.len()`
     pub fn contains(&self, addr: u64) -> bool {
@@ -150,8 +175,7 @@ impl CacheSim {
             return false;
         }
 
-        let set_index = ((addr as usize) / self.line_bytes) % self.num_sets;
-        let tag = addr / (self.line_bytes * self.num_sets) as u64;
+        let (set_index, tag) = self.locate(addr);
         let base_idx = set_index * self.ways;
 
         for i in 0..self.ways {
@@ -193,8 +217,7 @@ impl CacheSim {
         is_write: bool,
         next_level_latency: u64,
     ) -> (u64, Option<EvictedLine>) {
-        let set_index = ((addr as usize) / self.line_bytes) % self.num_sets;
-        let tag = addr / (self.line_bytes * self.num_sets) as u64;
+        let (set_index, tag) = self.locate(addr);
         let base_idx = set_index * self.ways;
 
         let victim_way = self.policy.get_victim(set_index);
@@ -239,8 +262,7 @@ impl CacheSim {
             return (false, 0);
         }
 
-        let set_index = ((addr as usize) / self.line_bytes) % self.num_sets;
-        let tag = addr / (self.line_bytes * self.num_sets) as u64;
+        let (set_index, tag) = self.locate(addr);
         let base_idx = set_index * self.ways;
 
         let mut hit = false;
@@ -319,8 +341,7 @@ impl CacheSim {
             return (false, 0, Vec::new(), Vec::new());
         }
 
-        let set_index = ((addr as usize) / self.line_bytes) % self.num_sets;
-        let tag = addr / (self.line_bytes * self.num_sets) as u64;
+        let (set_index, tag) = self.locate(addr);
         let base_idx = set_index * self.ways;
 
         let mut hit = false;
@@ -383,8 +404,7 @@ impl CacheSim {
             return false;
         }
 
-        let set_index = ((addr as usize) / self.line_bytes) % self.num_sets;
-        let tag = addr / (self.line_bytes * self.num_sets) as u64;
+        let (set_index, tag) = self.locate(addr);
         let base_idx = set_index * self.ways;
 
         let mut hit = false;
@@ -444,8 +464,7 @@ impl CacheSim {
             return false;
         }
 
-        let set_index = ((addr as usize) / self.line_bytes) % self.num_sets;
-        let tag = addr / (self.line_bytes * self.num_sets) as u64;
+        let (set_index, tag) = self.locate(addr);
         let base_idx = set_index * self.ways;
 
         for i in 0..self.ways {
@@ -474,8 +493,7 @@ impl CacheSim {
             return (0, None);
         }
 
-        let set_index = ((addr as usize) / self.line_bytes) % self.num_sets;
-        let tag = addr / (self.line_bytes * self.num_sets) as u64;
+        let (set_index, tag) = self.locate(addr);
         let base_idx = set_index * self.ways;
 
         // Try to find an invalid (free) way first
@@ -29,6 +29,21 @@ pub fn load_binary(path: &str) -> Result<Vec<u8>, SimError> {
     fs::read(path).map_err(|source| SimError::FileRead { path: path.to_owned(), source })
 }
 
+/// Loads a binary file if it exists.
+///
+/// Opens the file once instead of probing it with a separate `metadata` call.
+///
+/// # Errors
+///
+/// Returns [`SimError::FileRead`] if the file exists but cannot be read.
+fn load_binary_if_exists(path: &str) -> Result<Option<Vec<u8>>, SimError> {
+    match fs::read(path) {
+        Ok(data) => Ok(Some(data)),
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => Ok(None),
+        Err(source) => Err(SimError::FileRead { path: path.to_owned(), source }),
+    }
+}
+
 /// Sets up kernel loading: places `OpenSBI`, kernel image, and DTB in RAM and initializes CPU state.
 ///
 /// If `OpenSBI` is found, loads it at `ram_base`, kernel at `ram_base + 0x200000`, DTB at `ram_base + 0x2200000`,
@@ -72,18 +87,18 @@ pub fn setup_kernel_load(
     // over fw_dynamic.bin (which requires extra fw_dynamic_info setup).
     let sbi_jump_path = "software/linux/output/fw_jump.bin";
     let sbi_dynamic_path = "software/linux/output/fw_dynamic.bin";
-    let sbi_path =
-        if fs::metadata(sbi_jump_path).is_ok() { sbi_jump_path } else { sbi_dynamic_path };
+    let (sbi_path, sbi_data) = match load_binary_if_exists(sbi_jump_path)? {
+        Some(data) => (sbi_jump_path, Some(data)),
+        None => (sbi_dynamic_path, load_binary_if_exists(sbi_dynamic_path)?),
+    };
 
-    if fs::metadata(sbi_path).is_ok() {
-        let sbi_data = load_binary(sbi_path)?;
+    if let Some(sbi_data) = sbi_data {
         cpu.bus.load_binary_at(&sbi_data, PhysAddr::new(opensbi_addr));
 
         let default_kernel_path = "software/linux/output/Image";
         let kernel_path = kernel_path_override.as_deref().unwrap_or(default_kernel_path);
 
-        if fs::metadata(kernel_path).is_ok() {
-            let kernel_data = load_binary(kernel_path)?;
+        if let Some(kernel_data) = load_binary_if_exists(kernel_path)? {
             cpu.bus.load_binary_at(&kernel_data, PhysAddr::new(kernel_addr));
         } else {
             println!("[Loader] WARNING: Linux Image not found at {kernel_path}");
@@ -10,15 +10,8 @@ A Python-first interface to the cycle-accurate RISC-V simulator:
 6. **Pipeline:** ``PipelineSnapshot`` (from ``cpu.pipeline_snapshot()``).
 """
 
-from importlib.metadata import version as _metadata_version
-
 from .config import Config
-from .experiment import Environment, Result
-from .isa import Disassemble, csr, reg
-from .objects import Cpu, Instruction, Simulator
-from .pipeline import PipelineSnapshot
 from .stats import Stats, Table
-from .sweep import Sweep, SweepResults
 from .types import (
     Backend,
     BranchPredictor,
@@ -30,15 +23,25 @@ from .types import (
     ReplacementPolicy,
 )
 
+# Names backed by the native extension, mapped to the submodule that defines
+# them. Importing ``rvsim._core`` loads the shared library and registers every
+# PyO3 type, so it is deferred until one of these is first accessed; the CLI's
+# ``--help`` and config-only scripts never pay for it.
+_LAZY_ATTRS = {
+    "Cpu": "objects",
+    "Instruction": "objects",
+    "Simulator": "objects",
+    "PipelineSnapshot": "pipeline",
+    "Environment": "experiment",
+    "Result": "experiment",
+    "reg": "isa",
+    "csr": "isa",
+    "Disassemble": "isa",
+    "Sweep": "sweep",
+    "SweepResults": "sweep",
+}
 
-__version__ = _metadata_version("rvsim")
-
-# Scrub submodule references and private imports that the import machinery
-# pins as attributes. After this, `rvsim.objects` etc. raise AttributeError.
-import sys as _sys
-
-_rvsim_dict = _sys.modules[__name__].__dict__
-for _name in (
+_SUBMODULES = (
     "config",
     "experiment",
     "isa",
@@ -49,15 +52,43 @@ for _name in (
     "types",
     "_core",
     "_cli",
-    "_metadata_version",
-):
-    _rvsim_dict.pop(_name, None)
-del _sys, _rvsim_dict, _name
+)
+
+
+def _scrub_submodules() -> None:
+    # Scrub submodule references that the import machinery pins as attributes.
+    # After this, `rvsim.objects` etc. raise AttributeError.
+    g = globals()
+    for name in _SUBMODULES:
+        g.pop(name, None)
+
+
+_scrub_submodules()
 
 
 def version() -> str:
     """Return the installed rvsim version string."""
-    return __version__
+    return globals().get("__version__") or __getattr__("__version__")
+
+
+def __getattr__(name: str):
+    # ``importlib.metadata`` costs tens of milliseconds to import and scan, which
+    # every sweep worker would pay at startup; resolve the version on first use.
+    if name == "__version__":
+        from importlib.metadata import version as _metadata_version
+
+        value = _metadata_version("rvsim")
+        globals()["__version__"] = value
+        return value
+    module = _LAZY_ATTRS.get(name)
+    if module is not None:
+        from importlib import import_module
+
+        value = getattr(import_module(f".{module}", __name__), name)
+        globals()[name] = value
+        _scrub_submodules()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -8,8 +8,8 @@ Usage::
 """
 
 import argparse
+import functools
 import os
-import pathlib
 import runpy
 import sys
 
@@ -41,20 +41,26 @@ def _detect_mode(filepath: str) -> str:
 
 
 def _find_bundled_binaries():
-    pkg_dir = pathlib.Path(__file__).resolve().parent
-    repo_root = pkg_dir.parent
-    programs = repo_root / "software" / "bin" / "programs"
-    benchmarks = repo_root / "software" / "bin" / "benchmarks"
-    if programs.is_dir() and benchmarks.is_dir():
-        return programs, benchmarks
-    cwd = pathlib.Path.cwd()
-    programs = cwd / "software" / "bin" / "programs"
-    benchmarks = cwd / "software" / "bin" / "benchmarks"
-    if programs.is_dir() and benchmarks.is_dir():
-        return programs, benchmarks
+    repo_root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    for root in (repo_root, os.getcwd()):
+        programs = os.path.join(root, "software", "bin", "programs")
+        benchmarks = os.path.join(root, "software", "bin", "benchmarks")
+        if os.path.isdir(programs) and os.path.isdir(benchmarks):
+            return programs, benchmarks
     return None, None
 
 
+def _elf_stems(directory: str) -> list:
+    """Names of the ``*.elf`` files in *directory*, without the extension."""
+    with os.scandir(directory) as it:
+        names = sorted(
+            e.name
+            for e in it
+            if e.name.endswith(".elf") and not e.name.startswith(".") and e.is_file()
+        )
+    return [name[:-4] for name in names]
+
+
 def _cmd_list():
     from ._cli import BOLD, DIM, RESET, TEAL
 
@@ -79,13 +85,12 @@ def _cmd_list():
         return f"  {stem:<18}{desc}"
 
     print(section("programs"))
-    for f in sorted(programs.glob("*.elf")):
-        desc = _PROGRAM_DESCRIPTIONS.get(f.stem, "")
-        print(row(f.stem, desc))
+    for stem in _elf_stems(programs):
+        print(row(stem, _PROGRAM_DESCRIPTIONS.get(stem, "")))
 
     print(section("benchmarks"))
-    for f in sorted(benchmarks.glob("*.elf")):
-        print(row(f.stem, ""))
+    for stem in _elf_stems(benchmarks):
+        print(row(stem, ""))
 
     print()
 
@@ -174,19 +179,31 @@ def _print_help() -> None:
     console.print()
 
 
-# ── Main ──────────────────────────────────────────────────────────────────────
+class _VersionAction(argparse.Action):
+    """``--version`` that looks up package metadata only when actually passed.
 
+    argparse's built-in ``version`` action needs the string up front, which
+    would import and scan ``importlib.metadata`` on every invocation.
+    """
 
-def main() -> None:
-    if len(sys.argv) == 1 or (len(sys.argv) == 2 and sys.argv[1] in ("-h", "--help")):
-        _print_help()
-        sys.exit(0)
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs):
+        kwargs.setdefault("help", "show program's version number and exit")
+        super().__init__(
+            option_strings, dest=dest, default=argparse.SUPPRESS, nargs=0, **kwargs
+        )
 
-    if len(sys.argv) >= 2 and sys.argv[1] == "list":
-        _cmd_list()
-        return
+    def __call__(self, parser, namespace, values, option_string=None):
+        from . import version
+
+        print(f"rvsim {version()}")
+        parser.exit()
 
-    from importlib.metadata import version as _meta_version
+
+# ── Argument parsing ──────────────────────────────────────────────────────────
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
     from .types import _parse_cycles
 
     parser = argparse.ArgumentParser(
@@ -218,9 +235,7 @@ def main() -> None:
         ),
     )
 
-    parser.add_argument(
-        "--version", action="version", version=f"rvsim {_meta_version('rvsim')}"
-    )
+    parser.add_argument("--version", action=_VersionAction)
     parser.add_argument(
         "--limit",
         metavar="N",
@@ -260,7 +275,22 @@ def main() -> None:
     )
     parser.add_argument("positional_args", nargs="*", help=argparse.SUPPRESS)
 
-    args, remaining = parser.parse_known_args()
+    return parser
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    if len(sys.argv) == 1 or (len(sys.argv) == 2 and sys.argv[1] in ("-h", "--help")):
+        _print_help()
+        sys.exit(0)
+
+    if len(sys.argv) >= 2 and sys.argv[1] == "list":
+        _cmd_list()
+        return
+
+    args, remaining = _build_parser().parse_known_args()
 
     if not args.positional_args:
         _print_help()
@@ -271,7 +301,7 @@ def main() -> None:
     extra_args = args.positional_args[1:] + remaining
 
     if mode != "script" and extra_args:
-        parser.error(f"unrecognized arguments: {' '.join(extra_args)}")
+        _build_parser().error(f"unrecognized arguments: {' '.join(extra_args)}")
 
     # ── Execute ───────────────────────────────────────────────────────────────
 
@@ -283,21 +313,20 @@ def main() -> None:
     from .config import Config
     from .objects import Simulator
 
+    sim = Simulator()
     if args.config:
-        sim_tmp = Simulator().config(args.config)
-        cfg = sim_tmp._config_obj if sim_tmp._config_obj is not None else Config()
-    else:
-        cfg = Config()
-    if args.quiet:
-        cfg.uart_quiet = True
-    elif args.watch:
-        # Redirect program output to stderr so Live doesn't see stdout being
-        # written mid-render (which causes the duplicate frame).
-        cfg.uart_to_stderr = True
-    elif mode == "kernel":
-        cfg.uart_to_stderr = True
-
-    sim = Simulator().config(cfg)
+        sim.config(args.config)
+    # Only materialize a Config when a flag has to change it; otherwise build()
+    # uses the cached default payload (and routes kernel UART output itself).
+    if args.quiet or args.watch:
+        cfg = sim._config_obj if sim._config_obj is not None else Config()
+        if args.quiet:
+            cfg.uart_quiet = True
+        else:
+            # Redirect program output to stderr so Live doesn't see stdout being
+            # written mid-render (which causes the duplicate frame).
+            cfg.uart_to_stderr = True
+        sim.config(cfg)
 
     if mode == "kernel":
         sim = sim.kernel(target)
@@ -328,10 +357,8 @@ def main() -> None:
         exit_code = cpu.run(limit=args.limit, stats_sections=stats_sections)
 
     if args.json and exit_code is not None:
-        import json
-
         with open(args.json, "w") as f:
-            json.dump(dict(cpu.stats), f, indent=2)
+            f.write(cpu.stats_json())
 
     sys.exit(exit_code if exit_code is not None else 1)
 
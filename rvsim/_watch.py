@@ -137,6 +137,12 @@ def run_watch(
     tmp = tempfile.TemporaryFile()
     os.dup2(tmp.fileno(), stderr_fd)
 
+    # Bound once: the loop runs a chunk per frame, so skip the attribute
+    # lookups and keyword parsing, and refill one stats dict in place.
+    run = cpu.run
+    update_stats = cpu.update_stats
+    stats: dict = {}
+
     live = Live(console=console, refresh_per_second=4, screen=False)
     live.start()
     try:
@@ -148,14 +154,15 @@ def run_watch(
                     break
                 chunk = min(chunk, remaining)
 
-            code = cpu.run(limit=chunk, stats_sections=None)
+            code = run(chunk)
             cycles_run += chunk
 
             if code is not None:
                 exit_code = code
 
             wall = time.monotonic() - start
-            live.update(_build(dict(cpu.stats), wall, binary, exit_code is not None))
+            update_stats(stats)
+            live.update(_build(stats, wall, binary, exit_code is not None))
 
             if exit_code is not None:
                 # Render the final "done" frame explicitly, then stop before
@@ -8,13 +8,16 @@ dict that the Rust backend expects.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import functools
+import json
+from typing import Any, Dict, Final, Optional
 
 __all__ = ["Config"]
 
 from .types import (
     _DISABLED_CACHE_DICT,
     _DISABLED_CACHE_DICT_ZERO,
+    _ReadOnlyDict,
     Backend,
     BranchPredictor,
     Cache,
@@ -26,8 +29,18 @@ from .types import (
     _parse_size,
 )
 
+try:
+    import orjson as _orjson
+except ImportError:  # optional; the stdlib encoder produces equivalent JSON
+    _orjson = None
+
 _START_PC_DEFAULT = 0x8000_0000
 
+# Default for Config parameters that hold objects. Each Config builds its own
+# instances instead of sharing ones evaluated once in the signature, so that
+# mutating one config's caches or predictor never leaks into another config.
+_DEFAULT: Final = object()
+
 
 class Config:
     """
@@ -46,27 +59,60 @@ class Config:
         )
     """
 
+    __slots__ = (
+        "width",
+        "branch_predictor",
+        "backend",
+        "mem_dep_predictor",
+        "btb_size",
+        "btb_ways",
+        "ras_size",
+        "l1i",
+        "l1d",
+        "l2",
+        "l3",
+        "inclusion_policy",
+        "wcb_entries",
+        "ram_size",
+        "memory_controller",
+        "tlb_size",
+        "l2_tlb_size",
+        "l2_tlb_ways",
+        "l2_tlb_latency",
+        "software_ad_bits",
+        "misaligned_access_trap",
+        "trace",
+        "initial_sp",
+        "ram_base",
+        "uart_base",
+        "disk_base",
+        "clint_base",
+        "syscon_base",
+        "kernel_offset",
+        "bus_width",
+        "bus_latency",
+        "clint_divider",
+        "uart_to_stderr",
+        "uart_quiet",
+    )
+
     def __init__(
         self,
         # Pipeline
         width: int = 4,
-        branch_predictor: "BranchPredictor.Static | BranchPredictor.GShare | BranchPredictor.TAGE | BranchPredictor.Perceptron | BranchPredictor.Tournament" = BranchPredictor.TAGE(),
-        backend: "Backend.InOrder | Backend.OutOfOrder" = Backend.OutOfOrder(),
-        mem_dep_predictor: "MemDepPredictor.Blind | MemDepPredictor.StoreSet" = MemDepPredictor.Blind(),
+        branch_predictor: "BranchPredictor.Static | BranchPredictor.GShare | BranchPredictor.TAGE | BranchPredictor.Perceptron | BranchPredictor.Tournament" = _DEFAULT,
+        backend: "Backend.InOrder | Backend.OutOfOrder" = _DEFAULT,
+        mem_dep_predictor: "MemDepPredictor.Blind | MemDepPredictor.StoreSet" = _DEFAULT,
         btb_size: int = 4096,
         btb_ways: int = 4,
         ras_size: int = 32,
-        # Caches (None = disabled)
-        l1i=Cache("32KB", ways=4, latency=1, prefetcher=Prefetcher.NextLine(degree=1)),
-        l1d=Cache(
-            "32KB",
-            ways=4,
-            latency=1,
-            prefetcher=Prefetcher.Stride(degree=1, table_size=64),
-        ),
-        l2=Cache("256KB", ways=8, latency=10),
+        # Caches (None = disabled). Defaults: 32KB 4-way L1I (next-line),
+        # 32KB 4-way L1D (stride), 256KB 8-way L2.
+        l1i=_DEFAULT,
+        l1d=_DEFAULT,
+        l2=_DEFAULT,
         l3: Optional[Cache] = None,
-        inclusion_policy: Any = Cache.NINE(),
+        inclusion_policy: Any = _DEFAULT,
         wcb_entries: int = 0,
         # Memory
         ram_size="256MB",
@@ -95,19 +141,40 @@ class Config:
     ):
         # Pipeline
         self.width = width
-        self.branch_predictor = branch_predictor
+        self.branch_predictor = (
+            BranchPredictor.TAGE() if branch_predictor is _DEFAULT else branch_predictor
+        )
+        if backend is _DEFAULT:
+            backend = Backend.OutOfOrder()
         self.backend = backend if backend is not None else Backend.InOrder()
-        self.mem_dep_predictor = mem_dep_predictor
+        self.mem_dep_predictor = (
+            MemDepPredictor.Blind() if mem_dep_predictor is _DEFAULT else mem_dep_predictor
+        )
         self.btb_size = btb_size
         self.btb_ways = btb_ways
         self.ras_size = ras_size
 
         # Caches
-        self.l1i = l1i
-        self.l1d = l1d
-        self.l2 = l2
+        self.l1i = (
+            Cache("32KB", ways=4, latency=1, prefetcher=Prefetcher.NextLine(degree=1))
+            if l1i is _DEFAULT
+            else l1i
+        )
+        self.l1d = (
+            Cache(
+                "32KB",
+                ways=4,
+                latency=1,
+                prefetcher=Prefetcher.Stride(degree=1, table_size=64),
+            )
+            if l1d is _DEFAULT
+            else l1d
+        )
+        self.l2 = Cache("256KB", ways=8, latency=10) if l2 is _DEFAULT else l2
         self.l3 = l3
-        self.inclusion_policy = inclusion_policy
+        self.inclusion_policy = (
+            Cache.NINE() if inclusion_policy is _DEFAULT else inclusion_policy
+        )
         self.wcb_entries = wcb_entries
 
         # Memory
@@ -154,47 +221,21 @@ class Config:
             wide = base.replace(width=8)
             ooo  = base.replace(backend=Backend.OutOfOrder(rob_size=128))
         """
-        # Collect all current field values
-        fields = dict(
-            width=self.width,
-            branch_predictor=self.branch_predictor,
-            backend=self.backend,
-            btb_size=self.btb_size,
-            btb_ways=self.btb_ways,
-            ras_size=self.ras_size,
-            l1i=self.l1i,
-            l1d=self.l1d,
-            l2=self.l2,
-            l3=self.l3,
-            inclusion_policy=self.inclusion_policy,
-            wcb_entries=self.wcb_entries,
-            ram_size=self.ram_size,
-            memory_controller=self.memory_controller,
-            tlb_size=self.tlb_size,
-            l2_tlb_size=self.l2_tlb_size,
-            l2_tlb_ways=self.l2_tlb_ways,
-            l2_tlb_latency=self.l2_tlb_latency,
-            software_ad_bits=self.software_ad_bits,
-            misaligned_access_trap=self.misaligned_access_trap,
-            trace=self.trace,
-            initial_sp=self.initial_sp,
-            ram_base=self.ram_base,
-            uart_base=self.uart_base,
-            disk_base=self.disk_base,
-            clint_base=self.clint_base,
-            syscon_base=self.syscon_base,
-            kernel_offset=self.kernel_offset,
-            bus_width=self.bus_width,
-            bus_latency=self.bus_latency,
-            clint_divider=self.clint_divider,
-            uart_to_stderr=self.uart_to_stderr,
-            uart_quiet=self.uart_quiet,
-        )
-        unknown = set(kwargs) - set(fields)
+        unknown = set(kwargs) - set(Config.__slots__)
         if unknown:
             raise TypeError(f"Config.replace() got unexpected fields: {unknown}")
-        fields.update(kwargs)
-        return Config(**fields)  # type: ignore[arg-type]
+        # Clone slot-by-slot rather than re-running __init__ over every field;
+        # only the overridden values need normalizing.
+        new = object.__new__(type(self))
+        for name in Config.__slots__:
+            setattr(new, name, kwargs[name] if name in kwargs else getattr(self, name))
+        if "ram_size" in kwargs:
+            new.ram_size = _parse_size(kwargs["ram_size"])
+        if "backend" in kwargs and kwargs["backend"] is None:
+            new.backend = Backend.InOrder()
+        if "memory_controller" in kwargs and kwargs["memory_controller"] is None:
+            new.memory_controller = MemoryController.Simple()
+        return new
 
     def __repr__(self) -> str:
         parts = [
@@ -215,195 +256,285 @@ class Config:
 
 def _config_to_dict(config) -> Dict[str, Any]:
     """Normalize config to a dict for the Rust backend. Accepts Config or plain dict."""
-    if hasattr(config, "to_dict") and callable(getattr(config, "to_dict")):
-        return config.to_dict()
     if isinstance(config, dict):
         return config
+    # Look the method up on the type: no bound-method allocation, and no
+    # AttributeError raised and swallowed as hasattr() would for a miss.
+    to_dict = getattr(type(config), "to_dict", None)
+    if callable(to_dict):
+        return to_dict(config)
     raise TypeError("config must be Config or dict")
 
 
+def _config_to_json(config) -> bytes:
+    """Encode a config as the JSON payload ``Cpu()`` parses directly with serde.
+
+    Pre-encoding lets the Rust side skip its own ``json.dumps`` round-trip over
+    the nested dict. Bytes pass through unchanged so callers can encode once and
+    reuse the payload across runs. Uses ``orjson`` when it is installed.
+
+    The two encoders produce equivalent JSON but not identical bytes: orjson
+    writes non-ASCII text as raw UTF-8 rather than ``\\u`` escapes, and writes
+    NaN and infinities as ``null`` where ``json.dumps`` writes ``NaN``.
+    Non-finite floats are not supported in configs on the orjson path.
+    """
+    if isinstance(config, bytes):
+        return config
+    d = _config_to_dict(config)
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(d)
+        except TypeError:
+            # Hand-written dicts may use keys orjson rejects (e.g. ints).
+            pass
+    return json.dumps(d, separators=(",", ":")).encode()
+
+
+@functools.lru_cache(maxsize=2)
+def _default_config_json(uart_to_stderr: bool = False) -> bytes:
+    """JSON payload for ``Config()`` defaults, built once per process.
+
+    Returned as immutable ``bytes`` so the cached value can be shared safely.
+    *uart_to_stderr* selects the kernel-mode variant used by ``Simulator``.
+    """
+    return _config_to_json(Config(uart_to_stderr=uart_to_stderr))
+
+
 # ── Serialization helpers (private) ──────────────────────────────────────────
 
 
+def _type_lookup(table: Dict[type, Any], obj) -> Any:
+    """Return ``table``'s entry for ``type(obj)`` or its nearest base, else None.
+
+    Dispatches on ``type(obj)`` with a single dict probe instead of a chain
+    of ``isinstance`` checks; subclasses fall back to an MRO walk.
+    """
+    value = table.get(type(obj))
+    if value is not None:
+        return value
+    for base in type(obj).__mro__[1:]:
+        value = table.get(base)
+        if value is not None:
+            return value
+    return None
+
+
+def _type_name(table: Dict[type, str], obj, kind: str) -> str:
+    """Look up the Rust-side name for a namespace-type instance."""
+    name = _type_lookup(table, obj)
+    if name is None:
+        raise TypeError(f"Unknown {kind} type: {type(obj)}")
+    return name
+
+
+_BP_NAMES: Final[Dict[type, str]] = {
+    BranchPredictor.Static: "Static",
+    BranchPredictor.GShare: "GShare",
+    BranchPredictor.TAGE: "TAGE",
+    BranchPredictor.Perceptron: "Perceptron",
+    BranchPredictor.Tournament: "Tournament",
+    BranchPredictor.ScLTage: "ScLTage",
+}
+
+_MDP_NAMES: Final[Dict[type, str]] = {
+    MemDepPredictor.Blind: "Blind",
+    MemDepPredictor.StoreSet: "StoreSet",
+}
+
+_REPLACEMENT_POLICY_NAMES: Final[Dict[type, str]] = {
+    ReplacementPolicy.LRU: "LRU",
+    ReplacementPolicy.PLRU: "PLRU",
+    ReplacementPolicy.FIFO: "FIFO",
+    ReplacementPolicy.Random: "Random",
+    ReplacementPolicy.MRU: "MRU",
+}
+
+_PREFETCHER_NAMES: Final[Dict[type, str]] = {
+    Prefetcher.Off: "None",
+    Prefetcher.NextLine: "NextLine",
+    Prefetcher.Stride: "Stride",
+    Prefetcher.Stream: "Stream",
+    Prefetcher.Tagged: "Tagged",
+}
+
+_INCLUSION_POLICY_NAMES: Final[Dict[type, str]] = {
+    Cache.NINE: "NINE",
+    Cache.Inclusive: "Inclusive",
+    Cache.Exclusive: "Exclusive",
+}
+
+_MC_NAMES: Final[Dict[type, str]] = {
+    MemoryController.Simple: "Simple",
+    MemoryController.DRAM: "Dram",
+}
+
+_BACKEND_NAMES: Final[Dict[type, str]] = {
+    Backend.InOrder: "InOrder",
+    Backend.OutOfOrder: "OutOfOrder",
+}
+
+# Fu unit class -> (count key, latency key) in the Rust ``fu_config`` dict.
+_FU_KEYS: Final[Dict[type, "tuple[str, str]"]] = {
+    Fu.IntAlu: ("num_int_alu", "int_alu_latency"),
+    Fu.IntMul: ("num_int_mul", "int_mul_latency"),
+    Fu.IntDiv: ("num_int_div", "int_div_latency"),
+    Fu.FpAdd: ("num_fp_add", "fp_add_latency"),
+    Fu.FpMul: ("num_fp_mul", "fp_mul_latency"),
+    Fu.FpFma: ("num_fp_fma", "fp_fma_latency"),
+    Fu.FpDivSqrt: ("num_fp_div_sqrt", "fp_div_sqrt_latency"),
+    Fu.Branch: ("num_branch", "branch_latency"),
+    Fu.Mem: ("num_mem", "mem_latency"),
+}
+
+
 def _bp_name(bp) -> str:
     """Return the branch predictor name string for the Rust backend."""
-    if isinstance(bp, BranchPredictor.Static):
-        return "Static"
-    if isinstance(bp, BranchPredictor.GShare):
-        return "GShare"
-    if isinstance(bp, BranchPredictor.TAGE):
-        return "TAGE"
-    if isinstance(bp, BranchPredictor.Perceptron):
-        return "Perceptron"
-    if isinstance(bp, BranchPredictor.Tournament):
-        return "Tournament"
-    if isinstance(bp, BranchPredictor.ScLTage):
-        return "ScLTage"
-    raise TypeError(f"Unknown branch predictor type: {type(bp)}")
+    return _type_name(_BP_NAMES, bp, "branch predictor")
+
+
+# Precomputed (dict key, attribute) plans for the sub-config dicts. Each
+# builder is a single comprehension over its plan instead of a hand-written
+# literal per predictor type.
+_TAGE_FIELDS = (
+    ("num_banks", "num_banks"),
+    ("table_size", "table_size"),
+    ("loop_table_size", "loop_table_size"),
+    ("reset_interval", "reset_interval"),
+    ("history_lengths", "history_lengths"),
+    ("tag_widths", "tag_widths"),
+)
+
+_BP_SUB_FIELDS: Final[Dict[type, tuple]] = {
+    BranchPredictor.TAGE: _TAGE_FIELDS,
+    BranchPredictor.ScLTage: _TAGE_FIELDS,
+    BranchPredictor.Perceptron: (
+        ("history_length", "history_length"),
+        ("table_bits", "table_bits"),
+    ),
+    BranchPredictor.Tournament: (
+        ("global_size_bits", "global_size_bits"),
+        ("local_hist_bits", "local_hist_bits"),
+        ("local_pred_bits", "local_pred_bits"),
+    ),
+}
+
+# Branch predictor class -> pipeline sub-config key its fields serialize into.
+_BP_SUB_SLOT: Final[Dict[type, str]] = {
+    BranchPredictor.TAGE: "tage",
+    BranchPredictor.ScLTage: "tage",
+    BranchPredictor.Perceptron: "perceptron",
+    BranchPredictor.Tournament: "tournament",
+}
+
+_SC_FIELDS = (
+    ("num_tables", "sc_num_tables"),
+    ("table_size", "sc_table_size"),
+    ("history_lengths", "sc_history_lengths"),
+    ("counter_bits", "sc_counter_bits"),
+    ("bias_table_size", "sc_bias_table_size"),
+    ("bias_counter_bits", "sc_bias_counter_bits"),
+    ("initial_threshold", "sc_initial_threshold"),
+    ("per_pc_threshold_bits", "sc_per_pc_threshold_bits"),
+)
+
+_ITTAGE_FIELDS = (
+    ("num_banks", "ittage_num_banks"),
+    ("table_size", "ittage_table_size"),
+    ("history_lengths", "ittage_history_lengths"),
+    ("tag_widths", "ittage_tag_widths"),
+    ("reset_interval", "ittage_reset_interval"),
+)
+
+_STORE_SET_FIELDS = (
+    ("ssit_size", "ssit_size"),
+    ("lfst_size", "lfst_size"),
+)
+
+_OOO_FIELDS = (
+    ("rob_size", "rob_size"),
+    ("store_buffer_size", "store_buffer_size"),
+    ("issue_queue_size", "issue_queue_size"),
+    ("load_queue_size", "load_queue_size"),
+    ("load_ports", "load_ports"),
+    ("store_ports", "store_ports"),
+    ("prf_gpr_size", "prf_gpr_size"),
+    ("prf_fpr_size", "prf_fpr_size"),
+    ("checkpoint_count", "checkpoint_count"),
+)
+
+
+def _fields_to_dict(obj, plan) -> dict:
+    """Build a sub-config dict from a ``(key, attribute)`` plan."""
+    return {key: getattr(obj, attr) for key, attr in plan}
 
 
 def _bp_sub_dict(bp) -> dict:
     """Return the branch predictor sub-config dict."""
-    if isinstance(bp, (BranchPredictor.TAGE, BranchPredictor.ScLTage)):
-        return {
-            "num_banks": bp.num_banks,
-            "table_size": bp.table_size,
-            "loop_table_size": bp.loop_table_size,
-            "reset_interval": bp.reset_interval,
-            "history_lengths": bp.history_lengths,
-            "tag_widths": bp.tag_widths,
-        }
-    if isinstance(bp, BranchPredictor.Perceptron):
-        return {
-            "history_length": bp.history_length,
-            "table_bits": bp.table_bits,
-        }
-    if isinstance(bp, BranchPredictor.Tournament):
-        return {
-            "global_size_bits": bp.global_size_bits,
-            "local_hist_bits": bp.local_hist_bits,
-            "local_pred_bits": bp.local_pred_bits,
-        }
-    return {}
+    plan = _type_lookup(_BP_SUB_FIELDS, bp)
+    return _fields_to_dict(bp, plan) if plan is not None else {}
 
 
 def _sc_sub_dict(bp) -> dict:
     """Return the SC sub-config dict for ScLTage."""
     if isinstance(bp, BranchPredictor.ScLTage):
-        return {
-            "num_tables": bp.sc_num_tables,
-            "table_size": bp.sc_table_size,
-            "history_lengths": bp.sc_history_lengths,
-            "counter_bits": bp.sc_counter_bits,
-            "bias_table_size": bp.sc_bias_table_size,
-            "bias_counter_bits": bp.sc_bias_counter_bits,
-            "initial_threshold": bp.sc_initial_threshold,
-            "per_pc_threshold_bits": bp.sc_per_pc_threshold_bits,
-        }
-    return {
-        "num_tables": 6,
-        "table_size": 512,
-        "history_lengths": [0, 2, 4, 8, 12, 16],
-        "counter_bits": 3,
-        "bias_table_size": 256,
-        "bias_counter_bits": 6,
-        "initial_threshold": 35,
-        "per_pc_threshold_bits": 6,
-    }
+        return _fields_to_dict(bp, _SC_FIELDS)
+    return _SC_DEFAULTS
 
 
 def _ittage_sub_dict(bp) -> dict:
     """Return the ITTAGE sub-config dict for ScLTage."""
     if isinstance(bp, BranchPredictor.ScLTage):
-        return {
-            "num_banks": bp.ittage_num_banks,
-            "table_size": bp.ittage_table_size,
-            "history_lengths": bp.ittage_history_lengths,
-            "tag_widths": bp.ittage_tag_widths,
-            "reset_interval": bp.ittage_reset_interval,
-        }
-    return {
-        "num_banks": 8,
-        "table_size": 256,
-        "history_lengths": [4, 8, 16, 32, 64, 128, 256, 512],
-        "tag_widths": [9, 9, 10, 10, 11, 11, 12, 12],
-        "reset_interval": 256_000,
-    }
+        return _fields_to_dict(bp, _ITTAGE_FIELDS)
+    return _ITTAGE_DEFAULTS
 
 
 def _mdp_name(mdp) -> str:
     """Return the memory dependence predictor name string for the Rust backend."""
-    if isinstance(mdp, MemDepPredictor.Blind):
-        return "Blind"
-    if isinstance(mdp, MemDepPredictor.StoreSet):
-        return "StoreSet"
-    raise TypeError(f"Unknown memory dependence predictor type: {type(mdp)}")
+    return _type_name(_MDP_NAMES, mdp, "memory dependence predictor")
 
 
 def _mdp_sub_dict(mdp) -> dict:
     """Return the MDP sub-config dict."""
     if isinstance(mdp, MemDepPredictor.StoreSet):
-        return {
-            "ssit_size": mdp.ssit_size,
-            "lfst_size": mdp.lfst_size,
-        }
+        return _fields_to_dict(mdp, _STORE_SET_FIELDS)
     return {}
 
 
 def _replacement_policy_name(policy) -> str:
     """Return the replacement policy name string for the Rust backend."""
-    if isinstance(policy, ReplacementPolicy.LRU):
-        return "LRU"
-    if isinstance(policy, ReplacementPolicy.PLRU):
-        return "PLRU"
-    if isinstance(policy, ReplacementPolicy.FIFO):
-        return "FIFO"
-    if isinstance(policy, ReplacementPolicy.Random):
-        return "Random"
-    if isinstance(policy, ReplacementPolicy.MRU):
-        return "MRU"
-    raise TypeError(f"Unknown replacement policy type: {type(policy)}")
+    return _type_name(_REPLACEMENT_POLICY_NAMES, policy, "replacement policy")
 
 
 def _prefetcher_name(pf) -> str:
     """Return the prefetcher name string for the Rust backend."""
-    if isinstance(pf, Prefetcher.Off):
-        return "None"
-    if isinstance(pf, Prefetcher.NextLine):
-        return "NextLine"
-    if isinstance(pf, Prefetcher.Stride):
-        return "Stride"
-    if isinstance(pf, Prefetcher.Stream):
-        return "Stream"
-    if isinstance(pf, Prefetcher.Tagged):
-        return "Tagged"
-    raise TypeError(f"Unknown prefetcher type: {type(pf)}")
+    return _type_name(_PREFETCHER_NAMES, pf, "prefetcher")
 
 
 def _prefetcher_degree(pf) -> int:
-    """Return the prefetcher degree."""
-    if isinstance(
-        pf,
-        (Prefetcher.NextLine, Prefetcher.Stride, Prefetcher.Stream, Prefetcher.Tagged),
-    ):
-        return pf.degree
-    return 0
+    """Return the prefetcher degree (0 for prefetchers without one)."""
+    # Only the prefetchers that take a degree have the slot, so the attribute
+    # itself is the dispatch; no isinstance chain per serialized cache.
+    return getattr(pf, "degree", 0)
 
 
 def _prefetcher_table_size(pf) -> int:
-    """Return the prefetcher table size."""
-    if isinstance(pf, Prefetcher.Stride):
-        return pf.table_size
-    return 0
+    """Return the prefetcher table size (0 for prefetchers without one)."""
+    return getattr(pf, "table_size", 0)
 
 
 def _inclusion_policy_name(ip) -> str:
     """Return the inclusion policy name string for the Rust backend."""
-    if isinstance(ip, Cache.NINE):
-        return "NINE"
-    if isinstance(ip, Cache.Inclusive):
-        return "Inclusive"
-    if isinstance(ip, Cache.Exclusive):
-        return "Exclusive"
-    raise TypeError(f"Unknown inclusion policy type: {type(ip)}")
+    return _type_name(_INCLUSION_POLICY_NAMES, ip, "inclusion policy")
 
 
 def _mc_name(mc) -> str:
     """Return the memory controller name string for the Rust backend."""
-    if isinstance(mc, MemoryController.Simple):
-        return "Simple"
-    if isinstance(mc, MemoryController.DRAM):
-        return "Dram"
-    raise TypeError(f"Unknown memory controller type: {type(mc)}")
+    return _type_name(_MC_NAMES, mc, "memory controller")
 
 
 def _backend_name(be) -> str:
     """Return the backend name string for the Rust backend."""
-    if isinstance(be, Backend.InOrder):
-        return "InOrder"
-    if isinstance(be, Backend.OutOfOrder):
-        return "OutOfOrder"
-    raise TypeError(f"Unknown backend type: {type(be)}")
+    return _type_name(_BACKEND_NAMES, be, "backend")
 
 
 def _fu_config_to_dict(fc: Fu) -> dict:
@@ -431,55 +562,29 @@ def _fu_config_to_dict(fc: Fu) -> dict:
         "mem_latency": 1,
     }
     for u in fc.units:
-        if isinstance(u, Fu.IntAlu):
-            d["num_int_alu"] = u.count
-            d["int_alu_latency"] = u.latency
-        elif isinstance(u, Fu.IntMul):
-            d["num_int_mul"] = u.count
-            d["int_mul_latency"] = u.latency
-        elif isinstance(u, Fu.IntDiv):
-            d["num_int_div"] = u.count
-            d["int_div_latency"] = u.latency
-        elif isinstance(u, Fu.FpAdd):
-            d["num_fp_add"] = u.count
-            d["fp_add_latency"] = u.latency
-        elif isinstance(u, Fu.FpMul):
-            d["num_fp_mul"] = u.count
-            d["fp_mul_latency"] = u.latency
-        elif isinstance(u, Fu.FpFma):
-            d["num_fp_fma"] = u.count
-            d["fp_fma_latency"] = u.latency
-        elif isinstance(u, Fu.FpDivSqrt):
-            d["num_fp_div_sqrt"] = u.count
-            d["fp_div_sqrt_latency"] = u.latency
-        elif isinstance(u, Fu.Branch):
-            d["num_branch"] = u.count
-            d["branch_latency"] = u.latency
-        elif isinstance(u, Fu.Mem):
-            d["num_mem"] = u.count
-            d["mem_latency"] = u.latency
-        else:
+        keys = _type_lookup(_FU_KEYS, u)
+        if keys is None:
             raise TypeError(f"Unknown Fu type: {type(u)}")
+        d[keys[0]] = u.count
+        d[keys[1]] = u.latency
     return d
 
 
 def _backend_to_pipeline_fields(be) -> dict:
     """Return pipeline-level fields that come from the backend object."""
     if isinstance(be, Backend.OutOfOrder):
-        return {
-            "rob_size": be.rob_size,
-            "store_buffer_size": be.store_buffer_size,
-            "issue_queue_size": be.issue_queue_size,
-            "load_queue_size": be.load_queue_size,
-            "load_ports": be.load_ports,
-            "store_ports": be.store_ports,
-            "prf_gpr_size": be.prf_gpr_size,
-            "prf_fpr_size": be.prf_fpr_size,
-            "fu_config": _fu_config_to_dict(be.fu_config),
-            "checkpoint_count": be.checkpoint_count,
-        }
-    # InOrder: emit safe defaults so Rust serde never chokes on missing keys
-    return {
+        d = _fields_to_dict(be, _OOO_FIELDS)
+        d["fu_config"] = _fu_config_to_dict(be.fu_config)
+        return d
+    # InOrder has no fields of its own; the defaults are precomputed below.
+    return _INORDER_PIPELINE_FIELDS
+
+
+# InOrder: emit safe defaults so Rust serde never chokes on missing keys.
+# Built once instead of walking a fresh Fu() pool on every serialization;
+# every InOrder to_dict() result shares the fu_config dict, so it is read-only.
+_INORDER_PIPELINE_FIELDS: Final[Dict[str, Any]] = _ReadOnlyDict(
+    {
         "rob_size": 64,
         "store_buffer_size": 16,
         "issue_queue_size": 32,
@@ -488,8 +593,9 @@ def _backend_to_pipeline_fields(be) -> dict:
         "store_ports": 1,
         "prf_gpr_size": 64,
         "prf_fpr_size": 64,
-        "fu_config": _fu_config_to_dict(Fu()),
+        "fu_config": _ReadOnlyDict(_fu_config_to_dict(Fu())),
     }
+)
 
 
 def _cache_to_dict(c: Cache) -> Dict[str, Any]:
@@ -530,6 +636,35 @@ _TOURNAMENT_DEFAULTS = {
     "local_pred_bits": 10,
 }
 
+# Every Config.to_dict() result shares the dicts below, so they are read-only
+# and hold tuples rather than lists (both serialize as JSON arrays).
+_SC_DEFAULTS: Final[Dict[str, Any]] = _ReadOnlyDict(
+    {
+        "num_tables": 6,
+        "table_size": 512,
+        "history_lengths": (0, 2, 4, 8, 12, 16),
+        "counter_bits": 3,
+        "bias_table_size": 256,
+        "bias_counter_bits": 6,
+        "initial_threshold": 35,
+        "per_pc_threshold_bits": 6,
+    }
+)
+
+_ITTAGE_DEFAULTS: Final[Dict[str, Any]] = _ReadOnlyDict(
+    {
+        "num_banks": 8,
+        "table_size": 256,
+        "history_lengths": (4, 8, 16, 32, 64, 128, 256, 512),
+        "tag_widths": (9, 9, 10, 10, 11, 11, 12, 12),
+        "reset_interval": 256_000,
+    }
+)
+
+_STORE_SET_DEFAULTS: Final[Dict[str, Any]] = _ReadOnlyDict(
+    {"ssit_size": 2048, "lfst_size": 256}
+)
+
 
 def _config_to_dict_impl(cfg: Config) -> Dict[str, Any]:
     """Produce the nested dict expected by the Rust backend."""
@@ -601,22 +736,16 @@ def _config_to_dict_impl(cfg: Config) -> Dict[str, Any]:
     }
 
     # Pipeline — always emit all BP sub-configs with defaults
+    # Only the selected predictor's slot is built; the others share defaults.
     bp = cfg.branch_predictor
-    tage_dict = (
-        _bp_sub_dict(bp)
-        if isinstance(bp, (BranchPredictor.TAGE, BranchPredictor.ScLTage))
-        else _TAGE_DEFAULTS
-    )
-    perceptron_dict = (
-        _bp_sub_dict(bp)
-        if isinstance(bp, BranchPredictor.Perceptron)
-        else _PERCEPTRON_DEFAULTS
-    )
-    tournament_dict = (
-        _bp_sub_dict(bp)
-        if isinstance(bp, BranchPredictor.Tournament)
-        else _TOURNAMENT_DEFAULTS
-    )
+    bp_subs = {
+        "tage": _TAGE_DEFAULTS,
+        "perceptron": _PERCEPTRON_DEFAULTS,
+        "tournament": _TOURNAMENT_DEFAULTS,
+    }
+    slot = _type_lookup(_BP_SUB_SLOT, bp)
+    if slot is not None:
+        bp_subs[slot] = _bp_sub_dict(bp)
     sc_dict = _sc_sub_dict(bp)
     ittage_dict = _ittage_sub_dict(bp)
 
@@ -625,7 +754,7 @@ def _config_to_dict_impl(cfg: Config) -> Dict[str, Any]:
     store_set_dict = (
         _mdp_sub_dict(mdp)
         if isinstance(mdp, MemDepPredictor.StoreSet)
-        else {"ssit_size": 2048, "lfst_size": 256}
+        else _STORE_SET_DEFAULTS
     )
 
     pipeline = {
@@ -635,9 +764,9 @@ def _config_to_dict_impl(cfg: Config) -> Dict[str, Any]:
         "btb_ways": cfg.btb_ways,
         "ras_size": cfg.ras_size,
         "backend": _backend_name(cfg.backend),
-        "tage": tage_dict,
-        "perceptron": perceptron_dict,
-        "tournament": tournament_dict,
+        "tage": bp_subs["tage"],
+        "perceptron": bp_subs["perceptron"],
+        "tournament": bp_subs["tournament"],
         "sc": sc_dict,
         "ittage": ittage_dict,
         "mem_dep_predictor": _mdp_name(mdp),
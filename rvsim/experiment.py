@@ -8,27 +8,100 @@ Provides:
 
 from __future__ import annotations
 
+import json
+import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 __all__ = ["Environment", "Result"]
 
-from .config import Config, _config_to_dict
+from .config import Config, _config_to_dict, _config_to_json, _default_config_json
 from .stats import Stats, _compare_flat, _compare_matrix
 
 from ._core import Cpu
 
 
-@dataclass
+# ── Binary cache ─────────────────────────────────────────────────────────────
+#
+# ELF bytes are reused across runs while a file's (mtime_ns, size) is unchanged.
+# A file rewritten within the filesystem's mtime granularity at the same size
+# looks unchanged and can be served stale; touch it (or call
+# ``_clear_binary_cache()``) after rewriting a binary mid-session.
+
+# Binaries larger than this are not cached: ``Cpu`` reads them from the path
+# itself, so a large image is never held in (or copied through) Python.
+_BINARY_CACHE_MAX = 16 * 1024 * 1024
+
+# Total bytes the cache may hold; least recently used files are dropped first.
+_BINARY_CACHE_BYTES = 64 * 1024 * 1024
+
+# path -> (mtime_ns, size, data), least recently used first.
+_binary_cache: OrderedDict[str, Tuple[int, int, bytes]] = OrderedDict()
+_binary_cache_bytes = 0
+_binary_cache_lock = threading.Lock()
+
+
+def _read_binary(path: str, st: Optional[os.stat_result] = None) -> bytes:
+    """Read a binary, reusing the bytes across runs while the file is unchanged."""
+    global _binary_cache_bytes
+    if st is None:
+        st = os.stat(path)
+    with _binary_cache_lock:
+        entry = _binary_cache.get(path)
+        if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+            _binary_cache.move_to_end(path)
+            return entry[2]
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) > _BINARY_CACHE_MAX:
+        return data
+    with _binary_cache_lock:
+        old = _binary_cache.pop(path, None)
+        if old is not None:
+            _binary_cache_bytes -= len(old[2])
+        _binary_cache[path] = (st.st_mtime_ns, st.st_size, data)
+        _binary_cache_bytes += len(data)
+        while _binary_cache_bytes > _BINARY_CACHE_BYTES:
+            _, (_, _, evicted) = _binary_cache.popitem(last=False)
+            _binary_cache_bytes -= len(evicted)
+    return data
+
+
+def _clear_binary_cache() -> None:
+    """Drop every cached binary."""
+    global _binary_cache_bytes
+    with _binary_cache_lock:
+        _binary_cache.clear()
+        _binary_cache_bytes = 0
+
+
+def _elf_source(path: str) -> Dict[str, Any]:
+    """``Cpu()`` keyword argument supplying the ELF at *path*."""
+    st = os.stat(path)
+    if st.st_size > _BINARY_CACHE_MAX:
+        return {"elf_path": path}
+    return {"elf_data": _read_binary(path, st)}
+
+
+@dataclass(frozen=True, slots=True)
 class Environment:
-    """Immutable description of a simulation run for reproducibility."""
+    """Immutable description of a simulation run for reproducibility.
+
+    Environments are frozen: equal environments hash equally (when their config
+    is hashable, e.g. a :class:`Config` or JSON bytes), so they can key a dict of
+    results to deduplicate a sweep. Fields cannot be reassigned; derive a
+    variant with :func:`dataclasses.replace`.
+    """
 
     binary: str
     """Path to the RISC-V binary (bare-metal)."""
 
-    config: Optional[Union[Config, Dict[str, Any]]] = None
-    """Config or dict. If None, uses Config() defaults."""
+    config: Optional[Union[Config, Dict[str, Any], bytes]] = None
+    """Config, dict, or pre-encoded JSON bytes. If None, uses Config() defaults."""
 
     disk: Optional[str] = None
     """Optional disk image path."""
@@ -36,11 +109,36 @@ class Environment:
     load_addr: int = 0x8000_0000
     """Load address for the binary."""
 
+    _payload: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    def freeze(self) -> Environment:
+        """Encode the config once and reuse it for every subsequent :meth:`run`.
+
+        Later mutations of ``config`` (or of the objects it holds) are not seen
+        by ``run()`` after freezing. Returns ``self`` for chaining::
+
+            env = Environment(binary="qsort.elf", config=cfg).freeze()
+            results = [env.run() for _ in range(10)]
+        """
+        object.__setattr__(self, "_payload", self._encode_config())
+        return self
+
+    def _encode_config(self) -> bytes:
+        if self.config is None:
+            return _default_config_json()
+        return _config_to_json(self.config)
+
     def get_config(self) -> Dict[str, Any]:
         """Returns the config as a dict for the Rust backend."""
+        # Decode the frozen (or cached default) payload rather than walking the
+        # Config again; json.loads hands back a fresh dict the caller may mutate.
+        if self._payload is not None:
+            return json.loads(self._payload)
+        if isinstance(self.config, bytes):
+            return json.loads(self.config)
         if self.config is not None:
             return _config_to_dict(self.config)
-        return Config().to_dict()
+        return json.loads(_default_config_json())
 
     def run(
         self, quiet: bool = True, limit: Optional[int] = None, progress: int = 0
@@ -58,38 +156,57 @@ class Environment:
             result = env.run()
             print(result.stats["ipc"], result.stats["cycles"])
         """
-        config = self.get_config()
-        t0 = time.perf_counter()
+        config = self._payload if self._payload is not None else self._encode_config()
+        t0 = time.perf_counter_ns()
         try:
-            with open(self.binary, "rb") as f:
-                elf_data = f.read()
-            cpu = Cpu(config, elf_data=elf_data, disk_path=self.disk)
+            cpu = Cpu(config, disk_path=self.disk, **_elf_source(self.binary))
             exit_code = cpu.run(limit=limit, progress=progress)
             if exit_code is None and limit is None:
                 raise RuntimeError(
                     "CPU run completed without exit code (should not happen without limit)"
                 )
-            stats = cpu.stats
+            stats = Stats()
+            cpu.update_stats(stats)
         except Exception as e:
-            err_msg = str(e)
             if not quiet:
                 raise
-            return Result(
-                exit_code=-1,
-                stats=Stats({"error": err_msg}),
-                wall_time_sec=time.perf_counter() - t0,
-                binary=self.binary,
-            )
-        wall = time.perf_counter() - t0
+            exit_code = -1
+            stats = Stats(error=str(e))
         return Result(
-            exit_code=int(exit_code) if exit_code is not None else -1,
-            stats=Stats(stats),
-            wall_time_sec=wall,
+            exit_code=exit_code if exit_code is not None else -1,
+            stats=stats,
+            wall_time_sec=(time.perf_counter_ns() - t0) * 1e-9,
             binary=self.binary,
         )
 
+    @staticmethod
+    def run_all(
+        envs: Iterable[Environment],
+        *,
+        limit: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Result]:
+        """
+        Run several environments concurrently on threads in this process.
+
+        ``Cpu.run`` releases the GIL while simulating, so independent runs
+        scale across cores without a process pool. Each run is ``quiet``.
+
+        Args:
+            envs: Environments to run.
+            limit: Max cycles per run. ``None`` means unlimited.
+            max_workers: Worker threads. ``None`` uses the CPU count.
+
+        Returns:
+            One :class:`Result` per environment, in input order.
+        """
+        envs = list(envs)
+        workers = max(1, min(len(envs), max_workers or os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda env: env.run(limit=limit), envs))
+
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """Structured result of a single run."""
 
@@ -6,11 +6,10 @@ Provides callable namespace objects:
 - ``csr``: CSR lookup (``csr.MSTATUS`` → 0x300, ``csr("mstatus")`` → 0x300, ``csr.name(0x300)`` → ``"mstatus"``)
 """
 
-import struct
 import sys
 from typing import List, Optional, Tuple
 
-from ._core import disassemble
+from ._core import disassemble, disassemble_bytes
 
 __all__ = ["Disassemble", "reg", "csr"]
 
@@ -26,6 +25,8 @@ class Disassemble:
         Disassemble().inst(0x00a00513)  # single instruction -> str
     """
 
+    __slots__ = ("_data", "_base", "_offset", "_count")
+
     def __init__(self):
         self._data: Optional[bytes] = None
         self._base: int = 0x8000_0000
@@ -62,36 +63,25 @@ class Disassemble:
             raise ValueError(
                 "No data to disassemble. Call .binary() or .bytes() first."
             )
-        start = max(0, self._offset)
-        start = start & ~1  # align to 2 (smallest RVC instruction)
-        end = len(self._data)
-        result = []
-        off = start
-        while off < end - 1:
-            half = struct.unpack_from("<H", self._data, off)[0]
-            if half & 0x3 != 0x3:
-                # 16-bit compressed instruction
-                asm = disassemble(half)
-                result.append((self._base + off, half, asm))
-                off += 2
-            elif off + 3 < end:
-                # 32-bit instruction
-                inst = struct.unpack_from("<I", self._data, off)[0]
-                asm = disassemble(inst)
-                result.append((self._base + off, inst, asm))
-                off += 4
-            else:
-                break
-            if self._count is not None and len(result) >= self._count:
-                break
-        return result
+        start = max(0, self._offset) & ~1  # align to 2 (smallest RVC instruction)
+        # One native call walks and decodes the whole range with the GIL
+        # released, instead of one FFI round-trip per instruction. It reads
+        # from ``start`` in place, so the buffer is not sliced (copied) first.
+        data = self._data
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        return disassemble_bytes(data, self._base, self._count, start)
 
     def print(self, file=None) -> "Disassemble":
         if file is None:
             file = sys.stdout
-        for pc, raw, asm in self.decode():
-            width = 4 if raw > 0xFFFF else 8
-            print(f"0x{pc:08x}  {raw:0{width}x}  {asm}", file=file)
+        # Format every line first and hand the stream one write, rather than
+        # a print() call (and stream lookup) per instruction.
+        lines = [
+            f"0x{pc:08x}  {raw:0{4 if raw > 0xFFFF else 8}x}  {asm}\n"
+            for pc, raw, asm in self.decode()
+        ]
+        file.write("".join(lines))
         return self
 
 
@@ -135,7 +125,13 @@ _REG_NAMES: list[str] = [
 _REG_BY_NAME: dict[str, int] = {name: idx for idx, name in enumerate(_REG_NAMES)}
 _REG_BY_NAME["fp"] = 8
 for _i in range(32):
-    _REG_BY_NAME[f"x{_i}"] = _i
+    _REG_BY_NAME[sys.intern(f"x{_i}")] = _i
+# Uppercase spellings (``"RA"``, ``"X5"``) hit on the first lookup too; other
+# mixed-case names still fall back to ``.lower()``. Generated keys are interned
+# so lookups with string literals match by identity before comparing text.
+_REG_BY_NAME.update(
+    {sys.intern(name.upper()): idx for name, idx in list(_REG_BY_NAME.items())}
+)
 
 
 class _RegLookup:
@@ -147,8 +143,11 @@ class _RegLookup:
         reg.SP        # 2
         reg("ra")     # 1
         reg("x5")    # 5
+        reg.A0 in reg.ARGS   # True (hashed set membership)
     """
 
+    __slots__ = ()
+
     ZERO = 0
     RA = 1
     SP = 2
@@ -183,10 +182,17 @@ class _RegLookup:
     T5 = 30
     T6 = 31
 
+    # Calling-convention classes (RISC-V psABI), as frozensets of indices.
+    ARGS = frozenset(range(10, 18))
+    TEMPS = frozenset({5, 6, 7, 28, 29, 30, 31})
+    CALLER_SAVED = frozenset({1}) | ARGS | TEMPS
+    CALLEE_SAVED = frozenset({2, 8, 9} | set(range(18, 28)))
+
     def __call__(self, name) -> int:
         if isinstance(name, int):
             return name
-        return _REG_BY_NAME[name.lower()]
+        idx = _REG_BY_NAME.get(name)
+        return idx if idx is not None else _REG_BY_NAME[name.lower()]
 
     def name(self, idx: int) -> str:
         """Return the ABI name for a register index (e.g. ``reg.name(5)`` → ``"t0"``)."""
@@ -234,7 +240,14 @@ _CSR_BY_NAME: dict[str, int] = {
     "stimecmp": 0x14D,
 }
 
-_CSR_BY_ADDR: dict[int, str] = {addr: name for name, addr in _CSR_BY_NAME.items()}
+# CSR addresses are 12 bits, so a flat list indexed by address covers them all
+# and avoids hashing on the tracing path.
+_CSR_BY_ADDR: list[Optional[str]] = [None] * 0x1000
+for _name, _addr in _CSR_BY_NAME.items():
+    _CSR_BY_ADDR[_addr] = _name
+_CSR_BY_NAME.update(
+    {sys.intern(name.upper()): addr for name, addr in list(_CSR_BY_NAME.items())}
+)
 
 
 class _CsrLookup:
@@ -247,6 +260,8 @@ class _CsrLookup:
         csr("mstatus") # 0x300
     """
 
+    __slots__ = ()
+
     # Supervisor
     SSTATUS = 0x100
     SIE = 0x104
@@ -281,11 +296,16 @@ class _CsrLookup:
     def __call__(self, name) -> int:
         if isinstance(name, int):
             return name
-        return _CSR_BY_NAME[name.lower()]
+        addr = _CSR_BY_NAME.get(name)
+        return addr if addr is not None else _CSR_BY_NAME[name.lower()]
 
     def name(self, addr: int) -> str:
         """Return the CSR name for an address (e.g. ``csr.name(0x300)`` → ``"mstatus"``)."""
-        return _CSR_BY_ADDR.get(addr, f"csr_{addr:#05x}")
+        if 0 <= addr < 0x1000:
+            name = _CSR_BY_ADDR[addr]
+            if name is not None:
+                return name
+        return f"csr_{addr:#05x}"
 
     def __repr__(self) -> str:
         return "csr"
@@ -9,20 +9,36 @@ Provides:
 
 from __future__ import annotations
 
-import importlib.util
+import copy
+import functools
 import os
 import sys
+import types
 from typing import Optional
 
 __all__ = ["Cpu", "Simulator", "Instruction"]
 
 from ._cli import info, warn, error
 from ._core import Cpu, Instruction
-from .config import Config, _config_to_dict
+from .config import Config, _config_to_dict, _config_to_json, _default_config_json
 
 _UNSET = object()
 
 
+@functools.lru_cache(maxsize=32)
+def _load_config_module(path: str, mtime_ns: int):
+    """Import a config file once per (path, mtime); edits to the file reload it."""
+    # A plain compile + exec into a fresh module skips the import machinery
+    # (spec, loader, bytecode cache), which is all overhead for a small
+    # config script that is never imported by name.
+    with open(path, "rb") as f:
+        code = compile(f.read(), path, "exec")
+    mod = types.ModuleType("custom_config")
+    mod.__file__ = path
+    exec(code, mod.__dict__)
+    return mod
+
+
 class Simulator:
     """Fluent API for configuring and running the simulator.
 
@@ -37,6 +53,14 @@ class Simulator:
         exit_code = cpu.run(limit=10_000_000)
     """
 
+    __slots__ = (
+        "_kernel_path",
+        "_disk_path",
+        "_dtb_path",
+        "_binary_path",
+        "_config_obj",
+    )
+
     def __init__(self):
         self._kernel_path = None
         self._disk_path = None
@@ -60,54 +84,58 @@ class Simulator:
             return self
 
         path = path_or_config
-        if not os.path.exists(path):
-            if os.path.exists(os.path.join(os.getcwd(), path)):
-                path = os.path.join(os.getcwd(), path)
-            else:
-                print(warn(f"Config file {path} not found."), file=sys.stderr)
-                return self
+        # One stat both checks existence and keys the module cache. Relative
+        # paths already resolve against the working directory.
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            print(warn(f"Config file {path} not found."), file=sys.stderr)
+            return self
 
         try:
-            spec = importlib.util.spec_from_file_location("custom_config", path)
-            if spec and spec.loader:
-                mod = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(mod)
-
-                name = os.path.splitext(os.path.basename(path))[0]
-                if hasattr(mod, name):
-                    func = getattr(mod, name)
-                    if callable(func):
-                        self._config_obj = func()  # type: ignore[assignment]
-                        print(
-                            info("Simulator", f"Loaded config from {name}() in {path}"),
-                            file=sys.stderr,
-                        )
-                    else:
-                        print(
-                            warn(f"Found {name} in {path} but it is not callable."),
-                            file=sys.stderr,
-                        )
-                elif hasattr(mod, "config"):
-                    c = getattr(mod, "config")
-                    self._config_obj = c() if callable(c) else c  # type: ignore[assignment]
+            mod = _load_config_module(os.path.abspath(path), mtime_ns)
+            name = os.path.splitext(os.path.basename(path))[0]
+            if hasattr(mod, name):
+                func = getattr(mod, name)
+                if callable(func):
+                    self._config_obj = func()  # type: ignore[assignment]
                     print(
-                        info("Simulator", f"Loaded config from 'config' in {path}"),
-                        file=sys.stderr,
-                    )
-                elif hasattr(mod, "get_config"):
-                    self._config_obj = getattr(mod, "get_config")()  # type: ignore[assignment]
-                    print(
-                        info("Simulator", f"Loaded config from get_config() in {path}"),
+                        info("Simulator", f"Loaded config from {name}() in {path}"),
                         file=sys.stderr,
                     )
                 else:
                     print(
-                        warn(
-                            f"Could not find config entry point in {path}. "
-                            f"Expected function '{name}' or 'get_config' or variable 'config'."
-                        ),
+                        warn(f"Found {name} in {path} but it is not callable."),
                         file=sys.stderr,
                     )
+            elif hasattr(mod, "config"):
+                c = getattr(mod, "config")
+                if callable(c):
+                    c = c()
+                elif isinstance(c, Config):
+                    # The cached module is shared across calls; hand out a
+                    # deep copy so edits to the config or its nested cache
+                    # and predictor objects don't leak into later loads.
+                    c = copy.deepcopy(c)
+                self._config_obj = c  # type: ignore[assignment]
+                print(
+                    info("Simulator", f"Loaded config from 'config' in {path}"),
+                    file=sys.stderr,
+                )
+            elif hasattr(mod, "get_config"):
+                self._config_obj = getattr(mod, "get_config")()  # type: ignore[assignment]
+                print(
+                    info("Simulator", f"Loaded config from get_config() in {path}"),
+                    file=sys.stderr,
+                )
+            else:
+                print(
+                    warn(
+                        f"Could not find config entry point in {path}. "
+                        f"Expected function '{name}' or 'get_config' or variable 'config'."
+                    ),
+                    file=sys.stderr,
+                )
         except Exception as e:
             print(error(f"Loading config {path}: {e}"), file=sys.stderr)
 
@@ -139,28 +167,32 @@ class Simulator:
             A configured :class:`Cpu` instance ready for ``run()``, ``step()``, etc.
         """
         print(info("Simulator", "Setting up...", stderr=True), file=sys.stderr)
+        is_kernel_mode = self._kernel_path is not None
         if self._config_obj is None:
             print(
                 info("Simulator", "No config loaded, using defaults.", stderr=True),
                 file=sys.stderr,
             )
-            self._config_obj = Config()
-
-        is_kernel_mode = self._kernel_path is not None
-        if is_kernel_mode:
-            self._config_obj.uart_to_stderr = True
-
-        config_dict = _config_to_dict(self._config_obj)
-
-        # Read ELF data if in bare-metal mode
-        elf_data = None
+            # The default payload is identical on every call; reuse the cached
+            # encoding instead of rebuilding and serializing a fresh Config.
+            config_json = _default_config_json(uart_to_stderr=is_kernel_mode)
+        else:
+            config = _config_to_dict(self._config_obj)
+            if is_kernel_mode:
+                # Patch a copy of the one serialized section that changes
+                # instead of mutating the caller's Config.
+                system = {**config["system"], "uart_to_stderr": True}
+                config = {**config, "system": system}
+            config_json = _config_to_json(config)
+
+        # In bare-metal mode Rust reads the ELF itself; no Python bytes copy.
+        elf_path = None
         if not is_kernel_mode and self._binary_path:
             print(
                 info("Simulator", f"Loading ELF: {self._binary_path}", stderr=True),
                 file=sys.stderr,
             )
-            with open(self._binary_path, "rb") as f:
-                elf_data = f.read()
+            elf_path = self._binary_path
         elif not is_kernel_mode and not self._binary_path:
             print(warn("No binary or kernel specified."), file=sys.stderr)
 
@@ -180,8 +212,8 @@ class Simulator:
             dtb_path = self._dtb_path
 
         cpu = Cpu(
-            config_dict,
-            elf_data=elf_data,
+            config_json,
+            elf_path=elf_path,
             kernel_path=kernel_path,
             dtb_path=dtb_path,
             disk_path=self._disk_path,
@@ -219,11 +251,9 @@ class Simulator:
         )
 
         if output_stats is not None:
-            import json
-
-            stats_dict = dict(cpu.stats)
+            # Serialized in Rust; no intermediate stats dict or json.dump walk.
             with open(output_stats, "w") as f:
-                json.dump(stats_dict, f, indent=2)
+                f.write(cpu.stats_json())
             print(
                 info("rvsim", f"Stats written to {output_stats}", stderr=True),
                 file=sys.stderr,
@@ -1,6 +1,6 @@
 """Type stubs for rvsim."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 # ── pipeline.py ───────────────────────────────────────────────────────────────
 
@@ -287,9 +287,10 @@ class Instruction:
 class Cpu:
     def __init__(
         self,
-        config_dict: Dict[str, Any],
+        config_dict: Union[Dict[str, Any], bytes, str],
         *,
-        elf_data: Optional[bytes] = None,
+        elf_data: Optional[Union[bytes, bytearray, memoryview]] = None,
+        elf_path: Optional[str] = None,
         kernel_path: Optional[str] = None,
         dtb_path: Optional[str] = None,
         disk_path: Optional[str] = None,
@@ -305,7 +306,14 @@ class Cpu:
     @trace.setter
     def trace(self, value: bool) -> None: ...
     @property
+    def cycles(self) -> int: ...
+    @property
+    def instructions_retired(self) -> int: ...
+    @property
     def stats(self) -> Dict[str, Any]: ...
+    def stat(self, name: str) -> Union[int, float]: ...
+    def update_stats(self, target: Dict[str, Any]) -> None: ...
+    def stats_json(self) -> str: ...
     @property
     def regs(self) -> Registers: ...
     @property
@@ -322,6 +330,7 @@ class Cpu:
         limit: Optional[int] = None,
         progress: int = 0,
         stats_sections: Optional[list[str]] = None,
+        on_progress: Optional[Callable[[int, int], Any]] = None,
     ) -> Optional[int]: ...
     def sample(self, every: int, limit: Optional[int] = None) -> list[dict]: ...
     def run_until(
@@ -341,12 +350,14 @@ class Cpu:
 class Registers:
     def __getitem__(self, idx: int) -> int: ...
     def __setitem__(self, idx: int, value: int) -> None: ...
+    def snapshot(self) -> list[int]: ...
 
 class Csrs:
     def __getitem__(self, key: str | int) -> int: ...
 
 class Memory:
     def __getitem__(self, addr: int) -> int: ...
+    def read_range(self, addr: int, count: int) -> list[int]: ...
 
 class Simulator:
     def __init__(self) -> None: ...
@@ -368,16 +379,17 @@ class Simulator:
 
 class Environment:
     binary: str
-    config: Optional[Union[Config, Dict[str, Any]]]
+    config: Optional[Union[Config, Dict[str, Any], bytes]]
     disk: Optional[str]
     load_addr: int
     def __init__(
         self,
         binary: str,
-        config: Optional[Union[Config, Dict[str, Any]]] = None,
+        config: Optional[Union[Config, Dict[str, Any], bytes]] = None,
         disk: Optional[str] = None,
         load_addr: int = 0x8000_0000,
     ) -> None: ...
+    def freeze(self) -> Environment: ...
     def get_config(self) -> Dict[str, Any]: ...
     def run(
         self, quiet: bool = True, limit: Optional[int] = None, progress: int = 0
@@ -443,6 +455,10 @@ class _RegLookup:
     T4: int
     T5: int
     T6: int
+    ARGS: frozenset[int]
+    TEMPS: frozenset[int]
+    CALLER_SAVED: frozenset[int]
+    CALLEE_SAVED: frozenset[int]
     def name(self, idx: int) -> str: ...
     def __call__(self, name: str | int) -> int: ...
 
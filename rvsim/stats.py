@@ -8,10 +8,11 @@ tables.
 
 from __future__ import annotations
 
+import functools
 import math
 import re
 import sys
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, Final, List, Optional, Sequence, Union
 
 __all__ = ["Stats", "Table"]
 
@@ -32,25 +33,27 @@ class Stats(dict):
         result.stats.query("branch")
     """
 
-    def __init__(self, data: Dict[str, Any]):
-        super().__init__(data)
+    # No per-instance __dict__, and dict's own constructor is used directly:
+    # sweeps build one Stats per run, plus one per query() call.
+    __slots__ = ()
 
     def query(self, pattern: str) -> Stats:
         """Search for statistics matching *pattern* (case-insensitive regex or substring)."""
-        matches = {}
-        try:
-            regex = re.compile(pattern, re.IGNORECASE)
-        except re.error:
-            regex = None
-
-        for key, value in self.items():
-            if regex:
-                if regex.search(key):
-                    matches[key] = value
-            elif pattern.lower() in key.lower():
-                matches[key] = value
-
-        return Stats(matches)
+        # Plain substrings (the common case: "miss", "branch") skip re entirely.
+        regex = None if _REGEX_META.isdisjoint(pattern) else _compile_query(pattern)
+        if regex is not None:
+            # filter() drives regex.search from C, with no per-key bytecode.
+            return Stats({key: self[key] for key in filter(regex.search, self)})
+
+        needle = pattern.casefold()
+        keys = tuple(self)
+        return Stats(
+            {
+                k: self[k]
+                for k, folded in zip(keys, _fold_keys(keys))
+                if needle in folded
+            }
+        )
 
     @staticmethod
     def tabulate(rows: Dict[str, Stats], *, title: str = "") -> Table:
@@ -110,16 +113,20 @@ class Stats(dict):
     def __repr__(self) -> str:
         if not self:
             return "Stats({})"
-        items = sorted(self.items())
-        key_w = max(len(k) for k in self.keys())
-        val_w = max(len(_fmt(v)) for _, v in items)
+        # Sort the keys alone (plain str compares, no item tuples), and format
+        # each value once; both width calculation and rows reuse it. Keys and
+        # values stay in parallel lists so every pass is a C-level map.
+        keys = sorted(self)
+        vals = list(map(_fmt, map(self.__getitem__, keys)))
+        key_w = max(map(len, keys))
+        val_w = max(map(len, vals))
 
         is_tty = hasattr(sys.stdout, "isatty") and sys.stdout.isatty()
+        indent = "  " if is_tty else ""
+        row_fmt = f"{indent}{{:<{key_w}}}  {{:>{val_w}}}".format
+        body = "\n".join(map(row_fmt, keys, vals))
         if not is_tty:
-            lines = []
-            for key, value in items:
-                lines.append(f"{key:<{key_w}}  {_fmt(value):>{val_w}}")
-            return "\n".join(lines)
+            return body
 
         bold = "\033[1m"
         teal = "\033[36m"
@@ -127,18 +134,50 @@ class Stats(dict):
 
         inner_w = key_w + 2 + val_w
         rule = f"{bold}{teal}{'─' * (inner_w + 4)}{rst}"
+        return f"{rule}\n{body}\n{rule}"
 
-        parts = [rule]
-        for key, value in items:
-            parts.append(f"  {key:<{key_w}}  {_fmt(value):>{val_w}}")
-        parts.append(rule)
-        return "\n".join(parts)
+
+@functools.lru_cache(maxsize=32)
+def _fold_keys(keys: tuple) -> tuple:
+    """Casefolded *keys*, memoized on the key tuple itself.
+
+    Every Stats from the backend has the same keys, so repeated queries reuse
+    one folded tuple instead of casefolding each key per call. Keying on the
+    tuple means a Stats whose keys change simply misses the cache.
+    """
+    return tuple(k.casefold() for k in keys)
+
+
+# Characters that make a query pattern a regex rather than a plain substring.
+_REGEX_META: Final = frozenset(r".^$*+?{}[]\|()")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_query(pattern: str) -> Optional[re.Pattern]:
+    """Compile a :meth:`Stats.query` pattern once; ``None`` if it is not a valid regex."""
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return None
 
 
 # ── Formatting helpers ───────────────────────────────────────────────────────
 
 
+# Exact-type formatters for the common cell values; one dict lookup replaces
+# the isinstance chain in _fmt for every table cell.
+_FMT_BY_TYPE: Final = {
+    float: "{:.4f}".format,
+    int: "{:,}".format,
+    bool: "{:,}".format,
+    str: str,
+}
+
+
 def _fmt(v) -> str:
+    fmt = _FMT_BY_TYPE.get(type(v))
+    if fmt is not None:
+        return fmt(v)
     if isinstance(v, float):
         return f"{v:.4f}"
     if isinstance(v, int):
@@ -164,47 +203,79 @@ def _geometric_mean(values: Sequence[float]) -> float:
     logs = [math.log(v) for v in values if v > 0]
     if not logs:
         return 0.0
-    return math.exp(sum(logs) / len(logs))
-
-
-_RATE_METRICS = {"ipc", "branch_accuracy_pct", "speculative_branch_accuracy_pct"}
-_COUNT_METRICS = {
-    "cycles",
-    "instructions_retired",
-    "stalls_mem",
-    "stalls_control",
-    "stalls_data",
-    "stalls_fu_structural",
-    "stalls_backpressure",
-    "misprediction_penalty",
-    "pipeline_flushes",
-    "mem_ordering_violations",
-    "icache_hits",
-    "icache_misses",
-    "dcache_hits",
-    "dcache_misses",
-    "l2_hits",
-    "l2_misses",
-    "l3_hits",
-    "l3_misses",
-    "branch_predictions",
-    "branch_mispredictions",
-    "committed_branch_predictions",
-    "committed_branch_mispredictions",
-    "speculative_branch_predictions",
-    "speculative_branch_mispredictions",
-    "traps_taken",
-    "inst_load",
-    "inst_store",
-    "inst_branch",
-    "inst_alu",
-    "inst_system",
-    "inst_fp_load",
-    "inst_fp_store",
-    "inst_fp_arith",
-    "inst_fp_fma",
-    "inst_fp_div_sqrt",
-}
+    return math.exp(math.fsum(logs) / len(logs))
+
+
+_RATE_METRICS: Final = frozenset(
+    {"ipc", "branch_accuracy_pct", "speculative_branch_accuracy_pct"}
+)
+_COUNT_METRICS: Final = frozenset(
+    {
+        "cycles",
+        "instructions_retired",
+        "stalls_mem",
+        "stalls_control",
+        "stalls_data",
+        "stalls_fu_structural",
+        "stalls_backpressure",
+        "misprediction_penalty",
+        "pipeline_flushes",
+        "mem_ordering_violations",
+        "icache_hits",
+        "icache_misses",
+        "dcache_hits",
+        "dcache_misses",
+        "l2_hits",
+        "l2_misses",
+        "l3_hits",
+        "l3_misses",
+        "branch_predictions",
+        "branch_mispredictions",
+        "committed_branch_predictions",
+        "committed_branch_mispredictions",
+        "speculative_branch_predictions",
+        "speculative_branch_mispredictions",
+        "traps_taken",
+        "inst_load",
+        "inst_store",
+        "inst_branch",
+        "inst_alu",
+        "inst_system",
+        "inst_fp_load",
+        "inst_fp_store",
+        "inst_fp_arith",
+        "inst_fp_fma",
+        "inst_fp_div_sqrt",
+    }
+)
+
+# Metrics shown by default in flat comparisons.
+_KNOWN_METRICS: Final = _RATE_METRICS | _COUNT_METRICS
+
+# Speedup directions; metrics in neither set get no speedup row.
+_LOWER_IS_BETTER: Final = frozenset(
+    {
+        "cycles",
+        "stalls_mem",
+        "stalls_control",
+        "stalls_data",
+        "icache_misses",
+        "dcache_misses",
+        "l2_misses",
+        "l3_misses",
+        "branch_mispredictions",
+        "committed_branch_mispredictions",
+        "speculative_branch_mispredictions",
+    }
+)
+_HIGHER_IS_BETTER: Final = frozenset(
+    {
+        "branch_predictions",
+        "committed_branch_predictions",
+        "speculative_branch_predictions",
+        "instructions_retired",
+    }
+)
 
 
 def _format_table(
@@ -216,19 +287,23 @@ def _format_table(
         align = ["<"] + [">"] * (ncols - 1)
     widths = [len(h) for h in headers]
     for row in rows:
-        for i, cell in enumerate(row):
-            if i < ncols:
-                widths[i] = max(widths[i], len(cell))
-    parts = []
-    hdr = "  ".join(f"{headers[i]:{align[i]}{widths[i]}}" for i in range(ncols))
-    parts.append(hdr)
-    parts.append("  ".join("-" * widths[i] for i in range(ncols)))
+        for i, n in enumerate(map(len, row[:ncols])):
+            if n > widths[i]:
+                widths[i] = n
+
+    # Pad with str.ljust/rjust chosen once per column rather than building
+    # and parsing a format spec for every cell. Short rows are padded with
+    # empty cells, which justify to blanks of the column width.
+    just = [str.ljust if a == "<" else str.rjust for a in align[:ncols]]
+    blank = [""] * ncols
+    parts = [
+        "  ".join([j(h, w) for j, h, w in zip(just, headers, widths)]),
+        "  ".join(["-" * w for w in widths]),
+    ]
     for row in rows:
-        line = "  ".join(
-            f"{row[i]:{align[i]}{widths[i]}}" if i < len(row) else " " * widths[i]
-            for i in range(ncols)
-        )
-        parts.append(line)
+        if len(row) < ncols:
+            row = row + blank[len(row) :]
+        parts.append("  ".join([j(c, w) for j, c, w in zip(just, row, widths)]))
     return "\n".join(parts)
 
 
@@ -355,7 +430,7 @@ def _compare_flat(
     if metrics is not None:
         show_metrics = [m for m in metrics if m in all_stat_keys]
     else:
-        show_metrics = sorted(all_stat_keys & (_RATE_METRICS | _COUNT_METRICS))
+        show_metrics = sorted(all_stat_keys & _KNOWN_METRICS)
         if not show_metrics:
             show_metrics = sorted(all_stat_keys)
 
@@ -376,33 +451,14 @@ def _compare_flat(
 
     plain = _format_table(headers, rows)
 
-    _FLAT_LOWER_IS_BETTER = {
-        "cycles",
-        "stalls_mem",
-        "stalls_control",
-        "stalls_data",
-        "icache_misses",
-        "dcache_misses",
-        "l2_misses",
-        "l3_misses",
-        "branch_mispredictions",
-        "committed_branch_mispredictions",
-        "speculative_branch_mispredictions",
-    }
-    _FLAT_HIGHER_IS_BETTER = {
-        "branch_predictions",
-        "committed_branch_predictions",
-        "speculative_branch_predictions",
-        "instructions_retired",
-    }
     speedup_rows: List[List[str]] = []
     if baseline is not None and baseline in results:
         base_stats = results[baseline].stats
         for m in show_metrics:
             if (
                 m not in _RATE_METRICS
-                and m not in _FLAT_LOWER_IS_BETTER
-                and m not in _FLAT_HIGHER_IS_BETTER
+                and m not in _LOWER_IS_BETTER
+                and m not in _HIGHER_IS_BETTER
             ):
                 continue
             row = [m]
@@ -414,7 +470,7 @@ def _compare_flat(
                     and isinstance(v, (int, float))
                     and bv != 0
                 ):
-                    if m in _FLAT_LOWER_IS_BETTER:
+                    if m in _LOWER_IS_BETTER:
                         ratio = bv / v  # lower is better
                     else:
                         ratio = v / bv  # higher is better
@@ -481,8 +537,13 @@ def _compare_matrix(
     for metric in metrics:
         labels: List[str] = []
         grid: List[List[str]] = []
+        # Rate metrics keep values and instruction-count weights for the
+        # harmonic mean; count metrics only need a running total, so they skip
+        # the per-cell weight lookup and list building entirely.
+        is_rate = metric in _RATE_METRICS
         values_per_config: Dict[str, List[float]] = {c: [] for c in config_names}
         weights_per_config: Dict[str, List[float]] = {c: [] for c in config_names}
+        totals: Dict[str, Any] = dict.fromkeys(config_names)
 
         for bname in binary_names:
             labels.append(bname)
@@ -494,47 +555,34 @@ def _compare_matrix(
                     continue
                 v = r.stats.get(metric, "—")
                 row.append(_fmt(v))
-                if isinstance(v, (int, float)):
-                    values_per_config[cname].append(float(v))
-                    inst = r.stats.get("instructions_retired", 1)
-                    weights_per_config[cname].append(float(inst))
+                if not isinstance(v, (int, float)):
+                    continue
+                if is_rate:
+                    values_per_config[cname].append(v)
+                    weights_per_config[cname].append(
+                        r.stats.get("instructions_retired", 1)
+                    )
+                else:
+                    total = totals[cname]
+                    totals[cname] = v if total is None else total + v
             grid.append(row)
 
         # Aggregate row
-        is_rate = metric in _RATE_METRICS
         agg_cells: List[str] = []
         for cname in config_names:
-            vals = values_per_config[cname]
-            wgts = weights_per_config[cname]
-            if not vals:
-                agg_cells.append("—")
-            elif is_rate:
-                agg_cells.append(f"{_weighted_harmonic_mean(vals, wgts):.4f}")
+            if is_rate:
+                vals = values_per_config[cname]
+                wgts = weights_per_config[cname]
+                agg_cells.append(
+                    f"{_weighted_harmonic_mean(vals, wgts):.4f}" if vals else "—"
+                )
             else:
-                agg_cells.append(_fmt(int(sum(vals))))
+                total = totals[cname]
+                agg_cells.append("—" if total is None else _fmt(int(total)))
         labels.append("AGGREGATE")
         grid.append(agg_cells)
 
         # Baseline speedup rows — only for metrics with clear directionality
-        _LOWER_IS_BETTER = {
-            "cycles",
-            "stalls_mem",
-            "stalls_control",
-            "stalls_data",
-            "icache_misses",
-            "dcache_misses",
-            "l2_misses",
-            "l3_misses",
-            "branch_mispredictions",
-            "committed_branch_mispredictions",
-            "speculative_branch_mispredictions",
-        }
-        _HIGHER_IS_BETTER = {
-            "branch_predictions",
-            "committed_branch_predictions",
-            "speculative_branch_predictions",
-            "instructions_retired",
-        }
         show_speedup = (
             baseline is not None
             and baseline in config_names
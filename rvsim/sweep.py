@@ -14,8 +14,10 @@ from typing import Any, Dict, List, Optional, Union
 
 __all__ = ["Sweep", "SweepResults"]
 
-from .config import Config
-from .experiment import Environment, Result
+from ._core import run_batch
+from .config import Config, _config_to_json
+from .experiment import Environment, Result, _read_binary
+from .stats import Stats
 
 
 def _run_one(args: tuple) -> tuple:
@@ -26,7 +28,40 @@ def _run_one(args: tuple) -> tuple:
     return (binary, config_name, result)
 
 
-@dataclass
+def _run_threaded(work: List[tuple], limit: Optional[int], max_workers) -> List[tuple]:
+    """Run all work items in this process via the native batch runner."""
+    # Read each binary once. An unreadable one becomes an error Result for its
+    # items, as in the process-pool path, instead of aborting the whole sweep.
+    elfs: Dict[str, Any] = {}
+    for binary, _, _, _ in work:
+        if binary not in elfs:
+            try:
+                elfs[binary] = _read_binary(binary)
+            except OSError as e:
+                elfs[binary] = e
+    jobs = [
+        (payload, elfs[binary], None)
+        for binary, _, payload, _ in work
+        if not isinstance(elfs[binary], OSError)
+    ]
+    raw = iter(run_batch(jobs, limit=limit, threads=max_workers))
+    out = []
+    for binary, config_name, _, _ in work:
+        elf = elfs[binary]
+        if isinstance(elf, OSError):
+            result = Result(-1, Stats(error=str(elf)), 0.0, binary)
+        else:
+            exit_code, stats, wall, err = next(raw)
+            if err is not None:
+                result = Result(-1, Stats(error=err), wall, binary)
+            else:
+                code = exit_code if exit_code is not None else -1
+                result = Result(code, Stats(stats), wall, binary)
+        out.append((binary, config_name, result))
+    return out
+
+
+@dataclass(slots=True)
 class SweepResults:
     """Structured results from a sweep run.
 
@@ -74,6 +109,8 @@ class Sweep:
         results.compare()
     """
 
+    __slots__ = ("binaries", "configs")
+
     def __init__(
         self,
         binaries: List[str],
@@ -88,6 +125,7 @@ class Sweep:
         parallel: bool = True,
         limit: Optional[int] = None,
         max_workers: Optional[int] = None,
+        threads: bool = False,
     ) -> SweepResults:
         """Execute all (binary, config) combinations.
 
@@ -95,20 +133,33 @@ class Sweep:
             parallel: Use multiple processes. ``False`` runs sequentially.
             limit: Maximum cycles per run. ``None`` = unlimited.
             max_workers: Max parallel workers. ``None`` = number of CPUs.
+            threads: Run every simulation inside this process on native threads
+                with the GIL released, instead of a process pool. Avoids
+                per-worker interpreter startup; Ctrl-C is only honoured once the
+                batch finishes, and program output from concurrent runs may
+                interleave.
 
         Returns:
             :class:`SweepResults` with per-binary, per-config results.
         """
+        # Encode each config once; workers receive compact JSON bytes instead
+        # of pickled Config object graphs, one payload per config not per run.
+        payloads = {name: _config_to_json(cfg) for name, cfg in self.configs.items()}
+
         # Build work items
         work: List[tuple] = []
         for binary in self.binaries:
-            for config_name, config in self.configs.items():
-                work.append((binary, config_name, config, limit))
+            for config_name, payload in payloads.items():
+                work.append((binary, config_name, payload, limit))
 
         # Execute
-        if parallel and len(work) > 1:
-            with ProcessPoolExecutor(max_workers=max_workers) as pool:
-                raw_results = list(pool.map(_run_one, work))
+        if parallel and threads:
+            raw_results = _run_threaded(work, limit, max_workers)
+        elif parallel and len(work) > 1:
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(work) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                raw_results = list(pool.map(_run_one, work, chunksize=chunksize))
         else:
             raw_results = [_run_one(w) for w in work]
 
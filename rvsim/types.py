@@ -13,6 +13,7 @@ Provides structured, Pythonic alternatives to raw string enums:
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any, Dict, List, Optional
 
@@ -27,19 +28,28 @@ __all__ = [
 ]
 
 
+_SIZE_RE = re.compile(r"(\d+)\s*(B|KB|MB|GB)", re.IGNORECASE)
+_SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+_CYCLES_RE = re.compile(r"(\d+)\s*([KMG])?", re.IGNORECASE)
+_CYCLE_SUFFIXES = {"": 1, "K": 1_000, "M": 1_000_000, "G": 1_000_000_000}
+
+
 def _parse_size(s) -> int:
     """Parse a size string like '32KB', '4MB', '64B' into bytes. Ints pass through."""
     if isinstance(s, int):
         return s
     if not isinstance(s, str):
         raise TypeError(f"Expected str or int, got {type(s).__name__}")
-    m = re.fullmatch(r"(\d+)\s*(B|KB|MB|GB)", s.strip(), re.IGNORECASE)
+    return _parse_size_str(s)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_size_str(s: str) -> int:
+    # Configs and caches repeat a handful of literals ("32KB", "256MB", ...).
+    m = _SIZE_RE.fullmatch(s.strip())
     if not m:
         raise ValueError(f"Cannot parse size: {s!r} (expected e.g. '32KB', '4MB')")
-    val = int(m.group(1))
-    unit = m.group(2).upper()
-    mult = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
-    return val * mult[unit]
+    return int(m.group(1)) * _SIZE_UNITS[m.group(2).upper()]
 
 
 def _parse_cycles(s) -> int:
@@ -52,15 +62,39 @@ def _parse_cycles(s) -> int:
         return s
     if not isinstance(s, str):
         raise TypeError(f"Expected str or int, got {type(s).__name__}")
-    m = re.fullmatch(r"(\d+)\s*([KMG])?", s.strip(), re.IGNORECASE)
+    return _parse_cycles_str(s)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cycles_str(s: str) -> int:
+    m = _CYCLES_RE.fullmatch(s.strip())
     if not m:
         raise ValueError(
             f"Cannot parse cycle count: {s!r} (expected e.g. '5M', '500K', or plain integer)"
         )
-    val = int(m.group(1))
-    suffix = (m.group(2) or "").upper()
-    mult = {"": 1, "K": 1_000, "M": 1_000_000, "G": 1_000_000_000}
-    return val * mult[suffix]
+    return int(m.group(1)) * _CYCLE_SUFFIXES[(m.group(2) or "").upper()]
+
+
+# ── Marker base ──────────────────────────────────────────────────────────────
+
+
+class _Marker:
+    """Base for parameterless choices such as ``ReplacementPolicy.LRU()``.
+
+    Markers carry no state, so every call returns one shared instance per
+    class; sweeps that build a config per point allocate nothing for them.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls):
+        try:
+            return _MARKERS[cls]
+        except KeyError:
+            return _MARKERS.setdefault(cls, super().__new__(cls))
+
+
+_MARKERS: Dict[type, Any] = {}
 
 
 # ── Branch Predictor ─────────────────────────────────────────────────────────
@@ -69,15 +103,28 @@ def _parse_cycles(s) -> int:
 class BranchPredictor:
     """Namespace for branch predictor configurations."""
 
-    class Static:
+    class Static(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "BranchPredictor.Static()"
 
-    class GShare:
+    class GShare(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "BranchPredictor.GShare()"
 
     class TAGE:
+        __slots__ = (
+            "num_banks",
+            "table_size",
+            "loop_table_size",
+            "reset_interval",
+            "history_lengths",
+            "tag_widths",
+        )
+
         def __init__(
             self,
             num_banks: int = 8,
@@ -113,6 +160,8 @@ class BranchPredictor:
             )
 
     class Perceptron:
+        __slots__ = ("history_length", "table_bits")
+
         def __init__(self, history_length: int = 32, table_bits: int = 10):
             self.history_length = history_length
             self.table_bits = table_bits
@@ -124,6 +173,8 @@ class BranchPredictor:
             )
 
     class Tournament:
+        __slots__ = ("global_size_bits", "local_hist_bits", "local_pred_bits")
+
         def __init__(
             self,
             global_size_bits: int = 12,
@@ -151,6 +202,28 @@ class BranchPredictor:
         SC and ITTAGE have their own sub-configs.
         """
 
+        __slots__ = (
+            "num_banks",
+            "table_size",
+            "loop_table_size",
+            "reset_interval",
+            "history_lengths",
+            "tag_widths",
+            "sc_num_tables",
+            "sc_table_size",
+            "sc_history_lengths",
+            "sc_counter_bits",
+            "sc_bias_table_size",
+            "sc_bias_counter_bits",
+            "sc_initial_threshold",
+            "sc_per_pc_threshold_bits",
+            "ittage_num_banks",
+            "ittage_table_size",
+            "ittage_history_lengths",
+            "ittage_tag_widths",
+            "ittage_reset_interval",
+        )
+
         def __init__(
             self,
             # TAGE parameters
@@ -231,11 +304,15 @@ class BranchPredictor:
 class MemDepPredictor:
     """Namespace for memory dependence predictor configurations."""
 
-    class Blind:
+    class Blind(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "MemDepPredictor.Blind()"
 
     class StoreSet:
+        __slots__ = ("ssit_size", "lfst_size")
+
         def __init__(self, ssit_size: int = 2048, lfst_size: int = 256):
             self.ssit_size = ssit_size
             self.lfst_size = lfst_size
@@ -253,23 +330,33 @@ class MemDepPredictor:
 class ReplacementPolicy:
     """Namespace for cache replacement policies."""
 
-    class LRU:
+    class LRU(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "ReplacementPolicy.LRU()"
 
-    class PLRU:
+    class PLRU(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "ReplacementPolicy.PLRU()"
 
-    class FIFO:
+    class FIFO(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "ReplacementPolicy.FIFO()"
 
-    class Random:
+    class Random(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "ReplacementPolicy.Random()"
 
-    class MRU:
+    class MRU(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "ReplacementPolicy.MRU()"
 
@@ -280,11 +367,15 @@ class ReplacementPolicy:
 class Prefetcher:
     """Namespace for prefetcher configurations."""
 
-    class Off:
+    class Off(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "Prefetcher.Off()"
 
     class NextLine:
+        __slots__ = ("degree",)
+
         def __init__(self, degree: int = 1):
             self.degree = degree
 
@@ -292,6 +383,8 @@ class Prefetcher:
             return f"Prefetcher.NextLine(degree={self.degree})"
 
     class Stride:
+        __slots__ = ("degree", "table_size")
+
         def __init__(self, degree: int = 1, table_size: int = 64):
             self.degree = degree
             self.table_size = table_size
@@ -302,6 +395,8 @@ class Prefetcher:
             )
 
     class Stream:
+        __slots__ = ("degree",)
+
         def __init__(self, degree: int = 1):
             self.degree = degree
 
@@ -309,6 +404,8 @@ class Prefetcher:
             return f"Prefetcher.Stream(degree={self.degree})"
 
     class Tagged:
+        __slots__ = ("degree",)
+
         def __init__(self, degree: int = 1):
             self.degree = degree
 
@@ -322,11 +419,15 @@ class Prefetcher:
 class MemoryController:
     """Namespace for memory controller configurations."""
 
-    class Simple:
+    class Simple(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "MemoryController.Simple()"
 
     class DRAM:
+        __slots__ = ("t_cas", "t_ras", "t_pre", "row_miss_latency")
+
         def __init__(
             self,
             t_cas: int = 14,
@@ -369,9 +470,13 @@ class Fu:
         ])
     """
 
+    __slots__ = ("units",)
+
     class IntAlu:
         """Integer ALU: add, sub, logic, shift, compare, set-less-than."""
 
+        __slots__ = ("count", "latency")
+
         def __init__(self, count: int = 4, latency: int = 1):
             self.count = count
             self.latency = latency
@@ -382,6 +487,8 @@ class Fu:
     class IntMul:
         """Integer multiplier: mul, mulh, mulhsu, mulhu."""
 
+        __slots__ = ("count", "latency")
+
         def __init__(self, count: int = 1, latency: int = 3):
             self.count = count
             self.latency = latency
@@ -392,6 +499,8 @@ class Fu:
     class IntDiv:
         """Integer divider: div, divu, rem, remu. Non-pipelined."""
 
+        __slots__ = ("count", "latency")
+
         def __init__(self, count: int = 1, latency: int = 35):
             self.count = count
             self.latency = latency
@@ -402,6 +511,8 @@ class Fu:
     class FpAdd:
         """FP adder: fadd, fsub, fmin, fmax, fcmp, fcvt."""
 
+        __slots__ = ("count", "latency")
+
         def __init__(self, count: int = 2, latency: int = 4):
             self.count = count
             self.latency = latency
@@ -412,6 +523,8 @@ class Fu:
     class FpMul:
         """FP multiplier: fmul."""
 
+        __slots__ = ("count", "latency")
+
         def __init__(self, count: int = 2, latency: int = 5):
             self.count = count
             self.latency = latency
@@ -422,6 +535,8 @@ class Fu:
     class FpFma:
         """FP fused multiply-add: fmadd, fmsub, fnmadd, fnmsub."""
 
+        __slots__ = ("count", "latency")
+
         def __init__(self, count: int = 2, latency: int = 5):
             self.count = count
             self.latency = latency
@@ -432,6 +547,8 @@ class Fu:
     class FpDivSqrt:
         """FP divider/sqrt: fdiv, fsqrt. Non-pipelined."""
 
+        __slots__ = ("count", "latency")
+
         def __init__(self, count: int = 1, latency: int = 21):
             self.count = count
             self.latency = latency
@@ -442,6 +559,8 @@ class Fu:
     class Branch:
         """Branch/jump unit: all conditional branches, jal, jalr."""
 
+        __slots__ = ("count", "latency")
+
         def __init__(self, count: int = 2, latency: int = 1):
             self.count = count
             self.latency = latency
@@ -452,6 +571,8 @@ class Fu:
     class Mem:
         """Memory address calculation for loads and stores."""
 
+        __slots__ = ("count", "latency")
+
         def __init__(self, count: int = 2, latency: int = 1):
             self.count = count
             self.latency = latency
@@ -489,11 +610,26 @@ Fu._DEFAULTS = [
 class Backend:
     """Namespace for pipeline backend configurations."""
 
-    class InOrder:
+    class InOrder(_Marker):
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "Backend.InOrder()"
 
     class OutOfOrder:
+        __slots__ = (
+            "rob_size",
+            "store_buffer_size",
+            "issue_queue_size",
+            "load_queue_size",
+            "load_ports",
+            "store_ports",
+            "prf_gpr_size",
+            "prf_fpr_size",
+            "fu_config",
+            "checkpoint_count",
+        )
+
         def __init__(
             self,
             rob_size: int = 128,
@@ -535,21 +671,37 @@ class Backend:
 class Cache:
     """Single cache level configuration."""
 
-    class NINE:
+    __slots__ = (
+        "size_bytes",
+        "line_bytes",
+        "ways",
+        "policy",
+        "latency",
+        "prefetcher",
+        "mshr_count",
+    )
+
+    class NINE(_Marker):
         """No Inclusion, Non-Exclusive (default)."""
 
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "Cache.NINE()"
 
-    class Inclusive:
+    class Inclusive(_Marker):
         """Inclusive: L2 eviction back-invalidates matching L1 lines."""
 
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "Cache.Inclusive()"
 
-    class Exclusive:
+    class Exclusive(_Marker):
         """Exclusive: L1 eviction installs line into L2 (swap)."""
 
+        __slots__ = ()
+
         def __repr__(self) -> str:
             return "Cache.Exclusive()"
 
@@ -579,27 +731,52 @@ class Cache:
         )
 
 
-# Disabled cache dict for levels set to None
-_DISABLED_CACHE_DICT: Dict[str, Any] = {
-    "enabled": False,
-    "size_bytes": 4096,
-    "line_bytes": 64,
-    "ways": 1,
-    "policy": "LRU",
-    "latency": 1,
-    "prefetcher": "None",
-    "prefetch_table_size": 0,
-    "prefetch_degree": 0,
-}
-
-_DISABLED_CACHE_DICT_ZERO: Dict[str, Any] = {
-    "enabled": False,
-    "size_bytes": 0,
-    "line_bytes": 0,
-    "ways": 0,
-    "policy": "LRU",
-    "latency": 0,
-    "prefetcher": "None",
-    "prefetch_table_size": 0,
-    "prefetch_degree": 0,
-}
+class _ReadOnlyDict(dict):
+    """A ``dict`` that rejects mutation, for templates shared between results.
+
+    Unlike ``types.MappingProxyType`` it is still a ``dict``, so ``json`` and the
+    Rust backend serialize it directly. Copies (``dict(d)``, ``{**d}``) are
+    ordinary mutable dicts.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared config template is read-only; copy it first")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+# Disabled cache dict for levels set to None. Every Config.to_dict() result
+# shares these objects, so they are read-only.
+_DISABLED_CACHE_DICT: Dict[str, Any] = _ReadOnlyDict(
+    {
+        "enabled": False,
+        "size_bytes": 4096,
+        "line_bytes": 64,
+        "ways": 1,
+        "policy": "LRU",
+        "latency": 1,
+        "prefetcher": "None",
+        "prefetch_table_size": 0,
+        "prefetch_degree": 0,
+    }
+)
+
+_DISABLED_CACHE_DICT_ZERO: Dict[str, Any] = _ReadOnlyDict(
+    {
+        "enabled": False,
+        "size_bytes": 0,
+        "line_bytes": 0,
+        "ways": 0,
+        "policy": "LRU",
+        "latency": 0,
+        "prefetcher": "None",
+        "prefetch_table_size": 0,
+        "prefetch_degree": 0,
+    }
+)
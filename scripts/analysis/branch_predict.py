@@ -32,10 +32,8 @@ def main():
     args = ap.parse_args()
 
     binaries = [f"software/bin/programs/{p}.elf" for p in args.programs]
-    configs = {
-        name: Config(branch_predictor=bp_cls(), uart_quiet=True, width=args.width)
-        for name, bp_cls in PREDICTORS.items()
-    }
+    base = Config(uart_quiet=True, width=args.width)
+    configs = {name: base.replace(branch_predictor=bp_cls()) for name, bp_cls in PREDICTORS.items()}
 
     n_jobs = len(binaries) * len(configs)
     print(f"Branch predictor comparison: {len(binaries)} binaries x {len(configs)} predictors "
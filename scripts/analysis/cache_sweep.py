@@ -25,10 +25,8 @@ def main():
     args = ap.parse_args()
 
     binaries = [f"software/bin/programs/{p}.elf" for p in args.programs]
-    configs = {
-        size: Config(uart_quiet=True, l1d=Cache(size=size, ways=args.ways, mshr_count=8))
-        for size in args.sizes
-    }
+    base = Config(uart_quiet=True)
+    configs = {size: base.replace(l1d=Cache(size=size, ways=args.ways, mshr_count=8)) for size in args.sizes}
 
     n_jobs = len(binaries) * len(configs)
     print(f"D-cache sweep: {len(binaries)} binaries x {len(configs)} sizes "
@@ -19,14 +19,14 @@ def main():
     ap.add_argument("--limit", type=int, default=50_000_000, help="Cycle limit")
     args = ap.parse_args()
 
-    rows = {}
-    for program in args.programs:
-        binary = f"software/bin/programs/{program}.elf"
-        print(f"  {program}...", flush=True)
-        config = Config(uart_quiet=True)
-        result = Environment(binary=binary, config=config).run(quiet=True, limit=args.limit)
-        s = result.stats
-        rows[program] = s.query("^inst_")
+    config = Config(uart_quiet=True)
+    print(f"  running {len(args.programs)} programs...", flush=True)
+    results = Environment.run_all(
+        (Environment(binary=f"software/bin/programs/{program}.elf", config=config)
+         for program in args.programs),
+        limit=args.limit,
+    )
+    rows = {program: result.stats.query("^inst_") for program, result in zip(args.programs, results)}
     print(Stats.tabulate(rows, title="Instruction Mix"))
     print()
 
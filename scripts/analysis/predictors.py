@@ -0,0 +1,20 @@
+"""Branch predictors shared by the analysis sweeps."""
+
+from rvsim import BranchPredictor
+
+BP_MAP = {
+    "Static": BranchPredictor.Static,
+    "GShare": BranchPredictor.GShare,
+    "TAGE": BranchPredictor.TAGE,
+    "Perceptron": BranchPredictor.Perceptron,
+    "Tournament": BranchPredictor.Tournament,
+}
+
+
+def build_predictors(names):
+    """One default-parameter predictor per name in *names*, keyed by name.
+
+    Configs only read their predictor when serialized, so a single instance
+    can back every config of a sweep that shares that predictor.
+    """
+    return {name: BP_MAP[name]() for name in names}
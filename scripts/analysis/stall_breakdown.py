@@ -7,14 +7,15 @@ Usage:
 """
 
 import argparse
+from operator import itemgetter
 
-from rvsim import BranchPredictor, Config, Environment, Stats
+from predictors import build_predictors
+from rvsim import Config, Environment, Stats
 
 PROGRAMS = ["mandelbrot", "maze", "qsort", "merge_sort"]
-BP_MAP = {
-    "Static": BranchPredictor.Static,
-    "TAGE": BranchPredictor.TAGE,
-}
+PREDICTORS = ("Static", "TAGE")
+COLUMNS = ("cycles", "ipc", "stalls_mem", "stalls_ctrl", "stalls_data")
+_get_row = itemgetter("cycles", "ipc", "stalls_mem", "stalls_control", "stalls_data")
 
 
 def main():
@@ -24,23 +25,26 @@ def main():
     ap.add_argument("--limit", type=int, default=50_000_000, help="Cycle limit")
     args = ap.parse_args()
 
-    for program in args.programs:
-        binary = f"software/bin/programs/{program}.elf"
-        rows = {}
-        for bp_name, bp_cls in BP_MAP.items():
-            for width in args.widths:
-                label = f"{bp_name}/w{width}"
-                print(f"  {program} {label}...", flush=True)
-                config = Config(branch_predictor=bp_cls(), uart_quiet=True, width=width)
-                result = Environment(binary=binary, config=config).run(quiet=True, limit=args.limit)
-                s = result.stats
-                rows[label] = Stats({
-                    "cycles": s["cycles"],
-                    "ipc": s["ipc"],
-                    "stalls_mem": s["stalls_mem"],
-                    "stalls_ctrl": s["stalls_control"],
-                    "stalls_data": s["stalls_data"],
-                })
+    base = Config(uart_quiet=True)
+    configs = {
+        f"{bp_name}/w{width}": base.replace(branch_predictor=bp, width=width)
+        for bp_name, bp in build_predictors(PREDICTORS).items()
+        for width in args.widths
+    }
+
+    # Every (program, config) run is independent; run them all concurrently.
+    jobs = [(program, label) for program in args.programs for label in configs]
+    print(f"  running {len(jobs)} simulations...", flush=True)
+    results = Environment.run_all(
+        (Environment(binary=f"software/bin/programs/{program}.elf", config=configs[label])
+         for program, label in jobs),
+        limit=args.limit,
+    )
+
+    tables = {program: {} for program in args.programs}
+    for (program, label), result in zip(jobs, results):
+        tables[program][label] = Stats(zip(COLUMNS, _get_row(result.stats)))
+    for program, rows in tables.items():
         print(Stats.tabulate(rows, title=program))
         print()
 
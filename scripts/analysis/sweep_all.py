@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Run the predictor, width and L1D-size sweeps as one combined sweep.
+
+Instead of running branch_predict.py, width_scaling.py and cache_sweep.py one
+after another (one interpreter, import and process pool each), this builds the
+cross product of the chosen axes and runs every (program, config) cell in a
+single Sweep, then writes one CSV row per cell.
+
+Usage:
+    .venv/bin/python scripts/analysis/sweep_all.py
+    .venv/bin/python scripts/analysis/sweep_all.py --axes bp width
+    .venv/bin/python scripts/analysis/sweep_all.py --axes size --sizes 4KB 16KB --csv l1d.csv
+"""
+
+import argparse
+import csv
+import itertools
+import sys
+import time
+
+from predictors import BP_MAP, build_predictors
+from rvsim import Cache, Config, Sweep
+
+PROGRAMS = ["mandelbrot", "maze", "qsort", "merge_sort"]
+WIDTHS = [1, 2, 4]
+SIZES = ["1KB", "4KB", "16KB", "32KB"]
+AXES = {"bp": "bps", "width": "widths", "size": "sizes"}
+
+METRICS = ["cycles", "instructions_retired", "ipc", "branch_accuracy_pct", "dcache_misses",
+           "stalls_mem", "stalls_control", "stalls_data"]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--axes", nargs="+", choices=AXES.keys(), default=list(AXES),
+                    help="Axes to sweep; the others stay at their defaults")
+    ap.add_argument("--bps", nargs="+", choices=BP_MAP.keys(), help="Branch predictors (default: all)")
+    ap.add_argument("--widths", type=int, nargs="+", help=f"Pipeline widths (default: {WIDTHS})")
+    ap.add_argument("--sizes", nargs="+", help=f"L1 D-cache sizes (default: {SIZES})")
+    ap.add_argument("--ways", type=int, default=4, help="L1 D-cache associativity (default: 4)")
+    ap.add_argument("--programs", nargs="+", default=PROGRAMS, help="Programs to run")
+    ap.add_argument("--limit", type=int, default=50_000_000, help="Cycle limit")
+    ap.add_argument("--csv", default=None, help="Write results here instead of stdout")
+    args = ap.parse_args()
+    # argparse already rejects an empty or unknown --axes; values for an axis
+    # that is not swept would be silently dropped, so reject those too.
+    for axis, option in AXES.items():
+        if getattr(args, option) is not None and axis not in args.axes:
+            ap.error(f"--{option} given but '{axis}' is not in --axes")
+
+    # One value per axis that is not swept; None leaves the Config default.
+    bps = (args.bps or list(BP_MAP)) if "bp" in args.axes else [None]
+    widths = (args.widths or WIDTHS) if "width" in args.axes else [None]
+    sizes = (args.sizes or SIZES) if "size" in args.axes else [None]
+
+    predictors = build_predictors(bp for bp in bps if bp is not None)
+    base = Config(uart_quiet=True)
+    configs = {}
+    points = {}
+    for bp, width, size in itertools.product(bps, widths, sizes):
+        kwargs = {}
+        if bp is not None:
+            kwargs["branch_predictor"] = predictors[bp]
+        if width is not None:
+            kwargs["width"] = width
+        if size is not None:
+            kwargs["l1d"] = Cache(size=size, ways=args.ways, mshr_count=8)
+        label = "/".join(str(v) for v in (bp, f"w{width}" if width else None, size) if v) or "default"
+        configs[label] = base.replace(**kwargs)
+        points[label] = (bp or "", width or "", size or "")
+
+    binaries = [f"software/bin/programs/{p}.elf" for p in args.programs]
+    print(f"Combined sweep: {len(binaries)} binaries x {len(configs)} configs "
+          f"({len(binaries) * len(configs)} runs, limit={args.limit:,})", file=sys.stderr)
+
+    t0 = time.perf_counter()
+    results = Sweep(binaries=binaries, configs=configs).run(parallel=True, limit=args.limit)
+    print(f"Completed in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+
+    out = open(args.csv, "w", newline="") if args.csv else sys.stdout
+    try:
+        writer = csv.writer(out)
+        writer.writerow(["program", "bp", "width", "l1d_size", *METRICS])
+        for program in args.programs:
+            for label, result in results[f"{program}.elf"].items():
+                writer.writerow([program, *points[label], *(result.stats.get(m, "") for m in METRICS)])
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
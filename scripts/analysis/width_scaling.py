@@ -43,10 +43,8 @@ def main():
 
     bp = BP_MAP[args.bp]()
     binaries = [f"software/bin/programs/{p}.elf" for p in args.programs]
-    configs = {
-        f"w{w}": Config(branch_predictor=bp, uart_quiet=True, width=w)
-        for w in args.widths
-    }
+    base = Config(branch_predictor=bp, uart_quiet=True)
+    configs = {f"w{w}": base.replace(width=w) for w in args.widths}
 
     n_jobs = len(binaries) * len(configs)
     print(f"Width scaling: {len(binaries)} binaries x {len(configs)} widths "
@@ -6,6 +6,8 @@ Usage:
     config = m1_config(branch_predictor=BranchPredictor.TAGE())
 """
 
+import functools
+
 from rvsim import BranchPredictor, Cache, Config, Prefetcher, ReplacementPolicy
 
 
@@ -15,20 +17,30 @@ def m1_config(
     ram_size_bytes=0x1000_0000,
     pipeline_width=4,
 ):
-    """M1-style: 4-wide, 128KB L1-I/D, 4MB L2."""
+    """M1-style: 4-wide, 128KB L1-I/D, 4MB L2.
+
+    The cache/predictor tree is built once per (ram size, width) and each call
+    returns a ``replace()`` clone of it, so sub-objects such as ``config.l1d``
+    are shared between calls; use ``replace()`` rather than mutating them.
+    """
+    template = _m1_template(ram_size_bytes, pipeline_width)
     if branch_predictor is None:
-        branch_predictor = BranchPredictor.TAGE(
+        return template.replace()
+    return template.replace(branch_predictor=branch_predictor)
+
+
+@functools.lru_cache(maxsize=32)
+def _m1_template(ram_size_bytes, pipeline_width):
+    return Config(
+        width=pipeline_width,
+        branch_predictor=BranchPredictor.TAGE(
             num_banks=4,
             table_size=4096,
             loop_table_size=512,
             reset_interval=2000,
             history_lengths=[5, 15, 44, 130],
             tag_widths=[9, 9, 10, 10],
-        )
-
-    return Config(
-        width=pipeline_width,
-        branch_predictor=branch_predictor,
+        ),
         btb_size=8192,
         ras_size=64,
         initial_sp=0x8010_0000,
@@ -13,6 +13,8 @@ Usage:
     config = p550_config()
 """
 
+import functools
+
 from rvsim import (
     Backend,
     BranchPredictor,
@@ -45,20 +47,32 @@ def p550_config(
     - 4 MB shared L3 on EIC7700X implementation
     - 13-stage pipeline → ~11-13 cycle mispredict penalty
     - No hardware misaligned access support (trap-based emulation)
+
+    The tree is built once per (ram size, width) and each call returns a
+    ``replace()`` clone of it, so sub-objects such as ``config.l1d`` are shared
+    between calls; use ``replace()`` rather than mutating them.
     """
+    template = _p550_template(ram_size_bytes, pipeline_width)
     if branch_predictor is None:
-        # P550 has a 9.1 KiB BHT — predictor type unconfirmed.
-        # Tournament sizing to match ~9 KB budget:
-        #   global predictor:  2^13 entries × 2b = 2 KB
-        #   choice (selector): 2^13 entries × 2b = 2 KB
-        #   local hist table:  2^11 entries × 11b ≈ 2.75 KB
-        #   local predictor:   2^11 entries × 2b  = 0.5 KB
-        #   total ≈ 7.25 KB (closest we can get within the budget)
-        branch_predictor = BranchPredictor.Tournament(
-            global_size_bits=13,
-            local_hist_bits=11,
-            local_pred_bits=11,
-        )
+        return template.replace()
+    return template.replace(branch_predictor=branch_predictor)
+
+
+@functools.lru_cache(maxsize=32)
+def _p550_template(ram_size_bytes, pipeline_width):
+    """Build the P550 tree once per (ram size, width); see :func:`p550_config`."""
+    # P550 has a 9.1 KiB BHT — predictor type unconfirmed.
+    # Tournament sizing to match ~9 KB budget:
+    #   global predictor:  2^13 entries × 2b = 2 KB
+    #   choice (selector): 2^13 entries × 2b = 2 KB
+    #   local hist table:  2^11 entries × 11b ≈ 2.75 KB
+    #   local predictor:   2^11 entries × 2b  = 0.5 KB
+    #   total ≈ 7.25 KB (closest we can get within the budget)
+    branch_predictor = BranchPredictor.Tournament(
+        global_size_bits=13,
+        local_hist_bits=11,
+        local_pred_bits=11,
+    )
 
     return Config(
         width=pipeline_width,
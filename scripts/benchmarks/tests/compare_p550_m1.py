@@ -26,9 +26,13 @@ def main():
         binary = os.path.join(_root, binary)
     name = os.path.basename(binary)
 
-    # Run simulations
-    r550 = Environment(binary=binary, config=p550_config().replace(uart_quiet=True)).run()
-    r_m1 = Environment(binary=binary, config=m1_config().replace(uart_quiet=True)).run()
+    # Run both simulations concurrently; they share the cached ELF bytes.
+    r550, r_m1 = Environment.run_all(
+        [
+            Environment(binary=binary, config=p550_config().replace(uart_quiet=True)),
+            Environment(binary=binary, config=m1_config().replace(uart_quiet=True)),
+        ]
+    )
 
     print(f"Comparison: {name}\n")
 
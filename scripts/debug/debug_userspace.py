@@ -121,11 +121,12 @@ ABI_NAMES = [
 
 def dump_regs(cpu):
     print("\n── GPR state ──")
+    regs = cpu.regs.snapshot()
     for i in range(0, 32, 4):
         parts = []
         for j in range(4):
             r = i + j
-            val = cpu.regs[r]
+            val = regs[r]
             parts.append(f"  {ABI_NAMES[r]:>4}(x{r:<2d}) = {val:#018x}")
         print("".join(parts))
 
@@ -151,9 +152,10 @@ def dump_pc_trace(cpu, n):
         return
     start = max(0, len(trace) - n)
     print(f"\n── Last {len(trace) - start} committed instructions ──")
-    for pc, raw in trace[start:]:
-        asm = disassemble(raw)
-        print(f"  {pc:#018x}:  {raw:08x}  {asm}")
+    # One write for the whole listing instead of one print per instruction.
+    print("\n".join(
+        f"  {pc:#018x}:  {raw:08x}  {disassemble(raw)}" for pc, raw in trace[start:]
+    ))
 
 
 # ── Main ─────────────────────────────────────────────────────────────────────
@@ -216,11 +218,11 @@ def main():
 
     if exit_code is not None:
         print(f"[debug] Simulation exited with code {exit_code} at cycle "
-              f"{cpu.stats['cycles']:,} (before trace point)", file=sys.stderr)
+              f"{cpu.cycles:,} (before trace point)", file=sys.stderr)
         dump_state(cpu, args.context)
         return 1
 
-    print(f"\n[debug] Reached trace point at cycle {cpu.stats['cycles']:,}", file=sys.stderr)
+    print(f"\n[debug] Reached trace point at cycle {cpu.cycles:,}", file=sys.stderr)
     print(f"[debug]   PC = {cpu.pc:#018x}", file=sys.stderr)
     print(f"[debug]   privilege = {cpu.privilege}", file=sys.stderr)
 
@@ -255,7 +257,7 @@ def main():
 
 def dump_state(cpu, context):
     """Dump full machine state for debugging."""
-    cycles = cpu.stats["cycles"]
+    cycles = cpu.cycles
     print(f"\n{'=' * 72}", file=sys.stderr)
     print(f"[debug] Final state at cycle {cycles:,}", file=sys.stderr)
     print(f"[debug]   PC = {cpu.pc:#018x}", file=sys.stderr)
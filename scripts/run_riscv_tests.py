@@ -7,9 +7,7 @@ Usage (from repo root):
     rvsim --script scripts/run_riscv_tests.py
 """
 
-import contextlib
 import glob
-import io
 import os
 import sys
 
@@ -18,12 +16,12 @@ from rvsim import (
     BranchPredictor,
     Cache,
     Config,
+    Environment,
     Fu,
     MemDepPredictor,
     MemoryController,
     Prefetcher,
     ReplacementPolicy,
-    Simulator,
 )
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -357,32 +355,28 @@ def find_tests():
     return tests
 
 
-def run_test(path: str, cfg: Config) -> int:
-    """Run a single test ELF with the given config. Returns exit code (0 = pass)."""
-    sim = Simulator().config(cfg).binary(path)
-    # Mute per-test simulator output (HTIF messages, trace, debug prints).
-    with (
-        contextlib.redirect_stdout(io.StringIO()),
-        contextlib.redirect_stderr(io.StringIO()),
-    ):
-        return sim.run(limit=CYCLE_LIMIT, stats_sections=None)
+def _failure(result) -> str:
+    """Describe why *result* failed: an exception, the cycle limit, or its exit code."""
+    if "error" in result.stats:
+        return f"error: {result.stats['error']}"
+    if result.exit_code == -1:
+        return f"timeout after {CYCLE_LIMIT:,} cycles"
+    return f"exit={result.exit_code}"
 
 
 def run_pipeline(label: str, cfg: Config, tests: list) -> tuple[int, list]:
     """Run all tests for one pipeline. Returns (passed, failed_list)."""
-    passed = 0
-    failed = []
-
-    for path in tests:
-        name = os.path.basename(path)
-        rc = run_test(path, cfg)
-
-        if rc == 0:
-            passed += 1
-        else:
-            failed.append((name, rc))
-
-    return passed, failed
+    # Cpu.run releases the GIL, so the tests run concurrently on threads.
+    # Environment.run prints nothing and the simulator core writes straight
+    # to the process's file descriptors (which a sys.stdout redirect never
+    # caught), so the only per-test output left is the program's UART:
+    # silence it in the config instead.
+    cfg = cfg.replace(uart_quiet=True)
+    results = Environment.run_all(
+        (Environment(binary=path, config=cfg) for path in tests), limit=CYCLE_LIMIT
+    )
+    failed = [(os.path.basename(r.binary), _failure(r)) for r in results if not r.ok]
+    return len(tests) - len(failed), failed
 
 
 def main():
@@ -410,8 +404,8 @@ def main():
         passed, failed = run_pipeline(label, cfg, tests)
         total_pass += passed
         total_fail += len(failed)
-        for name, rc in failed:
-            overall_failed.append((label, name, rc))
+        for name, why in failed:
+            overall_failed.append((label, name, why))
         status = "PASS" if not failed else f"{len(failed)} FAIL"
         done = total_pass + total_fail
         print(
@@ -425,8 +419,8 @@ def main():
 
     if overall_failed:
         print(f"\n=== {total_fail} Failures ===")
-        for label, name, rc in overall_failed:
-            print(f"  [{label}] {name} (exit={rc})")
+        for label, name, why in overall_failed:
+            print(f"  [{label}] {name} ({why})")
         return 1
     return 0
 
@@ -75,6 +75,14 @@ def write_defconfig(buildroot_dir: str) -> None:
     configs_dir = os.path.join(buildroot_dir, "configs")
     os.makedirs(configs_dir, exist_ok=True)
     path = os.path.join(configs_dir, "riscv_emu_defconfig")
+    # Leave an identical file untouched so its mtime doesn't look like a change.
+    try:
+        with open(path) as f:
+            if f.read() == DEFCONFIG:
+                print("[Linux] Up to date", path)
+                return
+    except FileNotFoundError:
+        pass
     with open(path, "w") as f:
         f.write(DEFCONFIG)
     print("[Linux] Wrote", path)
@@ -424,11 +424,7 @@ def load_spike_trace(test_name):
 def run_rvsim_trace(elf_path, cfg):
     """Run rvsim, return the commit trace as list of (pc, inst)."""
     config_dict = _config_to_dict(cfg)
-
-    with open(elf_path, "rb") as f:
-        elf_data = f.read()
-
-    cpu = Cpu(config_dict, elf_data=elf_data)
+    cpu = Cpu(config_dict, elf_path=elf_path)
 
     # Use a temp file for the commit log
     fd, log_path = tempfile.mkstemp(suffix=".log", prefix="rvsim_")
@@ -0,0 +1,82 @@
+"""Shared fixtures for the Python binding tests.
+
+Programs are hand-assembled into minimal ELF images so the tests need neither
+a RISC-V toolchain nor the prebuilt binaries under ``software/bin``.
+"""
+
+import struct
+
+import pytest
+
+try:
+    import rvsim._core  # noqa: F401
+except ImportError:
+    # The native extension has not been built (``maturin develop``).
+    collect_ignore_glob = ["test_*.py"]
+
+RAM_BASE = 0x8000_0000
+
+# li a0, 7; li a7, 93; ecall  — exit(7) through the direct-mode syscall path.
+EXIT_7 = struct.pack("<3I", 0x00700513, 0x05D00893, 0x00000073)
+
+# j .  — spins forever, so runs end on the cycle limit.
+SPIN = struct.pack("<I", 0x0000006F)
+
+
+def make_elf(code: bytes, base: int = RAM_BASE) -> bytes:
+    """Wrap *code* in a static RV64 ELF with one PT_LOAD segment at *base*."""
+    offset = 0x1000
+    header = struct.pack(
+        "<16sHHIQQQIHHHHHH",
+        b"\x7fELF\x02\x01\x01" + bytes(9),  # 64-bit, little-endian, v1
+        2,  # ET_EXEC
+        243,  # EM_RISCV
+        1,
+        base,  # e_entry
+        64,  # e_phoff
+        0,  # e_shoff
+        0,
+        64,
+        56,
+        1,  # e_phnum
+        64,
+        0,
+        0,
+    )
+    phdr = struct.pack(
+        "<IIQQQQQQ",
+        1,  # PT_LOAD
+        7,  # RWX
+        offset,
+        base,
+        base,
+        len(code),
+        len(code),
+        0x1000,
+    )
+    image = header + phdr
+    return image + bytes(offset - len(image)) + code
+
+
+@pytest.fixture
+def config():
+    from rvsim import Config
+
+    return Config(uart_quiet=True).to_dict()
+
+
+@pytest.fixture
+def exit_elf():
+    return make_elf(EXIT_7)
+
+
+@pytest.fixture
+def spin_elf():
+    return make_elf(SPIN)
+
+
+@pytest.fixture
+def cpu(config, exit_elf):
+    from rvsim import Cpu
+
+    return Cpu(config, elf_data=exit_elf)
@@ -0,0 +1,77 @@
+"""Config.replace and Config.to_dict."""
+
+import pytest
+
+from rvsim import Backend, BranchPredictor, Config, Fu, MemoryController
+from rvsim.config import _bp_sub_dict
+
+
+def test_replace_overrides_only_given_fields():
+    base = Config(width=2, uart_quiet=True)
+    wide = base.replace(width=8)
+    assert wide is not base
+    assert (base.width, wide.width) == (2, 8)
+    assert wide.replace(width=2).to_dict() == base.to_dict()
+
+
+def test_replace_without_fields_is_an_equal_copy():
+    base = Config(width=2)
+    copy = base.replace()
+    assert copy is not base
+    assert copy.to_dict() == base.to_dict()
+
+
+def test_replace_normalizes_overrides():
+    cfg = Config().replace(ram_size="1MB", backend=None, memory_controller=None)
+    assert cfg.ram_size == Config(ram_size="1MB").ram_size == 1 << 20
+    assert type(cfg.backend) is type(Backend.InOrder())
+    assert type(cfg.memory_controller) is type(MemoryController.Simple())
+
+
+def test_replace_rejects_unknown_fields():
+    with pytest.raises(TypeError, match="no_such_field"):
+        Config().replace(no_such_field=1)
+
+
+@pytest.mark.parametrize(
+    ("section", "key"),
+    [("sc", "num_tables"), ("ittage", "num_banks"), ("store_set", "ssit_size")],
+)
+def test_shared_default_sub_configs_are_read_only(section, key):
+    before = Config().to_dict()["pipeline"][section][key]
+    with pytest.raises(TypeError):
+        Config().to_dict()["pipeline"][section][key] = 99
+    assert Config().to_dict()["pipeline"][section][key] == before
+
+
+def test_inorder_fu_config_is_read_only():
+    cfg = Config(backend=Backend.InOrder())
+    before = cfg.to_dict()["pipeline"]["fu_config"]["num_int_alu"]
+    with pytest.raises(TypeError):
+        cfg.to_dict()["pipeline"]["fu_config"]["num_int_alu"] = 99
+    assert Config(backend=Backend.InOrder()).to_dict()["pipeline"]["fu_config"][
+        "num_int_alu"
+    ] == before
+
+
+class _MyTage(BranchPredictor.TAGE):
+    pass
+
+
+def test_predictor_subclass_keeps_its_parameters():
+    assert _bp_sub_dict(_MyTage(table_size=4096))["table_size"] == 4096
+
+
+def test_predictor_subclass_serializes_its_parameters():
+    pipeline = Config(branch_predictor=_MyTage(table_size=4096)).to_dict()["pipeline"]
+    assert pipeline["branch_predictor"] == "TAGE"
+    assert pipeline["tage"]["table_size"] == 4096
+
+
+def test_fu_subclass_is_accepted():
+    class FastAlu(Fu.IntAlu):
+        pass
+
+    fu = Fu([FastAlu(count=3, latency=1)])
+    cfg = Config(backend=Backend.OutOfOrder(fu_config=fu))
+    assert cfg.to_dict()["pipeline"]["fu_config"]["num_int_alu"] == 3
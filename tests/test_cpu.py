@@ -0,0 +1,52 @@
+"""Cpu construction and the stats accessors."""
+
+import json
+
+import pytest
+
+from rvsim import Cpu, Stats
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_elf_data_accepts_buffers(config, exit_elf, wrap):
+    cpu = Cpu(config, elf_data=wrap(exit_elf))
+    assert cpu.run(limit=100_000) == 7
+
+
+def test_elf_data_and_path_are_exclusive(config, exit_elf, tmp_path):
+    path = tmp_path / "exit.elf"
+    path.write_bytes(exit_elf)
+    with pytest.raises(ValueError):
+        Cpu(config, elf_data=exit_elf, elf_path=str(path))
+
+
+def test_stats_json_round_trips_to_stats(cpu):
+    cpu.run(limit=100_000)
+    assert json.loads(cpu.stats_json()) == json.loads(json.dumps(cpu.stats))
+    assert list(json.loads(cpu.stats_json())) == list(cpu.stats)
+
+
+def test_stat_matches_stats_dict(cpu):
+    cpu.run(limit=100_000)
+    stats = cpu.stats
+    for name, value in stats.items():
+        assert cpu.stat(name) == value, name
+
+
+def test_stat_unknown_key(cpu):
+    with pytest.raises(KeyError):
+        cpu.stat("no_such_stat")
+
+
+def test_update_stats_fills_existing_dict(cpu):
+    cpu.run(limit=100_000)
+    target = Stats(label="exit7", cycles=-1)
+    cpu.update_stats(target)
+    assert target.pop("label") == "exit7"
+    assert target == cpu.stats
+
+
+def test_stats_json_layout(cpu):
+    text = cpu.stats_json()
+    assert text.startswith('{\n  "cycles": ')
+    assert text.endswith("\n}")
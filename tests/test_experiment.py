@@ -0,0 +1,61 @@
+"""Environment.freeze and Environment.run_all."""
+
+import dataclasses
+
+import pytest
+
+from rvsim import Config, Environment
+
+from conftest import EXIT_7, SPIN, make_elf
+
+
+@pytest.fixture
+def exit_path(tmp_path):
+    path = tmp_path / "exit.elf"
+    path.write_bytes(make_elf(EXIT_7))
+    return str(path)
+
+
+@pytest.fixture
+def spin_path(tmp_path):
+    path = tmp_path / "spin.elf"
+    path.write_bytes(make_elf(SPIN))
+    return str(path)
+
+
+def test_freeze_ignores_later_config_edits(exit_path):
+    cfg = Config(width=2, uart_quiet=True)
+    env = Environment(binary=exit_path, config=cfg)
+    assert env.freeze() is env
+    before = env.get_config()
+    cfg.width = 8
+    assert env.get_config() == before
+    assert Environment(binary=exit_path, config=cfg).get_config() != before
+    assert env.run(limit=100_000).exit_code == 7
+
+
+def test_environment_is_frozen_and_hashable(exit_path):
+    cfg = Config(uart_quiet=True)
+    env = Environment(binary=exit_path, config=cfg)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        env.binary = "other.elf"
+    assert hash(env) == hash(Environment(binary=exit_path, config=cfg))
+    assert dataclasses.replace(env, disk="disk.img").disk == "disk.img"
+
+
+def test_run_all_keeps_input_order(exit_path, spin_path, tmp_path):
+    cfg = Config(uart_quiet=True)
+    missing = str(tmp_path / "missing.elf")
+    envs = [Environment(binary=p, config=cfg) for p in (spin_path, exit_path, missing)]
+    spin, done, failed = Environment.run_all(envs, limit=10_000, max_workers=2)
+    assert [r.binary for r in (spin, done, failed)] == [spin_path, exit_path, missing]
+    # Hitting the cycle limit and failing to start both report -1; only the
+    # failure carries an error message.
+    assert (spin.exit_code, "error" in spin.stats) == (-1, False)
+    assert spin.stats["cycles"] >= 10_000
+    assert done.ok and done.stats["instructions_retired"] >= 3
+    assert failed.exit_code == -1 and failed.stats["error"]
+
+
+def test_run_all_empty():
+    assert Environment.run_all([]) == []
@@ -0,0 +1,69 @@
+"""Buffer disassembly with disassemble_bytes."""
+
+import struct
+
+import pytest
+
+from rvsim.isa import disassemble, disassemble_bytes
+
+C_NOP = 0x0001  # c.nop
+C_LI = 0x4505  # c.li a0, 1
+ADDI = 0x00150513  # addi a0, a0, 1
+
+BASE = 0x8000_0000
+
+
+def encode(insts):
+    """Pack raw instructions, two bytes for compressed and four otherwise."""
+    return b"".join(
+        struct.pack("<I" if raw & 0x3 == 0x3 else "<H", raw) for raw in insts
+    )
+
+
+def expected(insts, base=BASE):
+    out, pc = [], base
+    for raw in insts:
+        out.append((pc, raw, disassemble(raw)))
+        pc += 4 if raw & 0x3 == 0x3 else 2
+    return out
+
+
+@pytest.mark.parametrize(
+    "insts",
+    [
+        [ADDI, ADDI],
+        [C_LI, ADDI, C_NOP, ADDI],
+        # Runs of compressed instructions, ending before, inside and after the
+        # four-halfword window the decoder classifies at once.
+        [C_NOP, C_NOP, ADDI],
+        [C_NOP, C_NOP, C_NOP, ADDI],
+        [C_NOP] * 5 + [ADDI, C_LI],
+    ],
+)
+def test_mixed_streams(insts):
+    assert disassemble_bytes(encode(insts), BASE) == expected(insts)
+
+
+@pytest.mark.parametrize("tail", [b"\x01", b"\x13\x05"])
+def test_truncated_tail_is_dropped(tail):
+    insts = [C_NOP, ADDI]
+    assert disassemble_bytes(encode(insts) + tail, BASE) == expected(insts)
+
+
+@pytest.mark.parametrize("limit", [0, 1, 3, 6, 100])
+def test_limit(limit):
+    insts = [C_NOP] * 5 + [ADDI]
+    got = disassemble_bytes(encode(insts), BASE, limit)
+    assert got == expected(insts)[:limit]
+
+
+def test_offset_keeps_absolute_pcs():
+    insts = [C_LI, ADDI, C_NOP, ADDI]
+    got = disassemble_bytes(encode(insts), BASE, offset=2)
+    assert got == expected(insts)[1:]
+    assert disassemble_bytes(encode(insts), BASE, 1, 6) == expected(insts)[2:3]
+
+
+def test_offset_past_end():
+    assert disassemble_bytes(encode([ADDI]), BASE, offset=64) == []
+    assert disassemble_bytes(b"", BASE) == []
@@ -0,0 +1,24 @@
+"""Aggregation helpers behind the Stats comparison tables."""
+
+import warnings
+
+import pytest
+
+from rvsim.stats import _geometric_mean
+
+
+def test_geometric_mean():
+    assert _geometric_mean([2.0, 8.0]) == pytest.approx(4.0)
+    assert _geometric_mean([1, 4, 16]) == pytest.approx(4.0)
+
+
+@pytest.mark.parametrize("values", [[2.0, 0.0, 8.0], [2.0, -3.5, 8.0], [0, 2, -1.0, 8]])
+def test_geometric_mean_skips_non_positive(values):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert _geometric_mean(values) == pytest.approx(4.0)
+
+
+def test_geometric_mean_without_positive_values():
+    assert _geometric_mean([]) == 0.0
+    assert _geometric_mean([0.0, -1.0]) == 0.0
@@ -0,0 +1,53 @@
+"""Native batch runner and the threaded Sweep mode built on it."""
+
+from rvsim import Config, Sweep
+from rvsim._core import run_batch
+
+from conftest import EXIT_7, make_elf
+
+
+def test_run_batch_runs_jobs_in_order(config, exit_elf, spin_elf):
+    out = run_batch([(config, exit_elf, None), (config, spin_elf, None)], limit=10_000)
+    (code0, stats0, wall0, err0), (code1, stats1, _, err1) = out
+    assert (code0, err0) == (7, None)
+    assert stats0["instructions_retired"] >= 3
+    assert wall0 >= 0.0
+    # The spinning job stops at the cycle limit with no exit code.
+    assert (code1, err1) == (None, None)
+    assert stats1["cycles"] >= 10_000
+
+
+def test_run_batch_shared_and_distinct_objects_agree(config, exit_elf):
+    # Shared objects are parsed once; equal but distinct ones separately.
+    shared = [(config, exit_elf, None)] * 3
+    distinct = [(dict(config), make_elf(EXIT_7), None) for _ in range(3)]
+    results = run_batch(shared + distinct, threads=2)
+    assert [code for code, *_ in results] == [7] * 6
+    cycles = {stats["cycles"] for _, stats, _, _ in results}
+    assert len(cycles) == 1
+
+
+def test_run_batch_reports_bad_elf_as_error(config, exit_elf):
+    (ok, bad) = run_batch([(config, exit_elf, None), (config, b"not an elf", None)])
+    assert ok[0] == 7 and ok[3] is None
+    code, stats, wall, err = bad
+    assert (code, stats, wall) == (None, None, 0.0)
+    assert "ELF" in err
+
+
+def test_run_batch_empty():
+    assert run_batch([]) == []
+
+
+def test_threaded_sweep_isolates_missing_binary(tmp_path, exit_elf):
+    good = tmp_path / "exit.elf"
+    good.write_bytes(exit_elf)
+    missing = tmp_path / "missing.elf"
+    results = Sweep(
+        binaries=[str(good), str(missing)],
+        configs={"base": Config(uart_quiet=True)},
+    ).run(threads=True)
+    assert results["exit.elf"]["base"].exit_code == 7
+    failed = results["missing.elf"]["base"]
+    assert failed.exit_code == -1
+    assert "missing.elf" in failed.stats["error"]
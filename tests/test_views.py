@@ -0,0 +1,45 @@
+"""Register and memory views on a live Cpu."""
+
+import struct
+
+import pytest
+
+from conftest import EXIT_7, RAM_BASE
+
+
+def test_read_range_matches_single_reads(cpu):
+    words = cpu.mem32.read_range(RAM_BASE, 3)
+    assert words == [cpu.mem32[RAM_BASE + 4 * i] for i in range(3)]
+    assert words == list(struct.unpack("<3I", EXIT_7))
+
+
+def test_read_range_mem64(cpu):
+    (lo,) = cpu.mem64.read_range(RAM_BASE, 1)
+    assert lo == struct.unpack("<Q", EXIT_7[:8])[0]
+
+
+def test_read_range_empty(cpu):
+    assert cpu.mem64.read_range(RAM_BASE, 0) == []
+
+
+def test_read_range_rejects_count_larger_than_ram(cpu):
+    with pytest.raises(ValueError, match="exceeds RAM size"):
+        cpu.mem64.read_range(RAM_BASE, 2**40)
+
+
+def test_read_range_rejects_address_overflow(cpu):
+    with pytest.raises(ValueError, match="overflows"):
+        cpu.mem64.read_range(2**64 - 8, 2)
+
+
+def test_snapshot_matches_indexing(cpu):
+    cpu.run(limit=100_000)
+    snap = cpu.regs.snapshot()
+    assert len(snap) == 32
+    assert snap == [cpu.regs[i] for i in range(32)]
+    assert (snap[0], snap[10], snap[17]) == (0, 7, 93)
+
+
+def test_snapshot_sees_writes(cpu):
+    cpu.regs[5] = 0xDEAD_BEEF
+    assert cpu.regs.snapshot()[5] == 0xDEAD_BEEF